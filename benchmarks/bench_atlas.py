@@ -0,0 +1,92 @@
+"""
+Icon atlas cold-start comparison
+
+Loads every icon the UI and tray use at startup (the same paths and sizes),
+each run in a fresh interpreter: once by decoding the PNGs and resampling
+with LANCZOS, once by slicing a memory-mapped atlas built into a temporary
+directory. Needs Pillow; reports why when it is missing.
+
+    python -m benchmarks.bench_atlas [--runs 10]
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from src.constants import (
+    ACTION_ICONS, APP_LOGO, ICON_BACK, ICON_CHECK, ICON_PLAY, ICON_REDO,
+    ICON_SETTINGS, ICON_STOP, ICON_STOPWATCH
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# (path, size) for every image a cold start loads
+STARTUP_ICONS = [
+    (ICON_SETTINGS, 20), (ICON_BACK, 20), (ICON_CHECK, 20),
+    (ICON_STOPWATCH, 24), (ICON_REDO, 24), (ICON_STOP, 24), (ICON_PLAY, 32),
+    (APP_LOGO, 64), (APP_LOGO, 80),
+] + [(path, 40) for path in ACTION_ICONS.values()]
+
+PNG_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from PIL import Image
+for path, size in json.loads(sys.argv[1]):
+    with Image.open(path) as img:
+        img.convert("RGBA").resize((size, size), Image.Resampling.LANCZOS)
+print((time.perf_counter() - started) * 1000)
+"""
+
+ATLAS_PROBE = """
+import json, sys, time
+from pathlib import Path
+started = time.perf_counter()
+from src.ui.atlas import IconAtlas
+atlas = IconAtlas(Path(sys.argv[2]), Path(sys.argv[3]))
+for path, size in json.loads(sys.argv[1]):
+    assert atlas.get(path, size) is not None, path
+print((time.perf_counter() - started) * 1000)
+"""
+
+
+def run_probe(code: str, *argv: str) -> float:
+    """Milliseconds reported by a probe in a fresh interpreter"""
+    result = subprocess.run([sys.executable, "-c", code, *argv], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout.strip())
+
+
+def main():
+    """Run the comparison"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    try:
+        from src.ui.atlas import build_atlas
+        import PIL  # noqa: F401
+    except ImportError as e:
+        print(f"Pillow unavailable: {e}")
+        sys.exit(0)
+
+    icons = json.dumps(STARTUP_ICONS)
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path, index_path = Path(tmp) / "icons.rgba", Path(tmp) / "icons.json"
+        summary = build_atlas(data_path=data_path, index_path=index_path)
+        png = sorted(run_probe(PNG_PROBE, icons) for _ in range(args.runs))
+        atlas = sorted(run_probe(ATLAS_PROBE, icons, str(data_path), str(index_path))
+                       for _ in range(args.runs))
+
+    print(f"{len(STARTUP_ICONS)} startup icons, median of {args.runs} cold runs "
+          f"(atlas: {summary['images']} images, {summary['bytes'] // 1024} KB)")
+    print(f"PNG decode + LANCZOS   {png[len(png) // 2]:7.2f} ms")
+    print(f"memory-mapped atlas    {atlas[len(atlas) // 2]:7.2f} ms")
+    ok = atlas[len(atlas) // 2] < png[len(png) // 2]
+    print("PASS" if ok else "FAIL: atlas was not faster")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Capability probe benchmark
+
+Probes the five actions against the stand-in logind bus from
+bench_dispatch, which answers CanPowerOff "yes", CanReboot "challenge",
+CanSuspend "na" and GetSession/GetUser with a session and user, and
+checks the verdicts: logind where it says yes, the spawned command where
+it asks for a password, and Sleep reported as unsupported, since the
+systemctl fallback asks logind too. The commands are `true` linked as
+systemctl and loginctl. With GetSession failing, Lock must fall back to
+loginctl rather than be hidden. Then compares:
+
+- a cold probe, written to the cache
+- loading the cache on a later start of the same boot
+- a new boot ID, which must probe again
+- the old keep-screen-on check (`which systemd-inhibit` on every inhibit)
+  against the probed path
+
+Finally builds TimerApp on the headless customtkinter stub and checks that
+the Sleep card says it is unavailable before anything is armed.
+
+    python -m benchmarks.bench_capabilities [--runs 50]
+"""
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_dispatch import StandInBus, TRUE
+from src.utils.capabilities import load_capabilities
+from src.utils.system_actions import (
+    LogindBackend, ScreenInhibitor, SpawnBackend, SystemActionExecutor
+)
+
+STUBS = Path(__file__).resolve().parent / "stubs"
+
+
+def fake_commands(directory: Path) -> dict:
+    """Every action's argv, with systemctl and loginctl linked to true"""
+    for name in ("systemctl", "loginctl"):
+        (directory / name).symlink_to(TRUE)
+    systemctl, loginctl = str(directory / "systemctl"), str(directory / "loginctl")
+    return {
+        "Shutdown": [systemctl, "poweroff"], "Restart": [systemctl, "reboot"],
+        "Sleep": [systemctl, "suspend"], "Lock": [loginctl, "lock-session"],
+        "Log Out": [loginctl, "terminate-user", "0"],
+    }
+
+
+def backends(bus: StandInBus, commands: dict) -> list:
+    """Stand-in logind, then the fake commands"""
+    return [LogindBackend(address=bus.address, session_id="c1"), SpawnBackend(commands)]
+
+
+def timed(fn, runs: int) -> float:
+    """Median wall time of fn in ms"""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def check_setup_screen(capabilities, tmp: str) -> bool:
+    """Sleep's card shows the reason once the probe result is adopted"""
+    sys.path.insert(0, str(STUBS))
+    try:
+        import src.app
+    except ImportError as e:
+        print(f"GUI check unavailable: {e}")
+        return True
+    src.app.CONFIG_LAYERS = ()
+    src.app.CONFIG_CACHE_FILE = Path(tmp) / "config.cache"
+    src.app.PREFERENCES_FILE = Path(tmp) / "preferences.json"
+    src.app.JOURNAL_FILE = Path(tmp) / "journal.jsonl"
+    app = src.app.TimerApp()
+    app._capabilities_ready(capabilities)
+    texts = {name: card.desc_label.cget("text")
+             for name, card in app.setup_screen.action_cards.items()}
+    app.timer.close()
+    app.preferences.close()
+    app.destroy()
+    print(f"Sleep card: {texts.get('Sleep')!r}")
+    return (texts.get("Sleep", "").startswith("Unavailable:")
+            and not any(t.startswith("Unavailable:") for a, t in texts.items() if a != "Sleep"))
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bus = StandInBus(Path(tmp) / "bus")
+        bus.replies = {
+            "CanPowerOff": ("s", ["yes"]), "CanReboot": ("s", ["challenge"]),
+            "CanSuspend": ("s", ["na"]), "GetSession": ("o", ["/org/freedesktop/login1/session/c1"]),
+        }
+        cache = Path(tmp) / "capabilities.json"
+        commands = fake_commands(Path(tmp))
+
+        def cold():
+            cache.unlink(missing_ok=True)
+            return load_capabilities(cache, "boot-1", backends=backends(bus, commands))
+
+        capabilities = cold()
+        cold_ms = timed(cold, args.runs)
+        warm = load_capabilities(cache, "boot-1", backends=backends(bus, commands))
+        warm_ms = timed(lambda: load_capabilities(cache, "boot-1",
+                                                  backends=backends(bus, commands)), args.runs)
+        new_boot = load_capabilities(cache, "boot-2", backends=backends(bus, commands))
+
+        print(f"chosen: {capabilities.backends}")
+        print(f"unsupported: {capabilities.unsupported}")
+        expected = {"Shutdown": "logind", "Restart": "posix_spawn",
+                    "Lock": "logind", "Log Out": "logind"}
+        ok = capabilities.backends == expected and list(capabilities.unsupported) == ["Sleep"]
+        ok = ok and warm.cached and not new_boot.cached and warm.backends == expected
+        print(f"cold probe          {cold_ms:8.3f} ms")
+        print(f"cached, same boot   {warm_ms:8.3f} ms   (cached: {warm.cached})")
+        print(f"new boot ID         probed again: {not new_boot.cached}")
+
+        # No login session: Lock falls back to loginctl instead of being hidden
+        bus.failing.add("GetSession")
+        sessionless = load_capabilities(cache, "boot-3", backends=backends(bus, commands))
+        bus.failing.clear()
+        print(f"GetSession failing  Lock -> {sessionless.backends.get('Lock')}")
+        ok = ok and sessionless.backends.get("Lock") == "posix_spawn"
+
+        # The executor goes straight to the chosen backend
+        bus.calls.clear()
+        executor = SystemActionExecutor(backends(bus, commands), capabilities.backends)
+        used = executor.run("Restart")
+        members = [member for member, _, _ in bus.calls]
+        print(f"Restart ran with {used}, logind calls: {members or 'none'}")
+        ok = ok and used == "posix_spawn" and not members
+        executor.close()
+
+        # Keep-screen-on lookup
+        inhibitor = ScreenInhibitor(warm.inhibitors)
+        resolved_ms = timed(lambda: inhibitor.find("systemd-inhibit"), args.runs)
+        if shutil.which("which"):
+            which_ms = timed(lambda: subprocess.run(["which", "systemd-inhibit"],
+                                                    capture_output=True, timeout=2), args.runs)
+            print(f"inhibitor lookup    which {which_ms:.3f} ms, probed {resolved_ms:.4f} ms")
+            ok = ok and resolved_ms < which_ms
+        else:
+            print(f"inhibitor lookup    probed {resolved_ms:.4f} ms (no `which` to compare)")
+
+        ok = ok and warm_ms < cold_ms
+        ok = check_setup_screen(capabilities, tmp) and ok
+        bus.close()
+
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
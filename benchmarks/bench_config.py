@@ -0,0 +1,76 @@
+"""
+Config lookup microbenchmark
+
+Times the reads that sit on click and scroll paths, three ways: the old
+ConfigManager.get() that split the dotted key and walked the dicts on every
+call, get() on the precomputed dotted-key table, and attribute access on
+the validated snapshot (config.snapshot.timer.min_duration). Also reports
+what one load costs now that it validates and flattens the file.
+
+    python -m benchmarks.bench_config [--calls 1000000]
+"""
+import argparse
+import sys
+import time
+from typing import Any
+
+from src.config import ConfigManager
+from src.constants import CONFIG_FILE
+
+
+def walk(config: dict, key: str, default: Any = None) -> Any:
+    """The previous get(): split and walk on every call"""
+    value = config
+    for k in key.split("."):
+        if isinstance(value, dict):
+            value = value.get(k)
+            if value is None:
+                return default
+        else:
+            return default
+    return value
+
+
+def per_call_ns(fn, calls: int) -> float:
+    """Average nanoseconds per call of fn"""
+    started = time.perf_counter_ns()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter_ns() - started) / calls
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    manager = ConfigManager(CONFIG_FILE)
+    raw, snapshot = manager.config, manager.snapshot
+    cases = {
+        "walk timer.min_duration": lambda: walk(raw, "timer.min_duration", 60),
+        "old get_timer_config()": lambda: raw.get("timer", {}).get("min_duration", 60),
+        "get timer.min_duration": lambda: manager.get("timer.min_duration", 60),
+        "snapshot attribute": lambda: manager.snapshot.timer.min_duration,
+        "walk theme.primary_color": lambda: walk(raw, "theme.primary_color"),
+        "snapshot theme attribute": lambda: snapshot.theme.primary_color,
+    }
+    results = {}
+    for name, fn in cases.items():
+        results[name] = per_call_ns(fn, args.calls)
+        print(f"{name:<28} {results[name]:8.1f} ns/call")
+
+    started = time.perf_counter()
+    for _ in range(200):
+        manager.load()
+    print(f"{'load + validate':<28} {(time.perf_counter() - started) / 200 * 1e6:8.1f} us")
+
+    ok = (manager.get("timer.min_duration") == walk(raw, "timer.min_duration")
+          and results["snapshot attribute"] < results["walk timer.min_duration"]
+          and results["get timer.min_duration"] < results["walk timer.min_duration"])
+    print("PASS" if ok else "FAIL: snapshot lookups are not faster than walking the dicts")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
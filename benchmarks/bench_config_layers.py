@@ -0,0 +1,99 @@
+"""
+Layered config load benchmark
+
+Builds a bundled config.json, a system and a user override and two
+SHUTEYE_ environment variables in a temporary directory, then times
+ConfigManager.read() cold (read, merge and validate the JSON files) and
+warm (served from the marshal cache keyed on the files' mtimes and
+sizes). Checks that every layer took effect in the right order, that a
+warm load matches a cold one, and that touching an override invalidates
+the cache.
+
+    python -m benchmarks.bench_config_layers [--loads 500]
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.config import ConfigManager
+from src.constants import CONFIG_FILE
+
+SYSTEM = {"timer": {"default_duration": 1800, "max_duration": 43200}, "tray": {"update_interval": 60}}
+USER = {"timer": {"default_duration": 2700}, "theme": {"primary_color": "#e5484d"}}
+ENVIRON = {"SHUTEYE_TIMER__MIN_DURATION": "120", "SHUTEYE_WINDOW__RESIZABLE": "true"}
+
+
+def per_load_us(manager: ConfigManager, loads: int, cold: bool) -> float:
+    """Average microseconds per read(), cache removed first when cold"""
+    total = 0.0
+    for _ in range(loads):
+        if cold:
+            manager.cache_path.unlink(missing_ok=True)
+        started = time.perf_counter()
+        manager.read()
+        total += time.perf_counter() - started
+        if manager.cache_hit == cold:
+            raise RuntimeError("cache was hit on a cold load" if cold else "warm load missed the cache")
+    return total / loads * 1e6
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--loads", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        base = tmp / "config.json"
+        shutil.copy(CONFIG_FILE, base)
+        system, user = tmp / "system.json", tmp / "user.json"
+        system.write_text(json.dumps(SYSTEM))
+        user.write_text(json.dumps(USER))
+        manager = ConfigManager(base, [system, user, tmp / "missing.json"],
+                                environ=ENVIRON, cache_path=tmp / "config.cache")
+
+        timer = manager.snapshot.timer
+        ok = (timer.default_duration == 2700 and timer.max_duration == 43200
+              and timer.min_duration == 120 and manager.snapshot.window.resizable is True
+              and manager.snapshot.theme.primary_color == "#e5484d"
+              and manager.get("tray.update_interval") == 60
+              and manager.get("theme.bg_dark") == json.loads(base.read_text())["theme"]["bg_dark"])
+        print(f"layers merged in order: {ok}")
+
+        try:
+            cold = per_load_us(manager, args.loads, cold=True)
+            warm = per_load_us(manager, args.loads, cold=False)
+        except RuntimeError as e:
+            print(f"FAIL: {e}")
+            sys.exit(1)
+        print(f"cold load (parse, merge, validate)  {cold:8.1f} us")
+        print(f"warm load (marshal cache)           {warm:8.1f} us   {cold / warm:.1f}x faster")
+        print(f"cache size                          {manager.cache_path.stat().st_size:8d} bytes")
+
+        warm_config, warm_snapshot = manager.read()
+        manager.cache_path.unlink()
+        cold_config, cold_snapshot = manager.read()
+        same = (warm_config == cold_config and warm_snapshot.to_state() == cold_snapshot.to_state()
+                and not warm_snapshot.changed(cold_snapshot))
+        print(f"warm load identical to cold: {same}")
+
+        # A user edit with the same size must still miss the cache
+        stat = user.stat()
+        os.utime(user, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        manager.read()
+        invalidated = not manager.cache_hit
+        print(f"override touched -> cache missed: {invalidated}")
+
+    ok = ok and same and invalidated and warm < cold
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Config hot-reload benchmark
+
+Builds TimerApp against the headless customtkinter stub in
+benchmarks/stubs, arms a one-hour countdown, then edits a copy of
+config.json the way editors do (rename over the file, and rewrite in
+place) while a ConfigWatcher feeds app._reload_config, as it does after
+startup. Reported per edit: the latency from detection and from the write
+until the widgets were updated, the parts that were rebuilt and how many
+widgets were created, against rebuilding every screen. Runs with inotify
+and with the mtime-poll fallback.
+
+    python -m benchmarks.bench_config_reload [--poll-interval 0.25]
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+STUBS = Path(__file__).resolve().parent / "stubs"
+sys.path.insert(0, str(STUBS))
+
+import customtkinter  # noqa: E402 - the stub, found through STUBS
+
+from src.config_watch import ConfigWatcher  # noqa: E402
+from src.constants import CONFIG_FILE  # noqa: E402
+
+created = [0]
+_widget_init = customtkinter._Widget.__init__
+
+
+def _counting_init(self, *args, **kwargs):
+    created[0] += 1
+    _widget_init(self, *args, **kwargs)
+
+
+customtkinter._Widget.__init__ = _counting_init
+
+
+def edit_quick_times(config: dict, step: int) -> None:
+    config["quick_times"].append({"label": f"+{step}h", "seconds": step * 3600})
+
+
+def edit_theme(config: dict, step: int) -> None:
+    theme = config["theme"]
+    theme["primary_color"] = "#e5484d" if theme["primary_color"] == "#1973f0" else "#1973f0"
+
+
+def edit_timer(config: dict, step: int) -> None:
+    config["timer"]["step_size"] = 60 + step
+
+
+EDITS = {"quick_times": edit_quick_times, "timer": edit_timer, "theme": edit_theme}
+
+
+def write(path: Path, config: dict, replace: bool) -> None:
+    """Save like an editor: write a temp file and rename it, or rewrite in place"""
+    text = json.dumps(config, indent=2)
+    if replace:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(text)
+        os.replace(tmp, path)
+    else:
+        path.write_text(text)
+
+
+def wait_for_reload(app, previous, timeout: float = 5.0):
+    """Pump the stub loop until a new reload has been applied"""
+    deadline = time.monotonic() + timeout
+    while app.last_reload is previous and time.monotonic() < deadline:
+        app.update()
+        time.sleep(0.001)
+    return app.last_reload if app.last_reload is not previous else None
+
+
+def run(app, path: Path, config: dict, event_driven: bool, poll_interval: float) -> list:
+    """Apply every edit once per save style; one row per edit"""
+    watcher = ConfigWatcher([path], app._reload_config, poll_interval=poll_interval)
+    if not event_driven:
+        watcher._open_inotify = lambda: False
+    watcher.start()
+    time.sleep(0.05)
+    rows = []
+    step = 0
+    for replace in (True, False):
+        for name, edit in EDITS.items():
+            step += 1
+            edit(config, step)
+            before = created[0]
+            previous = app.last_reload
+            written = time.perf_counter()
+            write(path, config, replace)
+            reload = wait_for_reload(app, previous)
+            since_write = (time.perf_counter() - written) * 1000
+            rows.append((name, "rename" if replace else "in place", reload,
+                         created[0] - before, since_write))
+    watcher.close()
+    return rows
+
+
+def full_rebuild_widgets(app) -> int:
+    """Widgets created when every screen is rebuilt and shown"""
+    before = created[0]
+    for screen in (app.setup_screen, app.settings_screen, app.active_screen):
+        screen.rebuild()
+        app._switch_screen(screen)
+    return created[0] - before
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--poll-interval", type=float, default=0.25)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["XDG_RUNTIME_DIR"] = tmp
+        path = Path(tmp) / "config.json"
+        shutil.copy(CONFIG_FILE, path)
+        try:
+            import src.app
+        except ImportError as e:
+            print(f"GUI dependencies unavailable: {e}")
+            sys.exit(0)
+        src.app.CONFIG_FILE = path
+        src.app.CONFIG_LAYERS = ()
+        src.app.CONFIG_CACHE_FILE = Path(tmp) / "config.cache"
+        src.app.PREFERENCES_FILE = Path(tmp) / "preferences.json"
+        src.app.JOURNAL_FILE = Path(tmp) / "journal.jsonl"
+
+        app = src.app.TimerApp()
+        app.settings_screen.show()
+        app.arm(3600)
+        app.update()
+        config = json.loads(path.read_text())
+
+        ok = True
+        quick_widgets = 0
+        for label, event_driven in (("inotify", True), ("poll", False)):
+            print(f"{label} ({'event driven' if event_driven else f'every {args.poll_interval} s'})")
+            print(f"  {'edit':<12} {'save':<9} {'detected':>11} {'written':>11} "
+                  f"{'widgets':>8}  rebuilt")
+            for name, mode, reload, widgets, since_write in run(
+                    app, path, config, event_driven, args.poll_interval):
+                if reload is None:
+                    print(f"  {name:<12} {mode:<9} not reloaded")
+                    ok = False
+                    continue
+                rebuilt = ", ".join(reload["rebuilt"]) or "-"
+                print(f"  {name:<12} {mode:<9} {reload['latency_ms']:8.1f} ms "
+                      f"{since_write:8.1f} ms {widgets:8d}  {rebuilt}")
+                if name == "quick_times":
+                    # Nothing at all once a theme change has left the hidden
+                    # setup screen to be built on its next show
+                    ok = ok and set(reload["rebuilt"]) <= {"SetupScreen.quick_times"}
+                    quick_widgets = max(quick_widgets, widgets)
+                if event_driven:
+                    ok = ok and since_write < 200
+        full = full_rebuild_widgets(app)
+        print(f"full rebuild of every screen: {full} widgets")
+        ok = ok and quick_widgets < full
+
+        remaining = app.remaining_seconds
+        ok = ok and app.is_running and 3400 < remaining <= 3600
+        print(f"countdown kept running: {app.is_running}, {remaining} s left")
+        app.timer.close()
+        app.preferences.close()
+        app.destroy()
+
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Control socket load benchmark
+
+Drives a ControlServer at a fixed request rate (default 1000 req/s) over
+one persistent, pipelined connection. The owner thread is a plain queue
+loop standing in for Tk's mainloop, wrapped around a real TimerController,
+so the numbers cover JSON parsing, the socket loop, the coalesced hand-off and the
+status response. Reports round-trip latency percentiles and how many owner
+thread wakeups the dispatcher needed, then fires a burst of clients at once
+to show the coalescing: many requests, few wakeups.
+
+    python -m benchmarks.bench_control_load [--rate 1000] [--seconds 5]
+"""
+import argparse
+import queue
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.config import ConfigManager
+from src.constants import CONFIG_FILE
+from src.control.protocol import handle_request
+from src.control.server import ControlServer, CoalescedDispatcher
+from src.control.wire import encode, decode
+from src.timer import TimerController
+
+
+class OwnerLoop:
+    """Single consumer thread, like Tk's mainloop servicing after(0)"""
+
+    def __init__(self, journal_path: Path):
+        self.tasks: "queue.SimpleQueue" = queue.SimpleQueue()
+        self.posts = 0
+        self.timer = TimerController(ConfigManager(CONFIG_FILE), post=self.post,
+                                     journal_path=journal_path)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def post(self, fn, *args) -> None:
+        self.posts += 1
+        self.tasks.put((fn, args))
+
+    def _run(self) -> None:
+        while True:
+            fn, args = self.tasks.get()
+            if fn is None:
+                return
+            fn(*args)
+
+    # Request targets used by handle_request
+    def add_time_active(self, seconds: int) -> None:
+        self.timer.adjust(seconds)
+
+    def close(self) -> None:
+        self.tasks.put((None, ()))
+        self.thread.join()
+        self.timer.close()
+
+
+def run_load(path: Path, rate: int, seconds: float) -> list:
+    """Send requests at rate/s, return per-request latency in seconds"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(str(path))
+    total = int(rate * seconds)
+    sent_at = [0.0] * total
+    latency = [0.0] * total
+
+    def receive():
+        reader = sock.makefile("rb")
+        for _ in range(total):
+            response = decode(reader.readline())
+            latency[response["id"]] = time.perf_counter() - sent_at[response["id"]]
+
+    receiver = threading.Thread(target=receive)
+    receiver.start()
+
+    interval = 1.0 / rate
+    start = time.perf_counter()
+    for i in range(total):
+        target = start + i * interval
+        delay = target - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        request = {"cmd": "add", "seconds": 0} if i % 10 == 0 else {"cmd": "status"}
+        request["id"] = i
+        sent_at[i] = time.perf_counter()
+        sock.sendall(encode(request))
+    receiver.join()
+    sock.close()
+    return latency
+
+
+def run_burst(path: Path, clients: int, per_client: int) -> None:
+    """Many connections each pipelining a batch at the same moment"""
+    barrier = threading.Barrier(clients)
+    batch = b"".join(encode({"cmd": "status", "id": i}) for i in range(per_client))
+
+    def client():
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(str(path))
+        reader = sock.makefile("rb")
+        barrier.wait()
+        sock.sendall(batch)
+        for _ in range(per_client):
+            reader.readline()
+        sock.close()
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rate", type=int, default=1000, help="Requests per second")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--burst-clients", type=int, default=20)
+    parser.add_argument("--burst-size", type=int, default=50, help="Requests per burst client")
+    parser.add_argument("--p99-ms", type=float, default=10.0, help="Latency budget")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        owner = OwnerLoop(Path(tmp) / "journal.jsonl")
+        server = ControlServer(lambda request: handle_request(owner, request),
+                               CoalescedDispatcher(owner.post), path=Path(tmp) / "bench.sock")
+        if not server.start():
+            print("FAIL: could not start control server")
+            sys.exit(1)
+
+        started = time.perf_counter()
+        latency = run_load(server.path, args.rate, args.seconds)
+        elapsed = time.perf_counter() - started
+        steady_posts = owner.posts
+
+        burst_started = time.perf_counter()
+        run_burst(server.path, args.burst_clients, args.burst_size)
+        burst_elapsed = time.perf_counter() - burst_started
+        burst_posts = owner.posts - steady_posts
+        server.close()
+        owner.close()
+
+    achieved = len(latency) / elapsed
+    p50, p99 = percentile(latency, 0.50) * 1000, percentile(latency, 0.99) * 1000
+    print(f"{len(latency)} requests in {elapsed:.2f} s ({achieved:.0f} req/s)")
+    print(f"latency  p50 {p50:.3f} ms   p99 {p99:.3f} ms   max {max(latency) * 1000:.3f} ms")
+    print(f"owner thread wakeups: {steady_posts} ({steady_posts / len(latency):.2f} per request)")
+    burst_total = args.burst_clients * args.burst_size
+    print(f"burst: {burst_total} requests from {args.burst_clients} clients in "
+          f"{burst_elapsed * 1000:.1f} ms, {burst_posts} owner wakeups")
+
+    ok = p99 <= args.p99_ms and achieved >= args.rate * 0.9
+    print("PASS" if ok else f"FAIL: p99 budget {args.p99_ms} ms at {args.rate} req/s")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+Action dispatch latency benchmark
+
+Fires timers from the real TimerScheduler and runs a harmless stand-in
+for the action on each backend, measuring from the timer's deadline:
+
+- os.system shell   the old path: a shell that runs /usr/bin/true
+- subprocess        CommandBackend running ["/usr/bin/true"]
+- posix_spawn       SpawnBackend running ["/usr/bin/true"]
+- logind (D-Bus)    LogindBackend calling PowerOff on a stand-in bus
+
+"done" is when the backend returned (command exited, or logind replied);
+for D-Bus, "received" is when the method call reached the bus. The
+stand-in bus speaks the D-Bus wire protocol on a Unix socket, answers
+Hello and the logind Manager methods, and can be told to fail a method,
+which must come back as an ActionError and fall through to the next backend.
+
+    python -m benchmarks.bench_dispatch [--fires 50]
+"""
+import argparse
+import os
+import shutil
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.timer.scheduler import TimerScheduler
+from src.utils.dbus import (
+    DESTINATION, ERROR, DBusError, ERROR_NAME, METHOD_CALL, METHOD_RETURN, MEMBER, REPLY_SERIAL,
+    SENDER, SIGNAL, PATH, INTERFACE, encode_message, recv_message
+)
+from src.utils.system_actions import (
+    ActionError, CommandBackend, LogindBackend, SpawnBackend, SystemActionExecutor
+)
+
+# An external binary on every path, so the shell cannot use its builtin
+TRUE = shutil.which("true") or "/bin/true"
+COMMANDS = {"Shutdown": [TRUE], "Lock": [TRUE]}
+
+
+class StandInBus:
+    """Just enough of a D-Bus daemon plus logind for LogindBackend
+
+    Records (member, args, monotonic arrival) for every logind call.
+    Members in `failing` get an AccessDenied error reply, members in
+    `replies` return {member: (signature, values)}, the rest return nothing.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.calls = []
+        self.failing = set()
+        self.replies = {}
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(str(path))
+        self._server.listen()
+        self._clients = 0
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    @property
+    def address(self) -> str:
+        return f"unix:path={self.path}"
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self._clients += 1
+            threading.Thread(target=self._serve, args=(conn, f":1.{self._clients}"),
+                             daemon=True).start()
+
+    def _serve(self, conn: socket.socket, name: str) -> None:
+        buffer = bytearray()
+        try:
+            # Authentication: NUL, AUTH EXTERNAL <hex uid>, then BEGIN
+            while b"BEGIN\r\n" not in buffer:
+                if b"AUTH" in buffer and b"\r\n" in buffer and b"OK" not in buffer:
+                    conn.sendall(b"OK 0123456789abcdef0123456789abcdef\r\n")
+                    buffer += b"OK"
+                chunk = conn.recv(4096)
+                if not chunk:
+                    return
+                buffer += chunk
+            del buffer[:buffer.index(b"BEGIN\r\n") + 7]
+
+            serial = 0
+            while True:
+                msg_type, call_serial, fields, args = recv_message(conn, buffer)
+                if msg_type != METHOD_CALL:
+                    continue
+                arrived = time.monotonic()
+                serial += 1
+                member = fields.get(MEMBER)
+                reply = {REPLY_SERIAL: call_serial, DESTINATION: name}
+                if member == "Hello":
+                    conn.sendall(encode_message(METHOD_RETURN, serial, {
+                        **reply, SENDER: "org.freedesktop.DBus"}, "s", [name]))
+                    serial += 1
+                    conn.sendall(encode_message(SIGNAL, serial, {
+                        PATH: "/org/freedesktop/DBus", INTERFACE: "org.freedesktop.DBus",
+                        MEMBER: "NameAcquired", DESTINATION: name,
+                        SENDER: "org.freedesktop.DBus"}, "s", [name]))
+                    continue
+                self.calls.append((member, args, arrived))
+                if member in self.failing:
+                    conn.sendall(encode_message(ERROR, serial, {
+                        **reply, ERROR_NAME: "org.freedesktop.DBus.Error.AccessDenied",
+                        SENDER: "org.freedesktop.login1"}, "s", ["Permission denied"]))
+                else:
+                    signature, values = self.replies.get(member, ("", ()))
+                    conn.sendall(encode_message(METHOD_RETURN, serial, {
+                        **reply, SENDER: "org.freedesktop.login1"}, signature, values))
+        except (OSError, DBusError):
+            pass  # client went away
+        finally:
+            conn.close()
+
+    def close(self) -> None:
+        self._server.close()
+
+
+class LegacyShell:
+    """The old os.system call, for comparison"""
+
+    name = "os.system shell"
+
+    def supports(self, action: str) -> bool:
+        return True
+
+    def run(self, action: str) -> None:
+        os.system(TRUE)
+
+
+def measure(backend, fires: int, bus: StandInBus = None) -> dict:
+    """Fire timers through the scheduler; latencies in ms from the deadline"""
+    done, received = [], []
+    finished = threading.Event()
+
+    def on_fire(timer) -> None:
+        backend.run(timer.action)
+        done.append((time.monotonic() - timer.deadline) * 1000)
+        if bus is not None:
+            received.append((bus.calls[-1][2] - timer.deadline) * 1000)
+        finished.set()
+
+    scheduler = TimerScheduler(on_fire=on_fire)
+    for _ in range(fires):
+        finished.clear()
+        scheduler.schedule("Shutdown", 0.01)
+        if not finished.wait(5):
+            raise RuntimeError(f"{backend.name} did not complete")
+    scheduler.close()
+    return {"done": done, "received": received}
+
+
+def percentile(values: list, q: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(len(values) * q))]
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fires", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bus = StandInBus(Path(tmp) / "bus")
+        logind = LogindBackend(address=bus.address, session_id="c1")
+        logind.connect()  # as after arming, so the firing costs one call
+
+        rows = {}
+        for backend in (LegacyShell(), CommandBackend(COMMANDS), SpawnBackend(COMMANDS), logind):
+            rows[backend.name] = measure(backend, args.fires,
+                                         bus if backend is logind else None)
+
+        print(f"{'backend':<18} {'done p50':>9} {'p99':>8} {'received p50':>13} {'p99':>8}   (ms)")
+        for name, row in rows.items():
+            line = (f"{name:<18} {statistics.median(row['done']):9.3f} "
+                    f"{percentile(row['done'], .99):8.3f}")
+            if row["received"]:
+                line += (f" {statistics.median(row['received']):13.3f} "
+                         f"{percentile(row['received'], .99):8.3f}")
+            print(line)
+
+        # Calls reach logind with the right method and arguments
+        calls = {}
+        for action in ("Shutdown", "Restart", "Sleep", "Lock", "Log Out"):
+            logind.run(action)
+            calls[action] = bus.calls[-1][:2]
+        expected = {
+            "Shutdown": ("PowerOff", [False]), "Restart": ("Reboot", [False]),
+            "Sleep": ("Suspend", [False]), "Lock": ("LockSession", ["c1"]),
+            "Log Out": ("TerminateUser", [os.getuid()]),
+        }
+        ok = calls == expected
+        print(f"logind methods and arguments: {'ok' if ok else calls}")
+
+        # A denied call falls through to the next backend
+        bus.failing.add("LockSession")
+        executor = SystemActionExecutor([logind, SpawnBackend(COMMANDS)])
+        used = executor.run("Lock")
+        print(f"LockSession denied -> ran with {used}")
+        ok = ok and used == "posix_spawn"
+        try:
+            SystemActionExecutor([logind, SpawnBackend({"Lock": ["false"]})]).run("Lock")
+            ok = False
+        except ActionError as e:
+            print(f"every backend failing -> {e}")
+
+        logind.close()
+        bus.close()
+
+    spawn = statistics.median(rows["posix_spawn"]["done"])
+    shell = statistics.median(rows["os.system shell"]["done"])
+    dbus = statistics.median(rows["logind"]["done"])
+    ok = ok and spawn < shell and dbus < spawn
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
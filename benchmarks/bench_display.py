@@ -0,0 +1,111 @@
+"""
+Active screen display update benchmark
+
+Replays a countdown one tick per second through the old update_display
+logic (rebuild the action text table, format the end time from
+datetime.now() and configure all six labels) and through ActiveViewModel,
+with labels that only count configure() calls. Reports configures per tick
+above and below one hour remaining (the duration label switches from HH:MM
+to MM:SS there, so it changes every second too) and the cost per tick.
+
+    python -m benchmarks.bench_display [--minutes 120]
+"""
+import argparse
+import sys
+import time
+
+from src.ui.view_models import ActiveViewModel, ACTION_TEXTS
+from src.utils.time_utils import format_time_simple, get_end_time, seconds_to_hms_strings
+
+FIELDS = ActiveViewModel.FIELDS
+
+
+class CountingLabel:
+    """Stands in for a CTkLabel; counts configure calls"""
+
+    def __init__(self):
+        self.text = None
+        self.calls = 0
+
+    def configure(self, text: str) -> None:
+        self.text = text
+        self.calls += 1
+
+
+def legacy_update(labels: dict, remaining: int, action: str) -> None:
+    """update_display as it was: recompute and configure everything"""
+    h, m, s = seconds_to_hms_strings(remaining)
+    labels["hours"].configure(text=h)
+    labels["minutes"].configure(text=m)
+    labels["seconds"].configure(text=s)
+    labels["duration"].configure(text=format_time_simple(remaining))
+    labels["end_time"].configure(text=get_end_time(remaining))
+    action_texts = {
+        "Shutdown": "SHUTTING DOWN",
+        "Restart": "RESTARTING",
+        "Sleep": "SLEEPING",
+        "Lock": "LOCKING",
+        "Log Out": "LOGGING OUT"
+    }
+    labels["action"].configure(text=action_texts.get(action, action))
+
+
+def replay(update, seconds: int) -> tuple:
+    """Count down from seconds; (configures per tick above 1 h, below 1 h, total s)"""
+    labels = {field: CountingLabel() for field in FIELDS}
+    counts = {True: [0, 0], False: [0, 0]}
+    started = time.perf_counter()
+    for remaining in range(seconds, 0, -1):
+        before = sum(label.calls for label in labels.values())
+        update(labels, remaining, "Shutdown")
+        bucket = counts[remaining >= 3600]
+        bucket[0] += sum(label.calls for label in labels.values()) - before
+        bucket[1] += 1
+    elapsed = time.perf_counter() - started
+    rate = lambda bucket: bucket[0] / bucket[1] if bucket[1] else 0.0
+    return rate(counts[True]), rate(counts[False]), elapsed
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--minutes", type=int, default=120)
+    args = parser.parse_args()
+    seconds = args.minutes * 60
+
+    # The model reads the wall clock once per tick; advance it with the replay
+    clock = [time.time()]
+    model = ActiveViewModel(wall_clock=lambda: clock[0])
+
+    def model_update(labels: dict, remaining: int, action: str) -> None:
+        clock[0] += 1
+        for field, text in model.update(remaining, action).items():
+            labels[field].configure(text=text)
+
+    old_above, old_below, old_time = replay(legacy_update, seconds)
+    new_above, new_below, new_time = replay(model_update, seconds)
+    shown = model.values
+    expected = ACTION_TEXTS["Shutdown"]
+
+    per_tick = lambda total: total / seconds * 1e6
+    print(f"{seconds} ticks ({args.minutes} min countdown), configure() calls per tick")
+    print("                      >= 1 h    < 1 h    cost/tick")
+    print(f"legacy update         {old_above:6.2f}   {old_below:6.2f}   {per_tick(old_time):6.2f} us")
+    print(f"view model            {new_above:6.2f}   {new_below:6.2f}   {per_tick(new_time):6.2f} us")
+
+    ok = True
+    if seconds > 3600 and new_above > 1.1:
+        print("FAIL: more than one label per second above one hour")
+        ok = False
+    if new_below > 2.1:
+        print("FAIL: more than two labels per second below one hour")
+        ok = False
+    if shown["action"] != expected or shown["seconds"] != "01":
+        print(f"FAIL: view model shows {shown}")
+        ok = False
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Import-time and first-paint budget
+
+Each run starts a fresh interpreter. The import probe runs
+`python -X importtime -c "import src.app"`, takes the cumulative time of
+src.app and checks that nothing deferred to after the first frame (the
+control server, pystray and the tray, the system action module)
+was imported. The paint probe constructs TimerApp and pumps Tk until the
+window is mapped. The median of the runs must stay within budget; the
+exit status says whether it did. The paint probe needs a display and is
+reported as skipped without one.
+
+    python -m benchmarks.bench_first_paint [--runs 5] [--import-budget-ms 200] [--paint-budget-ms 600]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must not load before the first frame
+DEFERRED = ("asyncio", "pystray", "src.tray", "src.control.server", "src.utils.system_actions")
+
+PAINT_PROBE = """
+import time
+started = time.perf_counter()
+from src.app import TimerApp
+app = TimerApp()
+while app.first_paint_time is None and time.perf_counter() - started < 10:
+    app.update()
+print((app.first_paint_time - started) * 1000 if app.first_paint_time else -1)
+app.timer.close()
+app.destroy()
+"""
+
+
+def import_probe() -> tuple:
+    """(src.app cumulative import ms, deferred modules that were imported)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.app"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    total, loaded = 0.0, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        loaded.add(name)
+        if name == "src.app":
+            total = int(cumulative) / 1000
+    return total, sorted(loaded.intersection(DEFERRED))
+
+
+def paint_probe(env: dict) -> float:
+    """Milliseconds from interpreter start to the window being mapped"""
+    result = subprocess.run([sys.executable, "-c", PAINT_PROBE], cwd=ROOT, env=env,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    """Run the probes and check the budgets"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--import-budget-ms", type=float, default=200)
+    parser.add_argument("--paint-budget-ms", type=float, default=600)
+    args = parser.parse_args()
+
+    try:
+        samples = [import_probe() for _ in range(args.runs)]
+    except RuntimeError as e:
+        print(f"GUI dependencies unavailable: {e}")
+        sys.exit(0)
+
+    ok = True
+    import_ms = sorted(total for total, _ in samples)[len(samples) // 2]
+    early = samples[0][1]
+    print(f"import src.app        {import_ms:7.1f} ms   (budget {args.import_budget_ms:.0f} ms)")
+    if import_ms > args.import_budget_ms:
+        print("FAIL: import time over budget")
+        ok = False
+    if early:
+        print(f"FAIL: imported before the first frame: {', '.join(early)}")
+        ok = False
+
+    # Keep the probe's control socket away from a running instance
+    env = dict(os.environ, XDG_RUNTIME_DIR=tempfile.mkdtemp())
+    try:
+        paints = sorted(paint_probe(env) for _ in range(args.runs))
+    except RuntimeError as e:
+        print(f"first paint           skipped ({e})")
+    else:
+        paint_ms = paints[len(paints) // 2]
+        print(f"first paint           {paint_ms:7.1f} ms   (budget {args.paint_budget_ms:.0f} ms)")
+        if paint_ms < 0 or paint_ms > args.paint_budget_ms:
+            print("FAIL: first paint over budget")
+            ok = False
+
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
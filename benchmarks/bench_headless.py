@@ -0,0 +1,105 @@
+"""
+Headless daemon vs. GUI startup benchmark
+
+Starts each mode in a fresh interpreter, measures the time until it is
+ready and its resident memory (VmRSS/VmHWM from /proc, Linux only). The GUI
+probe imports src.app and builds TimerApp, so it needs customtkinter and a
+display; when either is missing it reports why instead of a number.
+
+    python -m benchmarks.bench_headless [--runs 5]
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+GUI_PROBE = """
+import sys
+from src.app import TimerApp
+app = TimerApp()
+app.update()
+print("GUI ready", flush=True)
+sys.stdin.readline()
+"""
+
+
+def read_memory(pid: int) -> dict:
+    """VmRSS and VmHWM in MB for a running process"""
+    memory = {}
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith(("VmRSS:", "VmHWM:")):
+                    key, value = line.split(":")
+                    memory[key] = int(value.split()[0]) / 1024
+    except OSError:
+        pass
+    return memory
+
+
+def measure(argv: list, ready: str) -> dict:
+    """Start argv, wait for the ready line, sample memory and stop it"""
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        argv, cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT, text=True
+    )
+    output = []
+    for line in proc.stdout:
+        output.append(line)
+        if ready in line:
+            break
+    elapsed = time.perf_counter() - started
+    result = {"ok": ready in "".join(output), "startup_ms": elapsed * 1000}
+    if result["ok"]:
+        result.update(read_memory(proc.pid))
+    else:
+        result["error"] = "".join(output).strip().splitlines()[-1:] or ["no output"]
+    if proc.poll() is None:
+        proc.send_signal(signal.SIGTERM)
+    try:
+        proc.communicate(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+    return result
+
+
+def report(name: str, results: list) -> None:
+    """Print the median of a set of runs"""
+    good = [r for r in results if r["ok"]]
+    if not good:
+        print(f"{name:10s} unavailable: {results[0]['error'][0]}")
+        return
+    startup = sorted(r["startup_ms"] for r in good)[len(good) // 2]
+    rss = sorted(r.get("VmRSS", 0) for r in good)[len(good) // 2]
+    hwm = max(r.get("VmHWM", 0) for r in good)
+    print(f"{name:10s} startup {startup:7.1f} ms   RSS {rss:6.1f} MB   peak {hwm:6.1f} MB")
+
+
+def main():
+    """Run the comparison"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    env_note = "" if os.environ.get("DISPLAY") else " (no DISPLAY set)"
+    print(f"Median of {args.runs} runs{env_note}")
+
+    baseline = [measure([sys.executable, "-c", "print('ready', flush=True); input()"], "ready")
+                for _ in range(args.runs)]
+    headless = [measure([sys.executable, "main.py", "--headless"], "daemon ready")
+                for _ in range(args.runs)]
+    gui = [measure([sys.executable, "-c", GUI_PROBE], "GUI ready") for _ in range(args.runs)]
+
+    report("python", baseline)
+    report("headless", headless)
+    report("gui", gui)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Hidden-window idle cost benchmark
+
+Runs a real TimerController countdown with a queue-driven owner thread in
+place of Tk's mainloop, first as with the window shown (a tick every
+second, each one updating the active screen's view model) and then as with
+the window withdrawn to the tray (a tick every tray update interval, each
+one formatting the tooltip). Reports process CPU time, owner wakeups and
+voluntary context switches, scaled to one minute.
+
+    python -m benchmarks.bench_hidden [--seconds 20] [--interval 30]
+"""
+import argparse
+import queue
+import resource
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.config import ConfigManager
+from src.constants import CONFIG_FILE
+from src.timer import TimerController
+from src.ui.view_models import ActiveViewModel
+
+
+class OwnerLoop:
+    """Single consumer thread, like Tk's mainloop servicing the update bus"""
+
+    def __init__(self, journal_path: Path):
+        self.tasks: "queue.SimpleQueue" = queue.SimpleQueue()
+        self.wakeups = 0
+        self.timer = TimerController(ConfigManager(CONFIG_FILE), post=self.post,
+                                     journal_path=journal_path)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def post(self, fn, *args) -> None:
+        self.tasks.put((fn, args))
+
+    def _run(self) -> None:
+        while True:
+            fn, args = self.tasks.get()
+            if fn is None:
+                return
+            self.wakeups += 1
+            fn(*args)
+
+    def close(self) -> None:
+        self.tasks.put((None, ()))
+        self.thread.join()
+        self.timer.close()
+
+
+def measure(owner: OwnerLoop, seconds: float) -> dict:
+    """CPU seconds, owner wakeups and context switches over seconds"""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    wakeups = owner.wakeups
+    cpu = time.process_time()
+    time.sleep(seconds)
+    after = resource.getrusage(resource.RUSAGE_SELF)
+    scale = 60 / seconds
+    return {
+        "cpu_ms": (time.process_time() - cpu) * 1000 * scale,
+        "wakeups": (owner.wakeups - wakeups) * scale,
+        "switches": (after.ru_nvcsw - usage.ru_nvcsw) * scale,
+    }
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--interval", type=float,
+                        default=ConfigManager(CONFIG_FILE).get("tray.update_interval", 30))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        owner = OwnerLoop(Path(tmp) / "journal.jsonl")
+        timer = owner.timer
+        model = ActiveViewModel()
+        tooltips = []
+
+        def shown_tick():
+            model.update(timer.remaining_seconds, timer.selected_action)
+
+        def hidden_tick():
+            minutes = -(-timer.remaining_seconds // 60)
+            tooltips.append(f"ShutEye - {timer.selected_action} in {minutes} min")
+
+        timer.set_duration(3600)
+        owner.post(timer.start)
+
+        timer.on_tick = shown_tick
+        shown = measure(owner, args.seconds)
+
+        timer.on_tick = hidden_tick
+        timer.set_tick_interval(args.interval)
+        hidden = measure(owner, args.seconds)
+        owner.close()
+
+    print(f"countdown running, {args.seconds:.0f} s per mode, per minute:")
+    print(f"{'':<22} {'CPU ms':>8} {'wakeups':>8} {'ctx switches':>13}")
+    for name, row in (("window shown", shown), (f"hidden ({args.interval:.0f} s tray)", hidden)):
+        print(f"{name:<22} {row['cpu_ms']:>8.2f} {row['wakeups']:>8.1f} {row['switches']:>13.1f}")
+
+    ok = hidden["wakeups"] * 10 <= shown["wakeups"] and hidden["cpu_ms"] < shown["cpu_ms"]
+    print("PASS" if ok else "FAIL: hidden mode was not quieter")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Second-launch forwarding timing test
+
+Starts a control server standing in for a running instance, then launches
+`main.py --in 30m --action Lock` repeatedly and times each process from
+spawn to exit. Interpreter startup is measured separately with a bare
+`python -c pass` and subtracted, so the budget covers only ShutEye's own
+work: imports and the socket round trip. Also checks with -X importtime
+that the forward path never imports the GUI stack.
+
+    python -m benchmarks.bench_launch_forward [--runs 20] [--budget-ms 50]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.control.server import ControlServer, CoalescedDispatcher
+
+ROOT = Path(__file__).resolve().parent.parent
+GUI_MODULES = ("customtkinter", "PIL", "pystray", "tkinter")
+
+
+def time_process(argv: list, env: dict) -> float:
+    """Wall time of one process run in ms"""
+    started = time.perf_counter()
+    subprocess.run(argv, cwd=ROOT, env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - started) * 1000
+
+
+def median(values: list) -> float:
+    return sorted(values)[len(values) // 2]
+
+
+def main():
+    """Run the timing test"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="Allowed time on top of interpreter startup")
+    args = parser.parse_args()
+
+    received = []
+
+    def handler(request):
+        received.append(request)
+        return {"ok": True}
+
+    with tempfile.TemporaryDirectory() as runtime_dir:
+        env = dict(os.environ, XDG_RUNTIME_DIR=runtime_dir)
+        os.environ["XDG_RUNTIME_DIR"] = runtime_dir
+        server = ControlServer(handler, CoalescedDispatcher(lambda fn: fn()))
+        if not server.start():
+            print("FAIL: could not start control server")
+            sys.exit(1)
+
+        launch = [sys.executable, "main.py", "--in", "30m", "--action", "Lock"]
+        bare = [time_process([sys.executable, "-c", "pass"], env) for _ in range(args.runs)]
+        forwarded = [time_process(launch, env) for _ in range(args.runs)]
+
+        probe = subprocess.run([sys.executable, "-X", "importtime"] + launch[1:], cwd=ROOT,
+                               env=env, capture_output=True, text=True)
+        server.close()
+
+    imported = [line.rsplit("|", 1)[-1].strip() for line in probe.stderr.splitlines()
+                if line.startswith("import time:")]
+    gui_imports = sorted({m for m in imported if m.split(".")[0] in GUI_MODULES})
+
+    overhead = median(forwarded) - median(bare)
+    print(f"python -c pass      median {median(bare):6.1f} ms")
+    print(f"forwarded launch    median {median(forwarded):6.1f} ms   "
+          f"(+{overhead:.1f} ms over interpreter startup)")
+    print(f"requests received   {len(received)} of {args.runs + 1}")
+    print(f"modules imported    {len(imported)}, GUI: {', '.join(gui_imports) or 'none'}")
+
+    ok = True
+    if overhead > args.budget_ms:
+        print(f"FAIL: forward path over budget ({overhead:.1f} > {args.budget_ms} ms)")
+        ok = False
+    if len(received) != args.runs + 1 or any(r != received[0] for r in received):
+        print("FAIL: running instance did not get every request")
+        ok = False
+    if received and received[0] != {"cmd": "launch", "argv": launch[2:]}:
+        print(f"FAIL: unexpected request {received[0]}")
+        ok = False
+    if gui_imports:
+        print("FAIL: forward path imported the GUI stack")
+        ok = False
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Preference write-back benchmark
+
+Replays rapid clicking, as on the quick add buttons and action cards, against
+Preferences on the calling thread: bursts of 100 changes 10 ms apart with a
+second of quiet between bursts. Reports the cost of set() on the clicking
+thread, how many times the file was written and from which thread, next to
+writing the file synchronously on every click. Every burst must end in
+exactly one write, none of them on the clicking thread, and the file must
+hold the last values.
+
+    python -m benchmarks.bench_preferences [--bursts 3] [--clicks 100]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import src.preferences
+from src.preferences import Preferences
+
+ACTIONS = ("Shutdown", "Restart", "Sleep", "Lock", "Log Out")
+
+
+def synchronous(path: Path, clicks: int) -> list:
+    """Old-style save on every click: microseconds per click"""
+    costs = []
+    for i in range(clicks):
+        started = time.perf_counter()
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"last_duration": 60 * (i + 1)}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        costs.append((time.perf_counter() - started) * 1e6)
+    return costs
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bursts", type=int, default=3)
+    parser.add_argument("--clicks", type=int, default=100)
+    args = parser.parse_args()
+
+    # Record which thread replaces the file
+    writers = []
+    replace = os.replace
+
+    def recording_replace(src, dst):
+        writers.append(threading.current_thread())
+        replace(src, dst)
+
+    src.preferences.os.replace = recording_replace
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "prefs" / "preferences.json"
+        prefs = Preferences(path)
+        costs = []
+        duration = 0
+        for burst in range(args.bursts):
+            for i in range(args.clicks):
+                duration += 60
+                started = time.perf_counter()
+                prefs.set("last_duration", duration)
+                prefs.set("selected_action", ACTIONS[i % len(ACTIONS)])
+                costs.append((time.perf_counter() - started) * 1e6)
+                time.sleep(0.01)
+            time.sleep(prefs.delay + 0.5)
+        prefs.close()
+        saved = json.loads(path.read_text())
+        src.preferences.os.replace = replace
+        sync_costs = synchronous(Path(tmp) / "sync.json", args.clicks)
+
+    on_caller = sum(1 for thread in writers if thread is threading.main_thread())
+    costs.sort()
+    print(f"{'':<26} {'p50 us':>8} {'p99 us':>8} {'max us':>8} {'writes':>7}")
+    print(f"{'save on every click':<26} {statistics.median(sync_costs):8.1f} "
+          f"{sorted(sync_costs)[int(len(sync_costs) * .99)]:8.1f} {max(sync_costs):8.1f} "
+          f"{len(sync_costs):7d}")
+    print(f"{'debounced set()':<26} {statistics.median(costs):8.1f} "
+          f"{costs[int(len(costs) * .99)]:8.1f} {costs[-1]:8.1f} {len(writers):7d}")
+    print(f"writes on the clicking thread: {on_caller}")
+
+    expected = {"last_duration": duration, "selected_action": ACTIONS[(args.clicks - 1) % len(ACTIONS)]}
+    ok = len(writers) == args.bursts and on_caller == 0 and saved == expected
+    print("PASS" if ok else f"FAIL: expected {args.bursts} background writes of {expected}, "
+                            f"got {len(writers)} ({on_caller} on the caller), file {saved}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
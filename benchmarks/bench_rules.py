@@ -0,0 +1,111 @@
+"""
+Recurring schedule benchmark
+
+Compiles a few hundred random rules (daily, weekdays, weekends, custom day
+lists and one-off dates) and expands a full year of occurrences through the
+RuleIndex. For comparison, a naive poller re-evaluates every rule once per
+second; it is run for one day, checked against the index for that day and
+extrapolated to a year.
+
+    python -m benchmarks.bench_rules [--rules 500] [--seed 1]
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from src.constants import ACTION_ICONS
+from src.timer.rules import RuleIndex, WEEKDAY_NAMES, DAY_SETS, compile_rules
+
+YEAR = 365 * 86400
+
+
+def random_specs(count: int, start: datetime, rng: random.Random) -> list:
+    """Mix of recurring and one-off rules"""
+    specs = []
+    for _ in range(count):
+        spec = {"action": rng.choice(list(ACTION_ICONS))}
+        kind = rng.random()
+        if kind < 0.1:
+            when = start + timedelta(minutes=rng.randrange(YEAR // 60))
+            spec["at"] = when.strftime("%Y-%m-%d %H:%M")
+        else:
+            spec["at"] = f"{rng.randrange(24):02d}:{rng.randrange(60):02d}"
+            if kind < 0.6:
+                spec["days"] = rng.choice(list(DAY_SETS))
+            else:
+                spec["days"] = rng.sample(WEEKDAY_NAMES, rng.randint(1, 6))
+        specs.append(spec)
+    return specs
+
+
+def poll_day(specs: list, start: float) -> set:
+    """Naive scheduler: every second, test every rule against the clock"""
+    parsed = []
+    for rule_id, spec in enumerate(specs, 1):
+        if " " in spec["at"]:
+            parsed.append((rule_id, datetime.fromisoformat(spec["at"]), None))
+            continue
+        hour, minute = (int(p) for p in spec["at"].split(":"))
+        days = spec.get("days", "daily")
+        days = set(DAY_SETS[days]) if isinstance(days, str) else {WEEKDAY_NAMES.index(d) for d in days}
+        parsed.append((rule_id, (hour, minute), days))
+
+    fired = set()
+    for second in range(86400):
+        ts = start + second
+        now = datetime.fromtimestamp(ts)
+        for rule_id, at, days in parsed:
+            if days is None:
+                if now == at:
+                    fired.add((ts, rule_id))
+            elif now.second == 0 and (now.hour, now.minute) == at and now.weekday() in days:
+                fired.add((ts, rule_id))
+    return fired
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rules", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    start_dt = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    start = start_dt.timestamp()
+    specs = random_specs(args.rules, start_dt, random.Random(args.seed))
+
+    t0 = time.perf_counter()
+    rules = compile_rules(specs)
+    index = RuleIndex(rules, start)
+    t1 = time.perf_counter()
+    occurrences = list(index.expand(start, start + YEAR))
+    t2 = time.perf_counter()
+
+    instants = len({fire for fire, _ in occurrences})
+    in_order = all(a[0] <= b[0] for a, b in zip(occurrences, occurrences[1:]))
+    print(f"{len(rules)} rules compiled and indexed in {(t1 - t0) * 1000:.2f} ms")
+    print(f"one year: {len(occurrences)} occurrences in {(t2 - t1) * 1000:.1f} ms "
+          f"({(t2 - t1) / len(occurrences) * 1e6:.2f} us each), {instants} wakeups")
+
+    t3 = time.perf_counter()
+    polled = poll_day(specs, start)
+    t4 = time.perf_counter()
+    indexed = {(fire, rule.rule_id) for fire, rule in index.expand(start, start + 86400)}
+    print(f"naive per-second poll: {(t4 - t3) * 1000:.0f} ms for one day, "
+          f"~{(t4 - t3) * 365:.0f} s per year, {86400 * 365} wakeups")
+
+    ok = True
+    if not in_order:
+        print("FAIL: occurrences out of order")
+        ok = False
+    if polled != indexed:
+        print(f"FAIL: poller found {len(polled)} occurrences on day one, index {len(indexed)}")
+        ok = False
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
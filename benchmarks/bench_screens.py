@@ -0,0 +1,87 @@
+"""
+Screen navigation benchmark
+
+Times 100 Setup -> Active -> Settings round trips in a real TimerApp, first
+the way navigation used to work (destroy every screen and rebuild the one
+being shown, re-reading PNGs and creating fonts each time) and then with
+the persistent screens that are only packed and forgotten. The image cache
+counters confirm that persistent navigation never decodes an image. Needs
+customtkinter and a display; reports why when either is missing.
+
+    python -m benchmarks.bench_screens [--trips 100]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+
+def legacy_switch(app, screen) -> None:
+    """Old navigation: tear every screen down, then build the target"""
+    for other in (app.setup_screen, app.active_screen, app.settings_screen):
+        if other.frame is not None:
+            other.frame.destroy()
+            other.frame = None
+            other.visible = False
+    app.current_screen = None
+    app._switch_screen(screen)
+
+
+def round_trips(app, trips: int, switch) -> float:
+    """Seconds for trips Setup -> Active -> Settings cycles"""
+    screens = (app.setup_screen, app.active_screen, app.settings_screen)
+    started = time.perf_counter()
+    for _ in range(trips):
+        for screen in screens:
+            switch(app, screen)
+            app.update_idletasks()
+    return time.perf_counter() - started
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trips", type=int, default=100)
+    args = parser.parse_args()
+
+    # Keep the control socket, preferences, journal and caches away from
+    # a running instance and the real user profile
+    home = tempfile.mkdtemp()
+    os.environ.update(XDG_RUNTIME_DIR=home,
+                      XDG_CONFIG_HOME=os.path.join(home, "config"),
+                      XDG_CACHE_HOME=os.path.join(home, "cache"))
+    try:
+        from src.app import TimerApp
+        app = TimerApp()
+        app.update()
+    except Exception as e:
+        print(f"GUI unavailable: {e}")
+        sys.exit(0)
+
+    from src.ui.images import image_cache
+
+    legacy = round_trips(app, args.trips, legacy_switch)
+    misses = image_cache.misses
+    persistent = round_trips(app, args.trips, lambda a, screen: a._switch_screen(screen))
+    new_misses = image_cache.misses - misses
+    if app.control:
+        app.control.close()
+    app.timer.close()
+    app.preferences.close()
+    app.destroy()
+
+    per_trip = lambda total: total / args.trips * 1000
+    print(f"{args.trips} Setup -> Active -> Settings round trips")
+    print(f"destroy and rebuild   {legacy * 1000:8.1f} ms   ({per_trip(legacy):.2f} ms/trip)")
+    print(f"persistent screens    {persistent * 1000:8.1f} ms   ({per_trip(persistent):.2f} ms/trip)")
+    print(f"speedup               {legacy / persistent:8.1f}x")
+    print(f"image cache           {image_cache.stats()}, "
+          f"{new_misses} misses during persistent navigation")
+    ok = persistent < legacy and new_misses == 0
+    print("PASS" if ok else "FAIL: persistent navigation was slower or loaded images")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Startup benchmark harness
+
+Measures a cold start of the GUI without a display, with customtkinter
+replaced by the stub in benchmarks/stubs. Every run is a fresh interpreter:
+
+- `python -X importtime -c "import src.app"`: self and cumulative import
+  time of every src module
+- import of src.app, construction of TimerApp, and the time from
+  interpreter start until the first SetupScreen.show() returns
+- peak RSS of the process
+
+Medians over the runs are written as JSON (stdout, or --output) together
+with the commit they were taken on. With --compare, a previous result is
+loaded and any top-level timing more than --tolerance percent slower makes
+the exit status non-zero.
+
+    python -m benchmarks.bench_startup [--runs 5] [--output startup.json]
+                                       [--compare baseline.json] [--tolerance 20]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+STUBS = Path(__file__).resolve().parent / "stubs"
+
+# Top-level timings checked by --compare
+TIMINGS = ("import_ms", "construct_ms", "first_setup_show_ms")
+
+STARTUP_PROBE = """
+import json, resource, sys, time
+from pathlib import Path
+started = time.perf_counter()
+import src.app
+imported = time.perf_counter()
+from src.ui.screens import SetupScreen
+
+# Record when the first SetupScreen.show() returns
+shown = []
+original_show = SetupScreen.show
+def show(self):
+    original_show(self)
+    if not shown:
+        shown.append(time.perf_counter())
+SetupScreen.show = show
+
+src.app.JOURNAL_FILE = Path(sys.argv[1])
+before = time.perf_counter()
+app = src.app.TimerApp()
+constructed = time.perf_counter()
+app.timer.close()
+app.destroy()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "construct_ms": (constructed - before) * 1000,
+    "first_setup_show_ms": (shown[0] - started) * 1000 if shown else None,
+    "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}))
+"""
+
+
+def probe_env() -> dict:
+    """Stub first on the path; private runtime, config and cache dirs"""
+    # Shared by every run, so the first fills the config cache and the
+    # median is a warm start
+    path = os.pathsep.join(filter(None, [str(STUBS), str(ROOT), os.environ.get("PYTHONPATH")]))
+    home = tempfile.mkdtemp()
+    return dict(os.environ, PYTHONPATH=path, XDG_RUNTIME_DIR=home,
+                XDG_CONFIG_HOME=os.path.join(home, "config"),
+                XDG_CACHE_HOME=os.path.join(home, "cache"))
+
+
+def import_times(env: dict) -> dict:
+    """{module: (self us, cumulative us)} for src modules, from -X importtime"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import src.app"],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if name == "src" or name.startswith("src."):
+            modules[name] = (int(own), int(cumulative))
+    return modules
+
+
+def startup(env: dict) -> dict:
+    """Timings and peak RSS of one TimerApp start"""
+    with tempfile.TemporaryDirectory() as tmp:
+        result = subprocess.run(
+            [sys.executable, "-c", STARTUP_PROBE, str(Path(tmp) / "journal.jsonl")],
+            cwd=ROOT, env=env, capture_output=True, text=True
+        )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def git_commit() -> str:
+    """Commit the numbers belong to, or "" outside a checkout"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True)
+    except OSError:
+        return ""
+    return result.stdout.strip()
+
+
+def median(values: list) -> float:
+    """Median rounded for the report"""
+    return round(statistics.median(values), 3)
+
+
+def collect(runs: int) -> dict:
+    """Run every probe runs times and summarise"""
+    env = probe_env()
+    imports = [import_times(env) for _ in range(runs)]
+    starts = [startup(env) for _ in range(runs)]
+
+    modules = {}
+    for name in imports[0]:
+        samples = [run[name] for run in imports if name in run]
+        modules[name] = {
+            "self_us": median([own for own, _ in samples]),
+            "cumulative_us": median([cumulative for _, cumulative in samples]),
+        }
+    report = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "runs": runs,
+        "customtkinter": "stub",
+    }
+    for key in TIMINGS:
+        values = [start[key] for start in starts if start[key] is not None]
+        report[key] = median(values) if values else None
+    report["peak_rss_kb"] = max(start["peak_rss_kb"] for start in starts)
+    report["modules"] = dict(sorted(modules.items(), key=lambda m: -m[1]["cumulative_us"]))
+    return report
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> bool:
+    """Print changes against a baseline; False if a timing regressed"""
+    ok = True
+    print(f"against {baseline.get('commit') or 'baseline'}:", file=sys.stderr)
+    for key in TIMINGS + ("peak_rss_kb",):
+        old, new = baseline.get(key), report.get(key)
+        if not old or new is None:
+            continue
+        change = (new - old) / old * 100
+        regressed = key in TIMINGS and change > tolerance
+        print(f"  {key:<22} {old:>10.1f} -> {new:>10.1f}  ({change:+.1f}%)"
+              f"{'  REGRESSION' if regressed else ''}", file=sys.stderr)
+        ok = ok and not regressed
+    return ok
+
+
+def main():
+    """Run the harness"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write JSON here instead of stdout")
+    parser.add_argument("--compare", type=Path, help="previous JSON result to compare with")
+    parser.add_argument("--tolerance", type=float, default=20.0,
+                        help="allowed slowdown in percent for --compare")
+    args = parser.parse_args()
+
+    try:
+        import resource  # noqa: F401 - the probe reads peak RSS through it
+    except ImportError as e:
+        print(f"Startup harness unavailable: {e}")
+        sys.exit(0)
+
+    try:
+        report = collect(args.runs)
+    except (RuntimeError, subprocess.CalledProcessError) as e:
+        print(f"Startup probe failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+        print(f"wrote {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    ok = True
+    if args.compare:
+        ok = compare(report, json.loads(args.compare.read_text()), args.tolerance)
+        print("PASS" if ok else "FAIL: startup regressed", file=sys.stderr)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Timer drift benchmark
+
+Compares the fire error of the old decrement-per-tick countdown with the
+deadline-based TimerEngine. Long runs use a simulated clock that adds sleep
+overshoot and UI dispatch cost to every tick (a loaded machine); a short run
+uses the real monotonic clock.
+
+    python -m benchmarks.bench_timer_drift [--hours 4] [--real 10]
+"""
+import argparse
+import random
+import sys
+import time
+
+from src.timer import TimerEngine
+
+MAX_FIRE_ERROR = 0.050  # seconds
+
+
+class LoadedClock:
+    """Simulated monotonic clock where every sleep oversleeps"""
+
+    def __init__(self, overshoot_ms: tuple, dispatch_ms: tuple, seed: int = 1):
+        self.now = 0.0
+        self.overshoot = overshoot_ms
+        self.dispatch = dispatch_ms
+        self.rng = random.Random(seed)
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Advance by the requested time plus scheduler overshoot"""
+        self.now += seconds + self.rng.uniform(*self.overshoot) / 1000
+
+    def dispatch_cost(self) -> None:
+        """Advance by the cost of handing a tick to the UI thread"""
+        self.now += self.rng.uniform(*self.dispatch) / 1000
+
+
+def legacy_fire_time(duration: int, clock: LoadedClock) -> float:
+    """Old loop: sleep(1) then decrement remaining_seconds"""
+    remaining = duration
+    while remaining > 0:
+        clock.sleep(1)
+        remaining -= 1
+        clock.dispatch_cost()
+    return clock.now
+
+
+def engine_fire_time(duration: int, clock: LoadedClock) -> float:
+    """New loop: sleep until the next displayed second of the deadline"""
+    engine = TimerEngine(duration, clock=clock)
+    engine.start()
+    while not engine.is_expired():
+        clock.sleep(engine.seconds_until_tick())
+        clock.dispatch_cost()
+    return clock.now
+
+
+def run_simulated(hours: float) -> bool:
+    """Simulate a long countdown under load; returns True within budget"""
+    duration = int(hours * 3600)
+    print(f"Simulated {hours:g} h countdown (overshoot 1-15 ms, dispatch 0-5 ms per tick)")
+    legacy = legacy_fire_time(duration, LoadedClock((1, 15), (0, 5))) - duration
+    engine = engine_fire_time(duration, LoadedClock((1, 15), (0, 5))) - duration
+    print(f"  legacy decrement loop: fire error {legacy * 1000:10.1f} ms")
+    print(f"  deadline engine:       fire error {engine * 1000:10.1f} ms")
+    return abs(engine) < MAX_FIRE_ERROR
+
+
+def run_real(seconds: int) -> bool:
+    """Run the engine against the real clock; returns True within budget"""
+    print(f"Real-clock {seconds} s countdown")
+    engine = TimerEngine(seconds)
+    start = time.monotonic()
+    engine.start()
+    ticks = 0
+    while not engine.is_expired():
+        time.sleep(engine.seconds_until_tick())
+        ticks += 1
+    error = time.monotonic() - start - seconds
+    print(f"  deadline engine:       fire error {error * 1000:10.1f} ms over {ticks} ticks")
+    return abs(error) < MAX_FIRE_ERROR
+
+
+def main():
+    """Run the drift benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hours", type=float, default=4, help="simulated duration")
+    parser.add_argument("--real", type=int, default=5, help="real-clock duration in seconds")
+    args = parser.parse_args()
+
+    ok = run_simulated(args.hours)
+    if args.real > 0:
+        ok = run_real(args.real) and ok
+
+    print(f"Fire error budget {MAX_FIRE_ERROR * 1000:.0f} ms: {'PASS' if ok else 'FAIL'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
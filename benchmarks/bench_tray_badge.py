@@ -0,0 +1,86 @@
+"""
+Tray badge redraw benchmark
+
+Times badge redraws on the 64 px tray icon two ways: a full render per
+frame (copy the icon, draw the rounded badge and lay out the text with
+ImageDraw) and BadgeRenderer, which blits prerendered glyph cells. Then
+replays a two-hour countdown ticking every second through the renderer to
+count how many redraws actually happen. Needs Pillow; reports why when it
+is missing.
+
+    python -m benchmarks.bench_tray_badge [--redraws 2000]
+"""
+import argparse
+import sys
+import time
+
+from src.constants import APP_LOGO
+
+
+def full_render(base, font, text: str, color: str = "#1973f0"):
+    """Badge drawn from scratch, text layout included"""
+    from PIL import ImageDraw
+
+    image = base.copy()
+    draw = ImageDraw.Draw(image)
+    width, height = image.size
+    box = draw.textbbox((0, 0), text, font=font)
+    badge_height = height // 2
+    pill_width = min(width, box[2] - box[0] + 2 * (badge_height // 5))
+    x, y = width - pill_width, height - badge_height
+    draw.rounded_rectangle((x, y, width - 1, height - 1), radius=badge_height // 2, fill=color)
+    draw.text((x + (pill_width - (box[2] - box[0])) // 2 - box[0],
+               y + (badge_height - (box[3] - box[1])) // 2 - box[1]),
+              text, font=font, fill="#ffffff")
+    return image
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--redraws", type=int, default=2000)
+    args = parser.parse_args()
+
+    try:
+        from src.ui.badge import BadgeRenderer, badge_text, _load_font
+        from src.ui.images import ImageCache
+    except ImportError as e:
+        print(f"Pillow unavailable: {e}")
+        sys.exit(0)
+
+    base = ImageCache(use_atlas=False).get(APP_LOGO, 64, "RGBA")
+    texts = [badge_text(seconds) for seconds in range(60, 60 * 200, 60)]
+
+    started = time.perf_counter()
+    renderer = BadgeRenderer(base)
+    setup = time.perf_counter() - started
+
+    font = _load_font(int(renderer.badge_height * 0.85))
+    started = time.perf_counter()
+    for i in range(args.redraws):
+        full_render(base, font, texts[i % len(texts)])
+    full = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for i in range(args.redraws):
+        renderer._compose(texts[i % len(texts)])
+    blit = time.perf_counter() - started
+
+    renderer = BadgeRenderer(base)
+    for remaining in range(7200, 0, -1):
+        renderer.render(badge_text(remaining))
+
+    per = lambda total: total / args.redraws * 1e6
+    print(f"{args.redraws} redraws of a 64 px tray icon badge")
+    print(f"full ImageDraw render  {per(full):8.1f} us/redraw")
+    print(f"cached glyph blits     {per(blit):8.1f} us/redraw "
+          f"(glyph cache built once in {setup * 1000:.1f} ms)")
+    print(f"two-hour countdown: {renderer.renders} redraws for 7200 ticks")
+
+    ok = blit < full and renderer.renders <= 120
+    print("PASS" if ok else "FAIL: glyph blits were slower or redraws were not coalesced")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
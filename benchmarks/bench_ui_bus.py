@@ -0,0 +1,163 @@
+"""
+UI update bus benchmark
+
+A single-threaded loop with a thread-safe after(ms, fn) stands in for Tk's
+mainloop. Background producers flood it the way a busy session would: the
+countdown publishing ticks, the tray toggling the window and timer, and
+control requests. Each UI callback burns a fixed amount of CPU, like a
+label update. The same load is run once with every event sent through its
+own after(0) call and once through the UpdateBus, reporting callbacks run,
+loop wakeups, maximum queue depth and end-to-end latency.
+
+    python -m benchmarks.bench_ui_bus [--seconds 2] [--rate 5000] [--work-us 200]
+"""
+import argparse
+import heapq
+import itertools
+import sys
+import threading
+import time
+
+from src.ui.bus import UpdateBus
+
+
+class MainLoop:
+    """One consumer thread running after() callbacks in due order"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap: list = []
+        self._seq = itertools.count()
+        self._stopped = False
+        self.wakeups = 0
+        self.callbacks = 0
+        self.max_depth = 0
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def after(self, ms: int, fn) -> None:
+        with self._cond:
+            heapq.heappush(self._heap, (time.perf_counter() + ms / 1000, next(self._seq), fn))
+            self.max_depth = max(self.max_depth, len(self._heap))
+            self._cond.notify()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self.thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopped and (not self._heap or self._heap[0][0] > time.perf_counter()):
+                    self._cond.wait(self._heap[0][0] - time.perf_counter() if self._heap else None)
+                if self._stopped:
+                    return
+                self.wakeups += 1
+                _, _, fn = heapq.heappop(self._heap)
+            self.callbacks += 1
+            fn()
+
+
+def burn(us: float) -> None:
+    """Busy-wait, standing in for a widget update"""
+    end = time.perf_counter() + us / 1e6
+    while time.perf_counter() < end:
+        pass
+
+
+def run_load(post, publish, seconds: float, rate: int, work_us: float) -> list:
+    """Drive producers for seconds; return per-delivery latencies"""
+    latencies = []
+    done = threading.Event()
+
+    def handler(posted_at: float) -> None:
+        burn(work_us)
+        latencies.append(time.perf_counter() - posted_at)
+
+    def countdown():
+        interval = 1.0 / rate
+        next_at = time.perf_counter()
+        while not done.is_set():
+            publish("tick", handler, time.perf_counter())
+            next_at += interval
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+    def tray():
+        for i in itertools.count():
+            if done.wait(0.01):
+                return
+            publish("tray-window" if i % 2 else "tray-timer", handler, time.perf_counter())
+
+    def control():
+        while not done.wait(0.005):
+            post(handler, time.perf_counter())
+
+    producers = [threading.Thread(target=f) for f in (countdown, tray, control)]
+    for thread in producers:
+        thread.start()
+    time.sleep(seconds)
+    done.set()
+    for thread in producers:
+        thread.join()
+    return latencies
+
+
+def drain(loop: MainLoop, idle: float = 0.2) -> None:
+    """Wait until the loop has been idle for a moment"""
+    last = -1
+    while loop.callbacks != last:
+        last = loop.callbacks
+        time.sleep(idle)
+
+
+def summary(name: str, loop: MainLoop, latencies: list, depth: int) -> float:
+    """Print one result row; return p99 latency in ms"""
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(f"{name:<16} {loop.callbacks:>9} {len(latencies):>10} {depth:>9} "
+          f"{p50:>9.2f} {p99:>9.2f}")
+    return p99
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--rate", type=int, default=5000, help="countdown publishes per second")
+    parser.add_argument("--work-us", type=float, default=200, help="CPU cost of each UI callback")
+    args = parser.parse_args()
+
+    legacy = MainLoop()
+    legacy_post = lambda fn, *a: legacy.after(0, lambda: fn(*a))
+    legacy_lat = run_load(legacy_post, lambda key, fn, *a: legacy_post(fn, *a),
+                          args.seconds, args.rate, args.work_us)
+    drain(legacy)
+    legacy.stop()
+
+    loop = MainLoop()
+    bus = UpdateBus(loop.after)
+    bus_lat = run_load(bus.post, bus.publish, args.seconds, args.rate, args.work_us)
+    drain(loop)
+    loop.stop()
+    stats = bus.stats()
+
+    print(f"{args.seconds:.0f} s at {args.rate} ticks/s plus tray and control traffic, "
+          f"{args.work_us:.0f} us per UI callback")
+    print(f"{'':<16} {'callbacks':>9} {'delivered':>10} {'max depth':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    legacy_p99 = summary("after(0) each", legacy, legacy_lat, legacy.max_depth)
+    bus_p99 = summary("update bus", loop, bus_lat, stats["max_depth"])
+    print(f"bus: {stats['posted']} posted, {stats['coalesced']} coalesced, "
+          f"{stats['pumps']} pumps, {stats['overruns']} over budget")
+
+    ok = bus_p99 < legacy_p99 and stats["depth"] == 0
+    print("PASS" if ok else "FAIL: bus latency was not lower")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
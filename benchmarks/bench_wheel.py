@@ -0,0 +1,119 @@
+"""
+Mouse-wheel adjustment benchmark
+
+Replays scroll gestures against a real TimerController on a virtual clock:
+a fast wheel spin (40 notches in half a second) and a precision touchpad
+swipe (600 events of a third of a notch over two seconds). The old handler
+applied +/-60 s per event, adjusting the deadline, journaling and redrawing
+every time; WheelAccumulator previews once per frame and commits once the
+gesture stops. Reports deadline commits, display refreshes, the total
+adjustment and wall time for each.
+
+    python -m benchmarks.bench_wheel
+"""
+import argparse
+import heapq
+import itertools
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.config import ConfigManager
+from src.constants import CONFIG_FILE
+from src.timer import TimerController
+from src.ui.input import WheelAccumulator
+
+GESTURES = {
+    "wheel spin": (40, 1.0, 0.5),        # events, notches per event, seconds
+    "touchpad swipe": (600, 1 / 3, 2.0),
+}
+
+
+class VirtualLoop:
+    """after(ms, fn) on a simulated clock, run to completion on demand"""
+
+    def __init__(self):
+        self.now = 0.0
+        self._heap: list = []
+        self._seq = itertools.count()
+
+    def after(self, ms: int, fn) -> None:
+        heapq.heappush(self._heap, (self.now + ms / 1000, next(self._seq), fn))
+
+    def run_until(self, when: float) -> None:
+        while self._heap and self._heap[0][0] <= when:
+            self.now, _, fn = heapq.heappop(self._heap)
+            fn()
+        self.now = when
+
+
+def legacy(timer: TimerController, events: int, notches: float) -> dict:
+    """Old on_scroll: one adjust and one redraw per event"""
+    counts = {"commits": 0, "refreshes": 0}
+    before = timer.remaining_seconds
+    started = time.perf_counter()
+    for _ in range(events):
+        timer.adjust(60 if notches > 0 else -60)
+        counts["commits"] += 1
+        counts["refreshes"] += 1
+    counts["wall_ms"] = (time.perf_counter() - started) * 1000
+    counts["adjusted"] = timer.remaining_seconds - before
+    return counts
+
+
+def accumulated(timer: TimerController, events: int, notches: float, seconds: float) -> dict:
+    """WheelAccumulator fed the same events on a virtual clock"""
+    loop = VirtualLoop()
+    counts = {"commits": 0, "refreshes": 0}
+    before = timer.remaining_seconds
+
+    def commit(total: int) -> None:
+        timer.adjust(total)
+        counts["commits"] += 1
+        counts["refreshes"] += 1
+
+    def preview() -> None:
+        counts["refreshes"] += 1
+
+    wheel = WheelAccumulator(loop.after, on_change=preview, on_commit=commit,
+                             clock=lambda: loop.now)
+    started = time.perf_counter()
+    for i in range(events):
+        loop.run_until(i * seconds / events)
+        wheel.add_notches(notches)
+    loop.run_until(seconds + 1.0)
+    counts["wall_ms"] = (time.perf_counter() - started) * 1000
+    counts["adjusted"] = timer.remaining_seconds - before
+    return counts
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.parse_args()
+
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        timer = TimerController(ConfigManager(CONFIG_FILE), post=lambda fn, *a: fn(*a),
+                                journal_path=Path(tmp) / "journal.jsonl")
+        print(f"{'':<16} {'handler':<12} {'commits':>8} {'refreshes':>10} "
+              f"{'adjusted':>9} {'wall ms':>8}")
+        for name, (events, notches, seconds) in GESTURES.items():
+            for label, run in (("per event", lambda: legacy(timer, events, notches)),
+                               ("accumulated", lambda: accumulated(timer, events, notches, seconds))):
+                timer.set_duration(3600)
+                row = run()
+                print(f"{name:<16} {label:<12} {row['commits']:>8} {row['refreshes']:>10} "
+                      f"{row['adjusted'] // 60:>7} m {row['wall_ms']:>8.2f}")
+                if label == "accumulated":
+                    frames = seconds * 1000 / 16 + 2
+                    ok = ok and row["commits"] == 1 and row["refreshes"] <= frames
+        timer.close()
+
+    print("PASS" if ok else "FAIL: scrolling was not coalesced into one commit")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
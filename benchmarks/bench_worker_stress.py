@@ -0,0 +1,88 @@
+"""
+Countdown worker stress test
+
+Toggles pause/play 10,000 times as fast as possible, then lets the countdown
+run out and checks that exactly one worker thread exists, every displayed
+second is ticked once, and the action fires once and on time.
+
+    python -m benchmarks.bench_worker_stress [--toggles 10000] [--duration 3]
+"""
+import argparse
+import sys
+import threading
+import time
+
+from src.timer import TimerEngine, CountdownWorker
+
+MAX_FIRE_ERROR = 0.050  # seconds
+
+
+class Recorder:
+    """Collects worker callbacks the way TimerApp would receive them"""
+
+    def __init__(self):
+        self.worker = None
+        self.ticks = []
+        self.fires = []
+        self.fired = threading.Event()
+
+    def on_tick(self, generation: int) -> None:
+        if self.worker.is_current(generation):
+            self.ticks.append((time.monotonic(), self.worker.engine.remaining_seconds()))
+
+    def on_expire(self, generation: int) -> None:
+        if self.worker.is_current(generation):
+            self.fires.append(time.monotonic())
+            self.fired.set()
+
+
+def main():
+    """Run the stress test"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--toggles", type=int, default=10000)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    threads_before = threading.active_count()
+    recorder = Recorder()
+    engine = TimerEngine(args.duration)
+    recorder.worker = CountdownWorker(engine, recorder.on_tick, recorder.on_expire)
+
+    started = time.perf_counter()
+    for _ in range(args.toggles):
+        recorder.worker.start()
+        recorder.worker.pause()
+    recorder.worker.start()
+    toggle_time = time.perf_counter() - started
+    expected_fire = engine.deadline
+
+    threads_after = threading.active_count()
+    recorder.fired.wait(args.duration + 5)
+    time.sleep(0.2)  # catch any duplicate expiry
+    recorder.worker.close()
+
+    values = [value for _, value in recorder.ticks]
+    fire_error = recorder.fires[0] - expected_fire if recorder.fires else float("inf")
+    tick_errors = [
+        abs(at - (expected_fire - value)) for at, value in recorder.ticks
+    ]
+
+    print(f"{args.toggles} pause/play toggles in {toggle_time * 1000:.1f} ms")
+    print(f"  threads before/after: {threads_before}/{threads_after} (one worker expected)")
+    print(f"  ticks: {values}")
+    print(f"  worst tick error: {max(tick_errors, default=0) * 1000:.2f} ms")
+    print(f"  fires: {len(recorder.fires)}, fire error {fire_error * 1000:.2f} ms")
+
+    ok = (
+        threads_after == threads_before + 1
+        and len(values) == len(set(values))
+        and values == sorted(values, reverse=True)
+        and len(recorder.fires) == 1
+        and abs(fire_error) < MAX_FIRE_ERROR
+    )
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
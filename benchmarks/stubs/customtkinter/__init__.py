@@ -0,0 +1,244 @@
+"""
+Headless stand-in for customtkinter, used by benchmarks only
+
+Put benchmarks/stubs first on PYTHONPATH and ``import customtkinter``
+resolves here. Widgets record their options and geometry calls and draw
+nothing; the root window runs after() callbacks from a plain heap. Nothing
+imports tkinter, so it works without a display and costs next to nothing
+to import, which keeps startup measurements about ShutEye's own code.
+"""
+import heapq
+import itertools
+import time
+
+__version__ = "stub"
+
+_settings = {"appearance_mode": "dark", "color_theme": "blue"}
+
+
+def set_appearance_mode(mode: str) -> None:
+    _settings["appearance_mode"] = mode
+
+
+def set_default_color_theme(theme: str) -> None:
+    _settings["color_theme"] = theme
+
+
+class CTkFont:
+    def __init__(self, *args, **kwargs):
+        self.options = kwargs
+
+
+class CTkImage:
+    def __init__(self, light_image=None, dark_image=None, size=(20, 20)):
+        self.light_image = light_image
+        self.dark_image = dark_image
+        self.size = size
+
+
+class BooleanVar:
+    def __init__(self, master=None, value: bool = False):
+        self._value = bool(value)
+
+    def get(self) -> bool:
+        return self._value
+
+    def set(self, value: bool) -> None:
+        self._value = bool(value)
+
+
+class _Widget:
+    """Records options and layout; every widget class is one of these"""
+
+    def __init__(self, master=None, **kwargs):
+        self.master = master
+        self.children = []
+        self._options = dict(kwargs)
+        self._bindings = {}
+        self._manager = None
+        self._exists = True
+        if master is not None:
+            master.children.append(self)
+
+    def configure(self, **kwargs) -> None:
+        self._options.update(kwargs)
+
+    config = configure
+
+    def cget(self, key: str):
+        return self._options.get(key)
+
+    def pack(self, **kwargs) -> None:
+        self._manager = "pack"
+
+    def pack_forget(self) -> None:
+        self._manager = None
+
+    def grid(self, **kwargs) -> None:
+        self._manager = "grid"
+
+    def grid_forget(self) -> None:
+        self._manager = None
+
+    def grid_columnconfigure(self, index, **kwargs) -> None:
+        pass
+
+    def grid_rowconfigure(self, index, **kwargs) -> None:
+        pass
+
+    def place(self, **kwargs) -> None:
+        self._manager = "place"
+
+    def bind(self, sequence=None, func=None, add=None) -> str:
+        self._bindings.setdefault(sequence, []).append(func)
+        return str(id(func))
+
+    def unbind(self, sequence, funcid=None) -> None:
+        self._bindings.pop(sequence, None)
+
+    def winfo_exists(self) -> bool:
+        return self._exists
+
+    def winfo_ismapped(self) -> bool:
+        return self._manager is not None
+
+    def winfo_children(self) -> list:
+        return list(self.children)
+
+    def winfo_toplevel(self):
+        widget = self
+        while widget.master is not None:
+            widget = widget.master
+        return widget
+
+    def focus_set(self) -> None:
+        pass
+
+    def after(self, ms: int, func=None, *args):
+        return self.winfo_toplevel()._schedule(ms, func, args)
+
+    def after_idle(self, func, *args):
+        return self.winfo_toplevel()._schedule(0, func, args)
+
+    def after_cancel(self, after_id) -> None:
+        self.winfo_toplevel()._cancelled.add(after_id)
+
+    def destroy(self) -> None:
+        for child in list(self.children):
+            child.destroy()
+        if self.master is not None and self in self.master.children:
+            self.master.children.remove(self)
+        self._exists = False
+
+
+class CTkFrame(_Widget):
+    pass
+
+
+class CTkScrollableFrame(_Widget):
+    pass
+
+
+class CTkLabel(_Widget):
+    pass
+
+
+class CTkButton(_Widget):
+    pass
+
+
+class CTkCheckBox(_Widget):
+    pass
+
+
+class CTkSwitch(_Widget):
+    pass
+
+
+class CTkSlider(_Widget):
+    pass
+
+
+class CTkEntry(_Widget):
+    pass
+
+
+class CTk(_Widget):
+    """Root window: no display, after() callbacks run by update()/mainloop()"""
+
+    def __init__(self, **kwargs):
+        super().__init__(None, **kwargs)
+        self._timers = []
+        self._seq = itertools.count()
+        self._cancelled = set()
+        self._quit = False
+        self._protocols = {}
+        self._title = ""
+        self._geometry = ""
+        self._state = "normal"
+
+    def _schedule(self, ms: int, func, args: tuple):
+        after_id = f"after#{next(self._seq)}"
+        if func is not None:
+            heapq.heappush(self._timers, (time.monotonic() + ms / 1000, after_id, func, args))
+        return after_id
+
+    def title(self, text: str = None):
+        if text is None:
+            return self._title
+        self._title = text
+
+    def geometry(self, spec: str = None):
+        if spec is None:
+            return self._geometry
+        self._geometry = spec
+
+    def resizable(self, width=None, height=None) -> None:
+        pass
+
+    def minsize(self, width=None, height=None) -> None:
+        pass
+
+    def iconbitmap(self, path=None) -> None:
+        pass
+
+    def protocol(self, name: str, func=None) -> None:
+        self._protocols[name] = func
+
+    def withdraw(self) -> None:
+        self._state = "withdrawn"
+
+    def deiconify(self) -> None:
+        self._state = "normal"
+
+    def state(self) -> str:
+        return self._state
+
+    def lift(self) -> None:
+        pass
+
+    def focus_force(self) -> None:
+        pass
+
+    def update_idletasks(self) -> None:
+        pass
+
+    def update(self) -> None:
+        """Run every callback that is due"""
+        now = time.monotonic()
+        while self._timers and self._timers[0][0] <= now:
+            _, after_id, func, args = heapq.heappop(self._timers)
+            if after_id in self._cancelled:
+                self._cancelled.discard(after_id)
+                continue
+            func(*args)
+
+    def mainloop(self, n: int = 0) -> None:
+        self._quit = False
+        while not self._quit:
+            self.update()
+            delay = self._timers[0][0] - time.monotonic() if self._timers else 0.05
+            time.sleep(min(max(delay, 0.0), 0.05))
+
+    def quit(self) -> None:
+        self._quit = True
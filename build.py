@@ -74,6 +74,17 @@ def build_executable():
         print(f"❌ Build failed: {e}")
         sys.exit(1)
 
+def build_icon_atlas():
+    """Prerender every icon at the sizes the UI uses into assets/atlas"""
+    print("Prerendering icon atlas...")
+    try:
+        from src.ui.atlas import build_atlas
+        summary = build_atlas()
+        print(f"✅ Icon atlas: {summary['images']} images, {summary['bytes'] // 1024} KB")
+    except Exception as e:
+        # The app falls back to decoding the PNGs, so this is not fatal
+        print(f"⚠️ Icon atlas skipped: {e}")
+
 def create_spec_file():
     """Create a custom .spec file for more control"""
     spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
@@ -166,6 +177,9 @@ def main():
     # Clean previous builds
     clean_build()
     
+    # Prerender icons; assets/atlas is bundled with the rest of assets/
+    build_icon_atlas()
+    
     # Create and build from spec file for better control
     spec_file = create_spec_file()
     build_from_spec(spec_file)
@@ -1,9 +1,21 @@
 """
 Source package
 """
-from src.config import ConfigManager
-from src.constants import *
+
+# Resolved on first use so `import src.launcher` stays cheap for the
+# second-launch fast path
+def __getattr__(name):
+    if name in ("ConfigManager", "ConfigSnapshot"):
+        import src.config
+        return getattr(src.config, name)
+    import src.constants
+    try:
+        return getattr(src.constants, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
 
 __all__ = [
     "ConfigManager",
+    "ConfigSnapshot",
 ]
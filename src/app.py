@@ -0,0 +1,513 @@
+"""
+ShutEye main application window
+"""
+import customtkinter as ctk
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+# Import configuration and utilities
+from src.config import ConfigManager
+from src.constants import (
+    CONFIG_FILE, CONFIG_LAYERS, CONFIG_CACHE_FILE, APP_LOGO, JOURNAL_FILE,
+    PREFERENCES_FILE, CAPABILITIES_FILE
+)
+from src.preferences import Preferences
+from src.ui.screens import SetupScreen, ActiveScreen, SettingsScreen
+from src.timer import TimerController, ScheduledTimer
+from src.ui.bus import UpdateBus
+
+# Set appearance mode and color theme
+ctk.set_appearance_mode("dark")
+ctk.set_default_color_theme("blue")
+
+
+class TimerApp(ctk.CTk):
+    """Main application window"""
+
+    def __init__(self):
+        super().__init__()
+
+        # Load configuration: bundled file, system and user overrides, env
+        self.config = ConfigManager(
+            CONFIG_FILE, CONFIG_LAYERS, environ=os.environ, cache_path=CONFIG_CACHE_FILE
+        )
+
+        # Window configuration
+        window = self.config.snapshot.window
+        self.title("ShutEye")
+        self.geometry(f"{window.width}x{window.height}")
+        self.resizable(window.resizable, True)
+
+        # Set icon if available
+        try:
+            self.iconbitmap(APP_LOGO)
+        except Exception:
+            pass  # Icon setting failed, continue
+
+        # Single channel for work coming from background threads
+        self.bus = UpdateBus(self.after)
+
+        # Timer state: countdown, scheduled actions and crash journal
+        self.timer = TimerController(
+            self.config, post=self.bus.post, journal_path=JOURNAL_FILE,
+            publish=self.bus.publish
+        )
+        self.timer.on_tick = self._on_tick
+        self.timer.on_expire = self.execute_action
+        self.timer.on_clock_change = self._on_tick
+
+        # Last session's action, duration and keep-screen-on choice; changes
+        # are saved from a background thread once clicking stops
+        self.preferences = Preferences(PREFERENCES_FILE)
+        self.keep_screen_on = self.preferences.get("keep_screen_on", False)
+        action = self.preferences.get("selected_action")
+        if action in {a.name for a in self.config.snapshot.actions}:
+            self.timer.selected_action = action
+        last_duration = self.preferences.get("last_duration")
+        if last_duration:
+            self.timer.set_duration(min(last_duration, self.config.snapshot.timer.max_duration))
+
+        # While withdrawn to the tray no widget is touched; only the tray
+        # tooltip and badge are refreshed, every update_interval seconds
+        self.window_hidden = False
+        self.tray_manager = None
+        self.tray_running = False
+        self.tray_update_interval = self.config.snapshot.tray.update_interval
+
+        # Theme configuration
+        theme = self.config.snapshot.theme
+        self.primary_color = theme.primary_color
+        self.bg_dark = theme.bg_dark
+        self.card_bg = theme.card_bg
+
+        # Configure window background
+        self.configure(fg_color=self.bg_dark)
+
+        # Screen inhibitor for keep screen on feature, created on first use
+        self._screen_inhibitor = None
+
+        # What works on this machine; probed in the background after startup
+        self.capabilities = None
+
+        # Initialize screens; each builds its widgets on first show and is kept
+        self.setup_screen = SetupScreen(self)
+        self.active_screen = ActiveScreen(self)
+        self.settings_screen = SettingsScreen(self)
+        self.current_screen = None
+
+        # Resume a timer that survived a crash, otherwise show setup screen first
+        restored = self.timer.restore()
+        if restored:
+            self.show_active_screen()
+            if restored["running"]:
+                self.start_timer()
+        else:
+            self.show_setup_screen()
+
+        # The control socket and the tray (pystray, icon decoding)
+        # are not needed for the first frame; they start in the background
+        # once the window is on screen
+        self.control = None
+        self.config_watcher = None
+        self.first_paint_time: Optional[float] = None
+        # Sections, rebuilt parts and latency of the latest config reload
+        self.last_reload: Optional[dict] = None
+        self.bind("<Map>", self._on_first_map, add="+")
+
+        # Handle window close event
+        self.protocol("WM_DELETE_WINDOW", self.on_window_close)
+
+    @property
+    def screen_inhibitor(self):
+        """Keep-screen-on inhibitor; its platform module loads on first use"""
+        if self._screen_inhibitor is None:
+            from src.utils.system_actions import ScreenInhibitor
+            paths = self.capabilities.inhibitors if self.capabilities else None
+            self._screen_inhibitor = ScreenInhibitor(paths)
+        return self._screen_inhibitor
+
+    @property
+    def unsupported_actions(self) -> Dict[str, str]:
+        """Actions the capability probe found cannot run, with the reasons"""
+        return self.capabilities.unsupported if self.capabilities else {}
+
+    @property
+    def is_running(self) -> bool:
+        """True while the countdown deadline is armed"""
+        return self.timer.is_running
+
+    @property
+    def remaining_seconds(self) -> int:
+        """Remaining time in whole seconds, derived from the deadline"""
+        return self.timer.remaining_seconds
+
+    @property
+    def total_seconds(self) -> int:
+        """Configured countdown length"""
+        return self.timer.total_seconds
+
+    @property
+    def selected_action(self) -> str:
+        """Action the countdown will run"""
+        return self.timer.selected_action
+
+    def show_setup_screen(self) -> None:
+        """Display the timer setup screen"""
+        self._switch_screen(self.setup_screen)
+
+    def show_active_screen(self) -> None:
+        """Display the active timer screen"""
+        self._switch_screen(self.active_screen)
+
+    def show_settings_screen(self) -> None:
+        """Display the settings screen"""
+        self._switch_screen(self.settings_screen)
+
+    def _switch_screen(self, screen) -> None:
+        """Hide the current screen and show (or refresh) another"""
+        if self.current_screen is not screen:
+            if self.current_screen is not None:
+                self.current_screen.hide()
+            self.current_screen = screen
+        screen.show()
+
+    def show_window(self) -> None:
+        """Bring the window back from the tray and focus it"""
+        if self.window_hidden:
+            # Resume per-second ticks and bring every label up to date at once
+            self.window_hidden = False
+            self.timer.set_tick_interval(1)
+            if self.current_screen:
+                self.current_screen.refresh()
+        self.deiconify()
+        self.lift()
+        self.focus_force()
+
+    def hide_window(self) -> None:
+        """Withdraw the window to the tray and stop updating widgets"""
+        self.withdraw()
+        if not self.window_hidden:
+            self.window_hidden = True
+            self.timer.set_tick_interval(self.tray_update_interval)
+            self._update_tray()
+
+    def select_action(self, action: str) -> None:
+        """Handle action selection"""
+        self.timer.selected_action = action
+        self.preferences.set("selected_action", action)
+        # Update action cards without reloading the screen
+        if hasattr(self.setup_screen, 'update_action_selection'):
+            self.setup_screen.update_action_selection(action)
+
+    def add_time(self, seconds: int) -> None:
+        """Add time to the timer during setup"""
+        # Ensure time doesn't go below minimum (60 seconds)
+        self.timer.set_duration(self.total_seconds + seconds)
+        self.preferences.set("last_duration", self.total_seconds)
+        self.setup_screen.update_display()
+
+    def set_keep_screen_on(self, enabled: bool) -> None:
+        """Keep-screen-on checkbox changed"""
+        self.keep_screen_on = enabled
+        self.preferences.set("keep_screen_on", enabled)
+
+    def start_timer_from_setup(self) -> None:
+        """Start timer and switch to active screen"""
+        reason = self.unsupported_actions.get(self.selected_action)
+        if reason:
+            from tkinter import messagebox
+            if not messagebox.askyesno(
+                "Action unavailable",
+                f"{self.selected_action} does not work on this system ({reason}).\n"
+                "Start the timer anyway?"
+            ):
+                return
+        self.timer.set_duration(self.total_seconds)
+        self.show_active_screen()
+        self.start_timer()
+
+    def change_action(self, action: str) -> None:
+        """Change the selected action during countdown"""
+        self.timer.change_action(action)
+        self.preferences.set("selected_action", action)
+        self._update_tray()
+        if self.window_hidden:
+            return  # show_window() refreshes the screens
+        self.setup_screen.update_action_selection(action)
+        self.active_screen.update_display()
+
+    def slider_changed(self, value: float) -> None:
+        """Handle slider value change"""
+        if not self.is_running:
+            self.timer.set_duration(int(value))
+            self.preferences.set("last_duration", self.total_seconds)
+            self.active_screen.update_display()
+
+    def add_time_active(self, seconds: int) -> None:
+        """Add or subtract time during active countdown"""
+        # Shift the deadline, never below minimum (60 seconds)
+        self.timer.adjust(seconds)
+        self._update_tray()
+        if not self.window_hidden:
+            self.active_screen.update_display()
+
+    def arm(self, seconds: int, action: Optional[str] = None) -> None:
+        """Start a fresh countdown, replacing any current one"""
+        if self.is_running:
+            self.pause_timer()
+        if action:
+            self.select_action(action)
+        reason = self.unsupported_actions.get(self.selected_action)
+        if reason:
+            print(f"Warning: {self.selected_action} does not work on this system ({reason})")
+        self.timer.set_duration(seconds)
+        self.preferences.set("last_duration", self.total_seconds)
+        self.show_active_screen()
+        self.start_timer()
+
+    def start_timer(self) -> None:
+        """Start the countdown timer"""
+        if not self.is_running:
+            self.timer.start()
+            self.active_screen.update_play_pause_btn(True)
+            self._update_tray()
+
+            # Enable screen inhibitor if keep_screen_on is enabled
+            if self.keep_screen_on:
+                success = self.screen_inhibitor.inhibit()
+                if success:
+                    print("Screen will stay on during timer")
+                else:
+                    print("Warning: Could not enable keep screen on")
+
+    def toggle_timer(self) -> None:
+        """Toggle between play and pause"""
+        if self.is_running:
+            self.pause_timer()
+        else:
+            self.start_timer()
+
+    def pause_timer(self) -> None:
+        """Pause the timer"""
+        self.timer.pause()
+        self.active_screen.update_play_pause_btn(False)
+        self._update_tray()
+
+        # Disable screen inhibitor when paused
+        self._allow_screen_off()
+
+    def reset_timer(self) -> None:
+        """Reset timer to initial value"""
+        self.timer.reset()
+        self.active_screen.update_play_pause_btn(False)
+        self.active_screen.update_display()
+        self._update_tray()
+
+        # Disable screen inhibitor when reset
+        self._allow_screen_off()
+
+    def stop_timer(self) -> None:
+        """Stop timer and return to setup"""
+        self.timer.cancel()
+        self._update_tray()
+
+        # Disable screen inhibitor when stopped
+        self._allow_screen_off()
+
+        self.show_setup_screen()
+
+    def _on_tick(self) -> None:
+        """Countdown tick or clock change: refresh the display"""
+        if not self.window_hidden:
+            self.active_screen.update_display()
+        self._update_tray()
+
+    def _update_tray(self) -> None:
+        """Show the countdown on the tray badge and tooltip"""
+        if not self.tray_manager:
+            return
+        remaining = self.remaining_seconds if self.is_running else None
+        # Both only change, and redraw, when the displayed minute does
+        self.tray_manager.update_badge(remaining)
+        if remaining is not None:
+            minutes = -(-remaining // 60)
+            message = f"ShutEye - {self.selected_action} in {minutes} min"
+        else:
+            message = "ShutEye - System Timer"
+        self.tray_manager.update_tooltip(message)
+
+    def schedule_action(self, action: str, seconds: int, label: str = "") -> ScheduledTimer:
+        """Schedule an independent action alongside the main countdown"""
+        timer = self.timer.schedule(action, seconds, label)
+        if self.tray_manager:
+            self.tray_manager.refresh_menu()
+        return timer
+
+    def cancel_scheduled(self, timer_id: int) -> bool:
+        """Cancel a scheduled action"""
+        cancelled = self.timer.cancel_scheduled(timer_id)
+        if cancelled and self.tray_manager:
+            self.tray_manager.refresh_menu()
+        return cancelled
+
+    def execute_action(self) -> None:
+        """Execute the selected system action"""
+        # Disable screen inhibitor before executing action
+        self._allow_screen_off()
+
+        self.timer.fire()
+
+    def on_window_close(self) -> None:
+        """Handle window close event - minimize to tray if available"""
+        if self.tray_manager and self.tray_manager.icon:
+            # Hide window and start tray icon if not already running
+            self.hide_window()
+            if not self.tray_running:
+                self.tray_running = True
+                # Start tray in non-daemon thread to keep app alive
+                tray_thread = threading.Thread(target=self._run_tray_loop, daemon=False)
+                tray_thread.start()
+        else:
+            # No tray available, ask to quit
+            if self.is_running:
+                from tkinter import messagebox
+                if messagebox.askyesno("Confirm", "Timer is running. Stop and exit?"):
+                    self.quit_app()
+            else:
+                self.quit_app()
+
+    def quit_app(self) -> None:
+        """Exit on user request, discarding pending timers"""
+        # A deliberate exit cancels everything; only crashes are recovered
+        if self.control:
+            self.control.close()
+        if self.config_watcher:
+            self.config_watcher.close()
+        self.timer.close()
+        self.preferences.close()
+        self.bus.close()
+        self.quit()
+
+    def _allow_screen_off(self) -> None:
+        """Release the keep-screen-on inhibitor if it was ever taken"""
+        if self._screen_inhibitor:
+            self._screen_inhibitor.uninhibit()
+
+    def _on_first_map(self, event) -> None:
+        """Window is on screen: start the deferred setup"""
+        if event.widget is not self or self.first_paint_time is not None:
+            return
+        self.first_paint_time = time.perf_counter()
+        self.after_idle(lambda: threading.Thread(
+            target=self._finish_startup, name="ShutEye-startup", daemon=True
+        ).start())
+
+    def _finish_startup(self) -> None:
+        """Background thread: control socket, tray, config watcher and capabilities"""
+        # Control socket for the CLI and second launches
+        from src.control.protocol import handle_request
+        from src.control.server import ControlServer
+        control = ControlServer(lambda request: handle_request(self, request), self.bus)
+        if not control.start():
+            print(f"Control socket {control.path} unavailable")
+
+        # System tray setup; decodes the icon and renders the badge glyphs
+        tray_manager = None
+        try:
+            from src.tray import TrayManager, PYSTRAY_AVAILABLE
+            if PYSTRAY_AVAILABLE:
+                tray_manager = TrayManager(self, APP_LOGO)
+                tray_manager.setup_tray()
+        except Exception as e:
+            print(f"Could not setup system tray: {e}")
+            import traceback
+            traceback.print_exc()
+
+        # Reload the configuration when any of its files is edited
+        from src.config_watch import ConfigWatcher
+        watcher = ConfigWatcher(self.config.sources, self._reload_config)
+        watcher.start()
+
+        self.bus.post(self._startup_finished, control, tray_manager, watcher)
+
+        # Which actions can run here: probed once per boot, then cached. It
+        # may wait on D-Bus, so it runs after the rest has been handed over.
+        # The executor starts with the backend that passed and connects it now
+        try:
+            from src.utils.capabilities import load_capabilities
+            from src.utils.system_actions import SystemActionExecutor
+            capabilities = load_capabilities(CAPABILITIES_FILE)
+            executor = SystemActionExecutor.from_capabilities(capabilities)
+            executor.prepare()
+            SystemActionExecutor.configure(executor)
+        except Exception as e:
+            print(f"Capability probe failed: {e}")
+            return
+        self.bus.post(self._capabilities_ready, capabilities)
+
+    def _startup_finished(self, control, tray_manager, watcher) -> None:
+        """Adopt the control server, tray and watcher created in the background"""
+        self.control = control
+        self.tray_manager = tray_manager
+        self.config_watcher = watcher
+        self._update_tray()
+
+    def _capabilities_ready(self, capabilities) -> None:
+        """Adopt the capability probe: inhibitor paths and unavailable actions"""
+        self.capabilities = capabilities
+        if self._screen_inhibitor:
+            self._screen_inhibitor.paths = capabilities.inhibitors
+        for action, reason in capabilities.unsupported.items():
+            print(f"{action} unavailable: {reason}")
+        self.setup_screen.update_unsupported()
+
+    def _reload_config(self, detected: float) -> None:
+        """Watcher thread: parse the edited file and pass the diff to Tk"""
+        try:
+            config, snapshot = self.config.read()
+        except (OSError, ValueError) as e:
+            print(f"Config not reloaded: {e}")
+            return
+        changed = self.config.snapshot.changed(snapshot)
+        if changed:
+            self.bus.publish("config", self._apply_config, config, snapshot, changed, detected)
+
+    def _apply_config(self, config: dict, snapshot, changed: set, detected: float) -> None:
+        """Install a reloaded config and update only what it affects"""
+        self.config.install(config, snapshot)
+        if "theme" in changed:
+            self.primary_color = snapshot.theme.primary_color
+            self.bg_dark = snapshot.theme.bg_dark
+            self.card_bg = snapshot.theme.card_bg
+            self.configure(fg_color=self.bg_dark)
+        if "window" in changed:
+            self.geometry(f"{snapshot.window.width}x{snapshot.window.height}")
+            self.resizable(snapshot.window.resizable, True)
+        if "tray" in changed:
+            self.tray_update_interval = snapshot.tray.update_interval
+            if self.window_hidden:
+                self.timer.set_tick_interval(self.tray_update_interval)
+        self.timer.apply_config(changed)
+
+        rebuilt = []
+        for screen in (self.setup_screen, self.active_screen, self.settings_screen):
+            rebuilt += screen.apply_config(changed)
+        if self.current_screen and not self.window_hidden:
+            self.current_screen.refresh()
+
+        latency_ms = (time.perf_counter() - detected) * 1000
+        self.last_reload = {
+            "sections": sorted(changed), "rebuilt": rebuilt, "latency_ms": latency_ms
+        }
+        print(f"Config reloaded ({', '.join(sorted(changed))}) in {latency_ms:.1f} ms, "
+              f"rebuilt: {', '.join(rebuilt) or 'nothing'}")
+
+    def _run_tray_loop(self) -> None:
+        """Run tray icon in a way that keeps app alive"""
+        try:
+            if self.tray_manager and self.tray_manager.icon:
+                self.tray_manager.run_tray()
+        except Exception as e:
+            print(f"Tray error: {e}")
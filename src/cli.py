@@ -0,0 +1,77 @@
+"""
+Command-line argument parsing
+"""
+import argparse
+from typing import List, Optional
+
+from src.constants import ACTION_ICONS
+from src.utils.time_utils import parse_duration
+
+
+def _duration(text: str) -> int:
+    """argparse type for durations like "30m" or "1h30m" """
+    try:
+        return parse_duration(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+class _ForwardedParser(argparse.ArgumentParser):
+    """Parser for a forwarded command line: report errors, never exit"""
+
+    def error(self, message: str):
+        raise ValueError(message)
+
+
+def build_parser(parser_class: type = argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Build the shuteye argument parser"""
+    parser = parser_class(
+        prog="shuteye", description="Schedule system actions with a timer"
+    )
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="run the timer engine without the GUI (daemon mode)"
+    )
+    timing = parser.add_mutually_exclusive_group()
+    timing.add_argument(
+        "--in", dest="duration", type=_duration, metavar="DURATION",
+        help='start a countdown, e.g. "30m", "1h30m" or "90s" (bare numbers are minutes)'
+    )
+    parser.add_argument(
+        "--action", choices=list(ACTION_ICONS),
+        help="action to run when the countdown ends or the --schedule comes due"
+    )
+    timing.add_argument(
+        "--schedule", type=_duration, metavar="DURATION",
+        help='run --action once after DURATION, alongside the countdown, e.g. "2h"'
+    )
+    parser.add_argument(
+        "--label", default="",
+        help="name shown for a --schedule action in status and the tray"
+    )
+    parser.add_argument(
+        "--unschedule", type=int, metavar="ID",
+        help="cancel the scheduled action with this timer ID (see the status command)"
+    )
+    return parser
+
+
+def _parse(parser: argparse.ArgumentParser, argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parse argv, checking the options argparse cannot tie together"""
+    args = parser.parse_args(argv)
+    if args.schedule and not args.action:
+        parser.error("--schedule requires --action")
+    return args
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments"""
+    return _parse(build_parser(), argv)
+
+
+def parse_forwarded(argv: List[str]) -> argparse.Namespace:
+    """Parse a second launch's arguments inside the running instance
+
+    Raises ValueError instead of exiting the process.
+    """
+    return _parse(build_parser(_ForwardedParser), argv)
@@ -1,43 +1,452 @@
 """
 Configuration management module
+
+The bundled config.json is the base; optional override files and
+SHUTEYE_<SECTION>__<KEY> environment variables are merged over it, and
+the result is validated once per load into a ConfigSnapshot: read-only,
+__slots__-backed sections with typed attributes, plus a flat table of
+every dotted key so get("timer.min_duration") is one dict lookup.
+
+The merged, validated result is cached with marshal, keyed on the mtime
+and size of every source file and on the environment overrides, so an
+unchanged setup loads without parsing JSON or validating anything.
 """
 import json
+import marshal
+import os
+import sys
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+# Bump when the snapshot's fields change so old caches are ignored
+CACHE_VERSION = 2
+
+# Same values as src.timer.clock, which imports this module
+CLOCK_MODES = ("awake", "wall")
+
+THEME_KEYS = (
+    "appearance_mode", "color_theme", "primary_color", "bg_dark",
+    "card_bg", "accent_color", "text_primary", "text_secondary",
+)
+
+
+class _Frozen:
+    """Base for snapshot sections: attributes are set once in __init__"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _set(self, **values: Any) -> None:
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def _values(self) -> tuple:
+        """Slot values in order, for the marshal cache"""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    @classmethod
+    def _restore(cls, values: Iterable[Any]):
+        """Rebuild from _values() output without validating"""
+        obj = cls.__new__(cls)
+        for name, value in zip(cls.__slots__, values):
+            object.__setattr__(obj, name, value)
+        return obj
+
+
+def _section(config: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """A top-level object, {} when absent"""
+    value = config.get(name, {})
+    if not isinstance(value, dict):
+        raise ValueError(f"Config '{name}' must be an object")
+    return value
+
+
+def _int(section: Dict[str, Any], path: str, key: str, default: int, minimum: int = 0) -> int:
+    """Integer setting no smaller than minimum"""
+    value = section.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+        raise ValueError(f"Config '{path}.{key}' must be an integer >= {minimum}, got {value!r}")
+    return value
+
+
+def _str(section: Dict[str, Any], path: str, key: str, default: str = "") -> str:
+    """String setting"""
+    value = section.get(key, default)
+    if not isinstance(value, str):
+        raise ValueError(f"Config '{path}.{key}' must be a string, got {value!r}")
+    return value
+
+
+class TimerSettings(_Frozen):
+    """Countdown limits and clock mode"""
+
+    __slots__ = ("default_duration", "min_duration", "max_duration", "step_size", "clock_mode")
+
+    def __init__(self, timer: Dict[str, Any]):
+        min_duration = _int(timer, "timer", "min_duration", 60, 1)
+        max_duration = _int(timer, "timer", "max_duration", 86400, min_duration)
+        default_duration = _int(timer, "timer", "default_duration", 900, min_duration)
+        if default_duration > max_duration:
+            raise ValueError("Config 'timer.default_duration' is above 'timer.max_duration'")
+        clock_mode = _str(timer, "timer", "clock_mode", "awake")
+        if clock_mode not in CLOCK_MODES:
+            raise ValueError(f"Config 'timer.clock_mode' must be one of {CLOCK_MODES}, got {clock_mode!r}")
+        self._set(
+            default_duration=default_duration,
+            min_duration=min_duration,
+            max_duration=max_duration,
+            step_size=_int(timer, "timer", "step_size", 60, 1),
+            clock_mode=clock_mode,
+        )
+
+
+class ThemeSettings(_Frozen):
+    """Appearance mode and colours"""
+
+    __slots__ = THEME_KEYS
+
+    def __init__(self, theme: Dict[str, Any]):
+        for key in ("primary_color", "bg_dark", "card_bg"):
+            if key not in theme:
+                raise ValueError(f"Config 'theme.{key}' is missing")
+        self._set(**{key: _str(theme, "theme", key) for key in THEME_KEYS})
+
+
+class WindowSettings(_Frozen):
+    """Initial and minimum window size"""
+
+    __slots__ = ("width", "height", "resizable", "min_width", "min_height")
+
+    def __init__(self, window: Dict[str, Any]):
+        resizable = window.get("resizable", False)
+        if not isinstance(resizable, bool):
+            raise ValueError(f"Config 'window.resizable' must be true or false, got {resizable!r}")
+        self._set(
+            width=_int(window, "window", "width", 850, 1),
+            height=_int(window, "window", "height", 650, 1),
+            resizable=resizable,
+            min_width=_int(window, "window", "min_width", 0),
+            min_height=_int(window, "window", "min_height", 0),
+        )
+
+
+class TraySettings(_Frozen):
+    """Tray refresh rate while the window is hidden"""
+
+    __slots__ = ("update_interval",)
+
+    def __init__(self, tray: Dict[str, Any]):
+        self._set(update_interval=_int(tray, "tray", "update_interval", 30, 1))
+
+
+class ActionSpec(_Frozen):
+    """One system action card"""
+
+    __slots__ = ("name", "icon", "description")
+
+    def __init__(self, action: Dict[str, Any], index: int):
+        path = f"actions[{index}]"
+        if not isinstance(action, dict) or not action.get("name"):
+            raise ValueError(f"Config '{path}' must be an object with a name")
+        self._set(
+            name=_str(action, path, "name"),
+            icon=_str(action, path, "icon"),
+            description=_str(action, path, "description"),
+        )
+
+
+class QuickTime(_Frozen):
+    """One quick-add preset"""
+
+    __slots__ = ("label", "seconds")
+
+    def __init__(self, item: Dict[str, Any], index: int):
+        path = f"quick_times[{index}]"
+        if not isinstance(item, dict):
+            raise ValueError(f"Config '{path}' must be an object")
+        self._set(label=_str(item, path, "label"), seconds=_int(item, path, "seconds", 0, 1))
+
+
+class ConfigSnapshot(_Frozen):
+    """Validated, read-only view of one load of the config file
+
+    Raises ValueError naming the offending key when a value has the wrong
+    type or is out of range.
+    """
+
+    __slots__ = ("timer", "theme", "window", "tray", "actions", "quick_times", "_paths")
+
+    def __init__(self, config: Dict[str, Any]):
+        actions = config.get("actions", [])
+        quick_times = config.get("quick_times", [])
+        if not isinstance(actions, list) or not isinstance(quick_times, list):
+            raise ValueError("Config 'actions' and 'quick_times' must be lists")
+        self._set(
+            timer=TimerSettings(_section(config, "timer")),
+            theme=ThemeSettings(_section(config, "theme")),
+            window=WindowSettings(_section(config, "window")),
+            tray=TraySettings(_section(config, "tray")),
+            actions=tuple(ActionSpec(a, i) for i, a in enumerate(actions)),
+            quick_times=tuple(QuickTime(q, i) for i, q in enumerate(quick_times)),
+            _paths=dict(_flatten(config)),
+        )
+
+    def lookup(self, key: str, default: Any = None) -> Any:
+        """Value at a dotted key, default when missing or null"""
+        value = self._paths.get(key)
+        return default if value is None else value
+
+    def to_state(self) -> tuple:
+        """Plain tuples, dicts and lists that marshal can store"""
+        return (
+            self.timer._values(), self.theme._values(), self.window._values(),
+            self.tray._values(),
+            tuple(a._values() for a in self.actions),
+            tuple(q._values() for q in self.quick_times),
+            self._paths,
+        )
+
+    @classmethod
+    def from_state(cls, state: tuple) -> "ConfigSnapshot":
+        """Rebuild a snapshot from to_state() output; no validation"""
+        timer, theme, window, tray, actions, quick_times, paths = state
+        return cls._restore((
+            TimerSettings._restore(timer),
+            ThemeSettings._restore(theme),
+            WindowSettings._restore(window),
+            TraySettings._restore(tray),
+            tuple(ActionSpec._restore(a) for a in actions),
+            tuple(QuickTime._restore(q) for q in quick_times),
+            paths,
+        ))
+
+    def changed(self, other: "ConfigSnapshot") -> Set[str]:
+        """Top-level keys whose value differs in other"""
+        return {
+            key for key in self._paths.keys() | other._paths.keys()
+            if "." not in key and self._paths.get(key) != other._paths.get(key)
+        }
+
+
+def _flatten(node: Dict[str, Any], prefix: str = ""):
+    """(dotted key, value) for every key reachable through objects"""
+    for key, value in node.items():
+        path = f"{prefix}{key}"
+        yield path, value
+        if isinstance(value, dict):
+            yield from _flatten(value, path + ".")
+
+
+def merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Objects merge key by key; any other value replaces the base's"""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def env_overrides(environ: Mapping[str, str], prefix: str = "SHUTEYE_") -> Tuple[Tuple[str, str], ...]:
+    """(dotted key, raw value) for every prefixed variable, sorted
+
+    SHUTEYE_TIMER__MIN_DURATION=120 sets timer.min_duration; values are
+    read as JSON where they parse, as strings otherwise.
+    """
+    return tuple(sorted(
+        (name[len(prefix):].lower().replace("__", "."), value)
+        for name, value in environ.items()
+        if name.startswith(prefix) and len(name) > len(prefix)
+    ))
+
+
+def _env_layer(overrides: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+    """Nested config object from env_overrides() pairs"""
+    layer: Dict[str, Any] = {}
+    for key, raw in overrides:
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw
+        *parents, leaf = key.split(".")
+        node = layer
+        for part in parents:
+            node = node.setdefault(part, {})
+            if not isinstance(node, dict):
+                raise ValueError(f"Environment override {key} conflicts with another")
+        node[leaf] = value
+    return layer
+
+
+def _merge_valid(
+    config: Dict[str, Any],
+    layers: Iterable[Tuple[str, Callable[[], Dict[str, Any]]]]
+) -> Tuple[Dict[str, Any], ConfigSnapshot, bool]:
+    """Merge each (name, load) layer that keeps the result valid
+
+    The base config must validate; a layer that fails to load or validate
+    is reported and left out. The flag is True if any was.
+    """
+    snapshot = ConfigSnapshot(config)
+    dropped = False
+    for name, load in layers:
+        try:
+            merged = merge(config, load())
+            candidate = ConfigSnapshot(merged)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring config override {name}: {e}")
+            dropped = True
+            continue
+        config, snapshot = merged, candidate
+    return config, snapshot, dropped
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    """One config file as an object"""
+    try:
+        with open(path, "r") as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found at {path}")
+    except json.JSONDecodeError:
+        raise ValueError(f"Invalid JSON in config file: {path}")
+    if not isinstance(config, dict):
+        raise ValueError(f"Config file must contain an object: {path}")
+    return config
 
 
 class ConfigManager:
-    """Manages application configuration from JSON file"""
+    """Manages application configuration from JSON files
+
+    config_path is the bundled base and must exist; each of overrides that
+    exists is merged over it in order, then the environment overrides.
+    load() drops an override that does not parse or validate, with a
+    warning, so a bad user file cannot stop the app from starting.
+    With a cache_path, a load whose sources are unchanged since the last
+    one is served from the marshal cache.
+    """
 
-    def __init__(self, config_path: Path):
+    def __init__(
+        self,
+        config_path: Path,
+        overrides: Sequence[Path] = (),
+        environ: Optional[Mapping[str, str]] = None,
+        cache_path: Optional[Path] = None
+    ):
         self.config_path = config_path
+        self.overrides = [Path(p) for p in overrides]
+        self.env_overrides = env_overrides(environ or {})
+        self.cache_path = cache_path
+        self.cache_hit = False
         self.config: Dict[str, Any] = {}
+        self.snapshot: ConfigSnapshot
         self.load()
 
+    @property
+    def sources(self) -> List[Path]:
+        """Every file that feeds the configuration, base first"""
+        return [Path(self.config_path)] + self.overrides
+
     def load(self) -> None:
-        """Load configuration from JSON file"""
+        """Load configuration from the JSON files, skipping bad overrides"""
+        self.install(*self.read(strict=False))
+
+    def read(self, strict: bool = True) -> Tuple[Dict[str, Any], ConfigSnapshot]:
+        """Merge and validate the sources without applying them (any thread)
+
+        Raises ValueError for any bad source; with strict=False only for
+        the base file, and each bad override is left out instead.
+        """
+        key = self._cache_key()
+        cached = self._read_cache(key)
+        self.cache_hit = cached is not None
+        if cached:
+            return cached
+
+        config = _read_json(self.config_path)
+        paths = [path for path in self.overrides if path.exists()]
+        if strict:
+            for path in paths:
+                config = merge(config, _read_json(path))
+            if self.env_overrides:
+                config = merge(config, _env_layer(self.env_overrides))
+            snapshot = ConfigSnapshot(config)
+        else:
+            # One layer per file and per variable, so one bad entry drops alone
+            layers = [(str(path), partial(_read_json, path)) for path in paths]
+            layers += [
+                (f"SHUTEYE_{key.upper().replace('.', '__')}", partial(_env_layer, [(key, raw)]))
+                for key, raw in self.env_overrides
+            ]
+            config, snapshot, dropped = _merge_valid(config, layers)
+            if dropped:
+                return config, snapshot  # not cached, so the warning repeats
+        self._write_cache(key, snapshot)
+        return config, snapshot
+
+    def _cache_key(self) -> tuple:
+        """Identity of the current sources: (path, mtime ns, size) each"""
+        stats = []
+        for path in self.sources:
+            try:
+                st = os.stat(path)
+                stats.append((str(path), st.st_mtime_ns, st.st_size))
+            except OSError:
+                stats.append((str(path), None, None))
+        return (CACHE_VERSION, sys.implementation.cache_tag, tuple(stats), self.env_overrides)
+
+    def _read_cache(self, key: tuple) -> Optional[Tuple[Dict[str, Any], ConfigSnapshot]]:
+        """Cached (config, snapshot) for key, None on a miss"""
+        if not self.cache_path:
+            return None
         try:
-            with open(self.config_path, "r") as f:
-                self.config = json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Config file not found at {self.config_path}")
-        except json.JSONDecodeError:
-            raise ValueError(f"Invalid JSON in config file: {self.config_path}")
+            with open(self.cache_path, "rb") as f:
+                # One read; marshal.load() on a file reads in small pieces
+                cached_key, state = marshal.loads(f.read())
+            if cached_key != key:
+                return None
+            snapshot = ConfigSnapshot.from_state(state)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        config = {k: v for k, v in snapshot._paths.items() if "." not in k}
+        return config, snapshot
 
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value by key (supports dot notation)"""
-        keys = key.split(".")
-        value = self.config
+    def _write_cache(self, key: tuple, snapshot: ConfigSnapshot) -> None:
+        """Store a validated snapshot for the next load; best effort"""
+        if not self.cache_path:
+            return
+        tmp = Path(f"{self.cache_path}.{os.getpid()}.tmp")
+        try:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(marshal.dumps((key, snapshot.to_state())))
+            os.replace(tmp, self.cache_path)
+        except (OSError, ValueError) as e:
+            print(f"Could not write config cache: {e}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
 
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
+    def install(self, config: Dict[str, Any], snapshot: ConfigSnapshot) -> None:
+        """Make a result of read() the current configuration"""
+        self.config = config
+        self.snapshot = snapshot
 
-        return value
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get configuration value by key (supports dot notation)"""
+        return self.snapshot.lookup(key, default)
 
     def get_app_info(self) -> Dict[str, str]:
         """Get app information (name, version, description)"""
@@ -59,6 +468,10 @@ class ConfigManager:
         """Get quick time presets"""
         return self.config.get("quick_times", [])
 
+    def get_schedules(self) -> list:
+        """Get recurring and absolute-time schedule rules"""
+        return self.config.get("schedules", [])
+
     def get_window_config(self) -> Dict[str, Any]:
         """Get window configuration"""
         return self.config.get("window", {})
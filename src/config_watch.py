@@ -0,0 +1,195 @@
+"""
+Config file change detection
+"""
+import ctypes
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+# Linux inotify constants
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len; the name follows
+
+
+def file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime in ns, size) of a file, None if it does not exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class ConfigWatcher:
+    """Calls on_change(detected) when any of the watched files changes
+
+    On Linux the files' directories are watched with inotify, so saves made
+    by writing in place and by renaming a temporary file over the original
+    are both seen, and the thread blocks without polling. A directory that
+    does not exist yet is waited for through its nearest existing parent,
+    so a user config created later is still picked up. Elsewhere, or if
+    inotify is unavailable, the files' mtime and size are polled every
+    poll_interval seconds. Changes are batched for `settle` seconds so an
+    editor's several writes give one call; `detected` is the
+    time.perf_counter() of the first of them. The callback runs on the
+    watcher thread.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        on_change: Callable[[float], None],
+        poll_interval: float = 1.0,
+        settle: float = 0.05
+    ):
+        self.paths = [Path(p) for p in paths]
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.settle = settle
+        self.event_driven = False
+        self._stop = threading.Event()
+        self._wake_fds: Optional[Tuple[int, int]] = None
+        self._fd: Optional[int] = None
+        self._libc = None
+        # watch descriptor -> names of watched files in that directory
+        self._watches: Dict[int, Set[str]] = {}
+        # watch descriptor -> names of missing directories on the way to one
+        self._ancestors: Dict[int, Set[str]] = {}
+
+    def start(self) -> None:
+        """Start the watcher thread, event driven where inotify is available"""
+        self.event_driven = self._open_inotify()
+        if self.event_driven:
+            self._wake_fds = os.pipe()
+            target, args = self._run_inotify, (self._wake_fds[0],)
+        else:
+            target, args = self._run_poll, ()
+        threading.Thread(target=target, args=args, name="ShutEye-config", daemon=True).start()
+
+    def close(self) -> None:
+        """Stop the watcher thread"""
+        self._stop.set()
+        # The thread closes its read end; the write end is only closed here
+        wake_fds, self._wake_fds = self._wake_fds, None
+        if wake_fds:
+            try:
+                os.write(wake_fds[1], b"x")
+            except OSError:
+                pass  # the thread has already stopped
+            os.close(wake_fds[1])
+
+    def _open_inotify(self) -> bool:
+        """Watch the files' directories; False if inotify cannot be used"""
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError, TypeError):
+            return False
+        if fd < 0:
+            return False
+
+        self._libc, self._fd = libc, fd
+        self._add_watches()
+        if not self._watches and not self._ancestors:
+            os.close(fd)
+            self._fd = None
+            return False
+        return True
+
+    def _add_watches(self) -> None:
+        """Watch each file's directory, or while it is missing its nearest existing ancestor"""
+        self._watches.clear()
+        self._ancestors.clear()
+        for path in self.paths:
+            directory, name, target = path.parent, path.name, self._watches
+            while True:
+                wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+                if wd >= 0:
+                    target.setdefault(wd, set()).add(name)
+                    break
+                if directory.parent == directory:
+                    break
+                directory, name, target = directory.parent, directory.name, self._ancestors
+
+    def _read_events(self) -> bool:
+        """Drain pending inotify events; True if one named a watched file
+
+        When a missing directory appears the watches move down to it, and
+        this counts as a hit since the file may already be inside.
+        """
+        hit = rescan = False
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                if rescan:
+                    self._add_watches()
+                return hit or rescan
+            offset = 0
+            while offset < len(data):
+                wd, _, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+                offset += length
+                hit = hit or name in self._watches.get(wd, ())
+                rescan = rescan or name in self._ancestors.get(wd, ())
+
+    def _run_inotify(self, wake_r: int) -> None:
+        """Block on inotify and report settled batches of changes"""
+        try:
+            while True:
+                readable, _, _ = select.select([self._fd, wake_r], [], [])
+                if wake_r in readable:
+                    return
+                if not self._read_events():
+                    continue
+                detected = time.perf_counter()
+                # Wait until the writes stop before reading the file
+                while True:
+                    readable, _, _ = select.select([self._fd, wake_r], [], [], self.settle)
+                    if wake_r in readable:
+                        return
+                    if not readable:
+                        break
+                    self._read_events()
+                self._notify(detected)
+        except OSError as e:
+            print(f"Config watcher stopped: {e}")
+        finally:
+            for fd in (self._fd, wake_r):
+                os.close(fd)
+
+    def _run_poll(self) -> None:
+        """Compare mtime and size of every file each poll_interval"""
+        signatures = [file_signature(p) for p in self.paths]
+        while not self._stop.wait(self.poll_interval):
+            current = [file_signature(p) for p in self.paths]
+            if current == signatures:
+                continue
+            detected = time.perf_counter()
+            if self._stop.wait(self.settle):
+                return
+            signatures = [file_signature(p) for p in self.paths]
+            self._notify(detected)
+
+    def _notify(self, detected: float) -> None:
+        """Run the callback, keeping the thread alive if it fails"""
+        try:
+            self.on_change(detected)
+        except Exception as e:
+            print(f"Config reload failed: {e}")
@@ -2,6 +2,7 @@
 Application constants and configuration paths
 """
 import os
+import sys
 from pathlib import Path
 
 # Base directory paths
@@ -11,6 +12,39 @@ ICONS_DIR = ASSETS_DIR / "icons"
 IMG_DIR = ASSETS_DIR / "img"
 CONFIG_FILE = BASE_DIR / "config.json"
 
+# Config layers applied over the bundled config.json, lowest priority first:
+# a machine-wide file (e.g. pushed to a fleet), then the user's own, then
+# SHUTEYE_<SECTION>__<KEY> environment variables
+if sys.platform == "win32":
+    _program_data = Path(os.environ.get("PROGRAMDATA", r"C:\ProgramData"))
+    _user_dir = Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming"))
+    _cache_dir = Path(os.environ.get("LOCALAPPDATA", _user_dir))
+    SYSTEM_CONFIG_FILE = _program_data / "ShutEye" / "config.json"
+    USER_CONFIG_FILE = _user_dir / "ShutEye" / "config.json"
+    CONFIG_CACHE_FILE = _cache_dir / "ShutEye" / "config.cache"
+elif sys.platform == "darwin":
+    _support = Path("Library") / "Application Support" / "ShutEye"
+    SYSTEM_CONFIG_FILE = Path("/") / _support / "config.json"
+    USER_CONFIG_FILE = Path.home() / _support / "config.json"
+    CONFIG_CACHE_FILE = Path.home() / "Library" / "Caches" / "ShutEye" / "config.cache"
+else:
+    _xdg_config = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
+    _xdg_cache = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    SYSTEM_CONFIG_FILE = Path("/etc/shuteye/config.json")
+    USER_CONFIG_FILE = _xdg_config / "shuteye" / "config.json"
+    CONFIG_CACHE_FILE = _xdg_cache / "shuteye" / "config.cache"
+CONFIG_LAYERS = (SYSTEM_CONFIG_FILE, USER_CONFIG_FILE)
+
+# Last action, duration and keep-screen-on choice, rewritten by the app
+PREFERENCES_FILE = USER_CONFIG_FILE.parent / "preferences.json"
+
+# Crash journal of pending timers; per user, since BASE_DIR of a one-file
+# build is a fresh temporary directory on every run
+JOURNAL_FILE = USER_CONFIG_FILE.parent / "timer_journal.jsonl"
+
+# Which actions and inhibitors work here, probed once per boot
+CAPABILITIES_FILE = CONFIG_CACHE_FILE.parent / "capabilities.json"
+
 # Icon paths
 ICON_POWER = str(ICONS_DIR / "power.png")
 ICON_REDO = str(ICONS_DIR / "redo.png")
@@ -27,6 +61,12 @@ ICON_LOCK = str(ICONS_DIR / "lock.png")
 # App logo
 APP_LOGO = str(IMG_DIR / "clock-logo.png")
 
+# Prerendered icon atlas (generated by build.py)
+ATLAS_DIR = ASSETS_DIR / "atlas"
+ATLAS_FILE = ATLAS_DIR / "icons.rgba"
+ATLAS_INDEX = ATLAS_DIR / "icons.json"
+ATLAS_SIZES = (20, 24, 32, 40, 64, 80)
+
 # Icon mapping
 ICON_MAP = {
     "power": ICON_POWER,
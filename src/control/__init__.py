@@ -0,0 +1,13 @@
+"""
+Control API for a running ShutEye instance
+
+Only the lightweight client is imported here. The request handling in
+src.control.protocol and the server in src.control.server are
+imported explicitly by the app and daemon, so clients never pay for them.
+"""
+from src.control.wire import socket_path, encode, decode
+from src.control.client import NotRunning, send_request
+
+__all__ = [
+    "socket_path", "encode", "decode", "send_request", "NotRunning",
+]
@@ -0,0 +1,42 @@
+"""
+Blocking client for the control socket
+
+Imports only socket and the wire framing, so it is cheap enough for the
+second-launch fast path.
+"""
+import socket
+
+from src.control.wire import socket_path, encode, decode
+
+
+class NotRunning(ConnectionError):
+    """Nothing is listening on the control socket"""
+
+
+def send_request(request: dict, path: str = None, timeout: float = 2.0) -> dict:
+    """Send one request to the running instance and return its response
+
+    Raises NotRunning if no instance can be listening (no socket, a stale
+    one, or no Unix-domain sockets on this platform) and OSError if one is
+    listening but the exchange fails.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise NotRunning("Unix-domain sockets are not available")
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        try:
+            sock.connect(str(path or socket_path()))
+        except socket.timeout:
+            raise  # a listener with a full backlog
+        except OSError as e:
+            raise NotRunning(str(e)) from e
+        sock.sendall(encode(request))
+        reader = sock.makefile("rb")
+        line = reader.readline()
+        if not line:
+            raise ConnectionError("Control socket closed without a response")
+        return decode(line)
+    finally:
+        sock.close()
@@ -0,0 +1,138 @@
+"""
+JSON-lines control protocol shared by the server and the client
+
+Each request and response is one JSON object per line:
+
+    {"cmd": "arm", "seconds": 1800, "action": "Lock"}
+    {"cmd": "add", "seconds": 300}
+    {"cmd": "pause"} / {"cmd": "resume"} / {"cmd": "cancel"}
+    {"cmd": "action", "action": "Sleep"}
+    {"cmd": "schedule", "seconds": 3600, "action": "Log Out", "label": "Lab"}
+    {"cmd": "unschedule", "timer": 3}
+    {"cmd": "show"} / {"cmd": "status"}
+    {"cmd": "launch", "argv": ["--in", "30m"]}   (a forwarded second launch)
+
+Responses carry "ok" and, on failure, "error". A schedule response also
+carries the new "timer" ID, which status lists under "scheduled". An "id"
+in the request is echoed back so pipelined clients can match responses.
+"""
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.constants import ACTION_ICONS
+from src.control.wire import socket_path
+
+
+def control_socket_path() -> Path:
+    """Per-user Unix socket path for the running instance"""
+    return Path(socket_path())
+
+
+def handle_request(target, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a request to a TimerApp or ShutEyeDaemon (on its own thread)"""
+    cmd = request.get("cmd")
+    try:
+        action = request.get("action")
+        if action is not None and action not in ACTION_ICONS:
+            raise ValueError(f"Unknown action: {action}")
+
+        timer_id = None
+        if cmd == "arm":
+            target.arm(check_duration(target.timer, int(request["seconds"])), action)
+        elif cmd == "add":
+            seconds = int(request["seconds"])
+            check_duration(target.timer, max(target.timer.remaining_seconds + seconds,
+                                             target.timer.min_duration))
+            target.add_time_active(seconds)
+        elif cmd == "pause":
+            target.pause_timer()
+        elif cmd == "resume":
+            target.start_timer()
+        elif cmd == "cancel":
+            target.stop_timer()
+        elif cmd == "action":
+            if action is None:
+                raise ValueError("Missing action")
+            target.change_action(action)
+        elif cmd == "show":
+            target.show_window()
+        elif cmd == "launch":
+            launch(target, request["argv"])
+        elif cmd == "schedule":
+            timer_id = schedule(target, int(request["seconds"]), action,
+                                str(request.get("label", "")))
+        elif cmd == "unschedule":
+            unschedule(target, int(request["timer"]))
+        elif cmd != "status":
+            raise ValueError(f"Unknown command: {cmd}")
+        response = status(target.timer)
+        if timer_id is not None:
+            response["timer"] = timer_id
+    except (KeyError, TypeError, ValueError) as e:
+        response = {"ok": False, "error": str(e) or "Bad request"}
+
+    if "id" in request:
+        response["id"] = request["id"]
+    return response
+
+
+def check_duration(timer, seconds: int) -> int:
+    """seconds if it is within the configured timer limits, else ValueError"""
+    if not timer.min_duration <= seconds <= timer.max_duration:
+        raise ValueError(
+            f"Duration must be between {timer.min_duration} and {timer.max_duration} seconds"
+        )
+    return seconds
+
+
+def schedule(target, seconds: int, action: Optional[str], label: str = "") -> int:
+    """Schedule an independent action; returns its timer ID"""
+    if action is None:
+        raise ValueError("Missing action")
+    return target.schedule_action(action, check_duration(target.timer, seconds), label).timer_id
+
+
+def unschedule(target, timer_id: int) -> None:
+    """Cancel a scheduled action by timer ID"""
+    if not target.cancel_scheduled(timer_id):
+        raise ValueError(f"No scheduled action {timer_id}")
+
+
+def apply_schedule_args(target, args) -> bool:
+    """Apply --schedule/--unschedule; True if either was given"""
+    if args.unschedule is not None:
+        unschedule(target, args.unschedule)
+    if args.schedule:
+        schedule(target, args.schedule, args.action, args.label)
+    return args.schedule is not None or args.unschedule is not None
+
+
+def launch(target, argv: List[str]) -> None:
+    """Apply the command line of a second launch"""
+    from src.cli import parse_forwarded
+    args = parse_forwarded(argv)
+    scheduled = apply_schedule_args(target, args)
+    if args.duration:
+        target.arm(check_duration(target.timer, args.duration), args.action)
+    elif args.action and not args.schedule:
+        target.change_action(args.action)
+    elif not scheduled:
+        target.show_window()
+
+
+def status(timer) -> Dict[str, Any]:
+    """Describe a TimerController for a status response"""
+    now = time.monotonic()
+    return {
+        "ok": True,
+        "running": timer.is_running,
+        "remaining": timer.remaining_seconds,
+        "total": timer.total_seconds,
+        "action": timer.selected_action,
+        "scheduled": [
+            {"id": t.timer_id, "action": t.action, "label": t.label,
+             "remaining": round(t.remaining(now))}
+            for t in timer.scheduler.pending()
+        ],
+    }
@@ -0,0 +1,280 @@
+"""
+Control server on a Unix-domain socket, driven by a selectors loop
+"""
+import os
+import selectors
+import socket
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src.control.protocol import control_socket_path
+from src.control.wire import encode, decode
+
+
+class CoalescedDispatcher:
+    """Marshals callables onto the owner thread through a single queue
+
+    However many requests arrive, at most one drain is scheduled on the
+    owner thread at a time; it runs everything queued so far in order.
+    """
+
+    def __init__(self, post: Callable[[Callable[[], None]], None]):
+        self._post = post
+        self._lock = threading.Lock()
+        self._queue: deque = deque()
+        self._scheduled = False
+
+    def submit(self, fn: Callable[[], None]) -> None:
+        """Queue fn for the owner thread (thread-safe)"""
+        with self._lock:
+            self._queue.append(fn)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._post(self._drain)
+
+    def _drain(self) -> None:
+        """Run every queued callable (owner thread)"""
+        with self._lock:
+            batch, self._queue = self._queue, deque()
+            self._scheduled = False
+        for fn in batch:
+            fn()
+
+
+class _Client:
+    """One connection: unread bytes, responses owed in request order, unsent bytes"""
+
+    __slots__ = ("sock", "inbuf", "pending", "outbuf", "eof", "events")
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.inbuf = bytearray()
+        # One-element lists, filled in by the owner thread when answered
+        self.pending: deque = deque()
+        self.outbuf = bytearray()
+        self.eof = False
+        self.events = selectors.EVENT_READ  # registered with the selector
+
+
+class ControlServer:
+    """JSON-lines control API for a running instance
+
+    Runs a selectors loop on a background thread; only socket, selectors
+    and json are needed, so the daemon stays small. Each request is handed
+    to handler(request) on the owner thread through the dispatcher (anything
+    with submit(fn): a CoalescedDispatcher, or the GUI's UpdateBus), and the
+    response is written back once the owner has produced it.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Dict[str, Any]], Dict[str, Any]],
+        dispatcher: CoalescedDispatcher,
+        path: Optional[Path] = None
+    ):
+        self.handler = handler
+        self.dispatcher = dispatcher
+        self.path = Path(path) if path else control_socket_path()
+        self._listener: Optional[socket.socket] = None
+        self._clients: Dict[int, _Client] = {}
+        self._wake_fds: Optional[tuple] = None
+        self._wake_lock = threading.Lock()
+        self._wake_pending = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        """Start listening; returns False if another instance owns the socket"""
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        if self.path.exists():
+            if _socket_alive(self.path):
+                return False
+            self.path.unlink()  # stale socket from a crashed instance
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            listener.bind(str(self.path))
+            os.chmod(self.path, 0o600)
+            listener.listen(128)
+        except OSError as e:
+            print(f"Control server unavailable: {e}")
+            listener.close()
+            return False
+        listener.setblocking(False)
+        self._listener = listener
+        self._wake_fds = os.pipe()
+        os.set_blocking(self._wake_fds[0], False)
+        self._thread = threading.Thread(target=self._run, name="ShutEye-control", daemon=True)
+        self._thread.start()
+        return True
+
+    def close(self) -> None:
+        """Stop the server and remove the socket"""
+        self._closed = True
+        if self._thread:
+            self._wake()
+            self._thread.join(timeout=2)
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+    def _wake(self) -> None:
+        """Interrupt select() (any thread); coalesced to one pending byte"""
+        with self._wake_lock:
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        os.write(self._wake_fds[1], b"x")
+
+    def _run(self) -> None:
+        """Server thread: accept, read requests and write responses"""
+        wake_r, wake_w = self._wake_fds
+        selector = selectors.DefaultSelector()
+        selector.register(self._listener, selectors.EVENT_READ)
+        selector.register(wake_r, selectors.EVENT_READ)
+        try:
+            while not self._closed:
+                for key, events in selector.select():
+                    if key.fileobj is self._listener:
+                        self._accept(selector)
+                    elif key.fileobj == wake_r:
+                        with self._wake_lock:
+                            self._wake_pending = False
+                            try:
+                                os.read(wake_r, 4096)
+                            except BlockingIOError:
+                                pass
+                    else:
+                        client = self._clients.get(key.fd)
+                        if client is None:
+                            continue
+                        if events & selectors.EVENT_READ:
+                            self._read(client)
+                        if events & selectors.EVENT_WRITE:
+                            self._send(client)
+                # Responses the owner thread has produced since the last pass
+                for client in list(self._clients.values()):
+                    self._flush(client, selector)
+        finally:
+            for client in list(self._clients.values()):
+                client.sock.close()
+            self._clients.clear()
+            selector.close()
+            self._listener.close()
+            os.close(wake_r)
+            os.close(wake_w)
+
+    def _accept(self, selector: selectors.BaseSelector) -> None:
+        """Take every waiting connection"""
+        while True:
+            try:
+                sock, _ = self._listener.accept()
+            except OSError:
+                return  # nothing more waiting
+            sock.setblocking(False)
+            client = _Client(sock)
+            self._clients[sock.fileno()] = client
+            selector.register(sock, selectors.EVENT_READ)
+
+    def _read(self, client: _Client) -> None:
+        """Read what arrived and dispatch every complete line at once
+
+        Requests are dispatched as soon as they are read, so a pipelining
+        client gets its whole batch handled in one owner-thread drain;
+        responses are still written in request order.
+        """
+        try:
+            data = client.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            client.eof = True
+            return
+        client.inbuf += data
+        *lines, rest = client.inbuf.split(b"\n")
+        client.inbuf = bytearray(rest)
+        for line in lines:
+            if not line.strip():
+                continue
+            slot: List[Optional[Dict[str, Any]]] = [None]
+            client.pending.append(slot)
+            try:
+                request = decode(bytes(line))
+            except ValueError as e:
+                slot[0] = {"ok": False, "error": f"Invalid JSON: {e}"}
+            else:
+                self._dispatch(request, slot)
+
+    def _flush(self, client: _Client, selector: selectors.BaseSelector) -> None:
+        """Queue answered responses in order, send them, close finished clients"""
+        while client.pending and client.pending[0][0] is not None:
+            client.outbuf += encode(client.pending.popleft()[0])
+        if client.outbuf:
+            self._send(client)
+        if client.eof and not client.pending and not client.outbuf:
+            self._drop(client, selector)
+            return
+        # After EOF only wait to write; a half-closed client still gets its answers
+        events = (0 if client.eof else selectors.EVENT_READ) | (
+            selectors.EVENT_WRITE if client.outbuf else 0)
+        if events == client.events:
+            return
+        if not client.events:
+            selector.register(client.sock, events)
+        elif not events:
+            selector.unregister(client.sock)
+        else:
+            selector.modify(client.sock, events)
+        client.events = events
+
+    def _send(self, client: _Client) -> None:
+        """Write as much of the output buffer as the socket takes"""
+        try:
+            sent = client.sock.send(client.outbuf)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            # Client went away; nothing more can be delivered
+            client.eof = True
+            client.pending.clear()
+            client.outbuf.clear()
+            return
+        del client.outbuf[:sent]
+
+    def _drop(self, client: _Client, selector: selectors.BaseSelector) -> None:
+        """Forget and close a connection"""
+        self._clients.pop(client.sock.fileno(), None)
+        if client.events:
+            selector.unregister(client.sock)
+        client.sock.close()
+
+    def _dispatch(self, request: Dict[str, Any], slot: list) -> None:
+        """Run the handler on the owner thread; its response fills slot"""
+        def run():
+            try:
+                response = self.handler(request)
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            slot[0] = response
+            self._wake()
+
+        self.dispatcher.submit(run)
+
+
+def _socket_alive(path: Path) -> bool:
+    """True if something is accepting connections on path"""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
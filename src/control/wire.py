@@ -0,0 +1,31 @@
+"""
+Socket address and JSON-lines framing
+
+Kept to os and json so the second-launch fast path can use it without
+pulling in pathlib, typing or the rest of the package.
+"""
+import json
+import os
+
+
+def socket_path() -> str:
+    """Per-user Unix socket path for the running instance"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "shuteye.sock")
+    import tempfile
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"shuteye-{uid}.sock")
+
+
+def encode(message: dict) -> bytes:
+    """Serialize one message as a JSON line"""
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode(line: bytes) -> dict:
+    """Parse one JSON line into a message"""
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Message must be a JSON object")
+    return message
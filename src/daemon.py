@@ -0,0 +1,170 @@
+"""
+Headless timer daemon
+
+Runs the countdown, scheduled actions and SystemActionExecutor without
+importing customtkinter, PIL or pystray.
+"""
+import argparse
+import os
+import queue
+import signal
+import sys
+from typing import Optional
+
+from src.config import ConfigManager
+from src.constants import (
+    CONFIG_FILE, CONFIG_LAYERS, CONFIG_CACHE_FILE, JOURNAL_FILE, CAPABILITIES_FILE
+)
+from src.control.protocol import apply_schedule_args, check_duration, handle_request
+from src.control.server import ControlServer, CoalescedDispatcher
+from src.timer import TimerController, ScheduledTimer
+from src.utils.capabilities import Capabilities, load_capabilities
+from src.utils.system_actions import SystemActionExecutor
+from src.utils.time_utils import format_time_display, get_end_time
+
+
+class ShutEyeDaemon:
+    """Runs the timer controller from a minimal blocking event loop
+
+    Background threads post callables onto a queue; the main thread sleeps
+    in queue.get() and runs them one at a time, so it only wakes when a
+    timer or signal needs handling.
+    """
+
+    def __init__(self, config: ConfigManager, capabilities: Optional[Capabilities] = None):
+        self.config = config
+        self.capabilities = capabilities or Capabilities()
+        self._tasks: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._running = False
+        self.timer = TimerController(config, post=self.post, journal_path=JOURNAL_FILE)
+        self.timer.on_expire = self.execute_action
+        self.control = ControlServer(
+            lambda request: handle_request(self, request), CoalescedDispatcher(self.post)
+        )
+
+    def post(self, fn, *args) -> None:
+        """Run fn on the event loop thread (thread-safe)"""
+        self._tasks.put((fn, args))
+
+    def arm(self, seconds: int, action: Optional[str] = None) -> None:
+        """Start a fresh countdown, replacing any current one"""
+        if self.timer.is_running:
+            self.timer.pause()
+        if action:
+            self.timer.selected_action = action
+        reason = self.capabilities.unsupported.get(self.timer.selected_action)
+        if reason:
+            print(f"Warning: {self.timer.selected_action} does not work on this system "
+                  f"({reason})", flush=True)
+        self.timer.set_duration(seconds)
+        self.timer.start()
+        print(
+            f"{self.timer.selected_action} in {format_time_display(self.timer.remaining_seconds)}"
+            f" (at {get_end_time(self.timer.remaining_seconds)})",
+            flush=True
+        )
+
+    def add_time_active(self, seconds: int) -> None:
+        """Add or subtract time from the countdown"""
+        self.timer.adjust(seconds)
+
+    def start_timer(self) -> None:
+        """Resume the countdown"""
+        if not self.timer.is_running:
+            self.timer.start()
+
+    def pause_timer(self) -> None:
+        """Pause the countdown"""
+        self.timer.pause()
+
+    def stop_timer(self) -> None:
+        """Cancel the countdown"""
+        self.timer.cancel()
+
+    def change_action(self, action: str) -> None:
+        """Change the action the countdown will run"""
+        self.timer.change_action(action)
+
+    def show_window(self) -> None:
+        """Nothing to show without a GUI"""
+
+    def schedule_action(self, action: str, seconds: int, label: str = "") -> ScheduledTimer:
+        """Schedule an independent action alongside the countdown"""
+        timer = self.timer.schedule(action, seconds, label)
+        print(f"Scheduled {label or action} as timer {timer.timer_id}: {action} at "
+              f"{get_end_time(seconds)}", flush=True)
+        return timer
+
+    def cancel_scheduled(self, timer_id: int) -> bool:
+        """Cancel a scheduled action"""
+        cancelled = self.timer.cancel_scheduled(timer_id)
+        if cancelled:
+            print(f"Cancelled scheduled timer {timer_id}", flush=True)
+        return cancelled
+
+    def execute_action(self) -> None:
+        """Countdown reached zero"""
+        print(f"Executing {self.timer.selected_action}", flush=True)
+        self.timer.fire()
+
+    def stop(self) -> None:
+        """Leave the event loop"""
+        self._running = False
+
+    def run(self) -> int:
+        """Run until stopped; returns the process exit code"""
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda signum, frame: self.post(self.stop))
+
+        if not self.control.start():
+            print(f"Control socket {self.control.path} unavailable", flush=True)
+
+        self._running = True
+        print("ShutEye daemon ready", flush=True)
+        while self._running:
+            fn, args = self._tasks.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"Daemon task failed: {e}", flush=True)
+
+        self.control.close()
+        # Keep the journal so a restarted daemon resumes pending timers
+        self.timer.close(discard=False)
+        return 0
+
+
+def run_daemon(args: argparse.Namespace) -> int:
+    """Entry point for --headless"""
+    config = ConfigManager(
+        CONFIG_FILE, CONFIG_LAYERS, environ=os.environ, cache_path=CONFIG_CACHE_FILE
+    )
+    # Probed once per boot; the executor starts with the backend that works
+    capabilities = load_capabilities(CAPABILITIES_FILE)
+    executor = SystemActionExecutor.from_capabilities(capabilities)
+    executor.prepare()
+    SystemActionExecutor.configure(executor)
+    for action, reason in capabilities.unsupported.items():
+        print(f"{action} unavailable: {reason}", flush=True)
+    daemon = ShutEyeDaemon(config, capabilities)
+
+    restored = daemon.timer.restore()
+    if restored and restored["running"]:
+        daemon.timer.start()
+    try:
+        apply_schedule_args(daemon, args)
+        if args.duration:
+            daemon.arm(check_duration(daemon.timer, args.duration), args.action)
+    except ValueError as e:
+        print(f"shuteye: error: {e}", file=sys.stderr)
+        daemon.timer.close(discard=False)
+        return 2
+    if args.action and not args.duration and not args.schedule:
+        daemon.timer.selected_action = args.action
+
+    return daemon.run()
+
+
+if __name__ == "__main__":
+    from src.cli import parse_args
+    raise SystemExit(run_daemon(parse_args()))
@@ -0,0 +1,33 @@
+"""
+Second-launch fast path
+
+Checks the control socket for a running instance and hands it the raw
+command line, so a second `main.py` never imports the GUI stack. Only os,
+json and socket are loaded here; the running instance does the parsing.
+"""
+import sys
+
+from src.control.client import NotRunning, send_request
+
+
+def forward(argv: list, timeout: float = 1.0):
+    """Send argv to a running instance
+
+    Returns the exit code for this process, or None if no instance is
+    running (or argv asks for help) and the caller should carry on.
+    """
+    if "-h" in argv or "--help" in argv:
+        return None
+    try:
+        response = send_request({"cmd": "launch", "argv": argv}, timeout=timeout)
+    except NotRunning:
+        return None  # no instance, a stale socket it left behind, or no AF_UNIX
+    except (OSError, ValueError) as e:
+        # Something is listening but did not answer; don't start a duplicate
+        print(f"ShutEye is running but did not respond: {e}", file=sys.stderr)
+        return 1
+
+    if not response.get("ok"):
+        print(f"shuteye: error: {response.get('error')}", file=sys.stderr)
+        return 2
+    return 0
@@ -0,0 +1,137 @@
+"""
+User choices remembered between runs
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Remembered choices and the types they must have when read back
+PREFERENCE_TYPES = {
+    "selected_action": str,
+    "keep_screen_on": bool,
+    "last_duration": int,
+}
+
+
+class Preferences:
+    """Small JSON store of the user's last choices, saved in the background
+
+    set() only updates memory and wakes the writer thread, so it is safe to
+    call from Tk handlers on every click. The writer waits until nothing has
+    changed for DELAY seconds and then writes every value at once through a
+    temporary file and os.replace(), so the file is always either the old or
+    the new version. The file lives apart from the config layers, which are
+    never rewritten.
+    """
+
+    DELAY = 0.5  # seconds after the last change before writing
+
+    def __init__(self, path: Path, delay: Optional[float] = None):
+        self.path = Path(path)
+        self.delay = self.DELAY if delay is None else delay
+        self._cond = threading.Condition()
+        self._values: Dict[str, Any] = self._read()
+        self._changed_at: Optional[float] = None
+        self._version = 0
+        self._saved = 0
+        self.writes = 0
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def _read(self) -> Dict[str, Any]:
+        """Stored values of the expected types; anything else is dropped"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Ignoring preferences file {self.path}: {e}")
+            return {}
+        if not isinstance(stored, dict):
+            return {}
+        return {
+            key: value for key, value in stored.items()
+            if key in PREFERENCE_TYPES and type(value) is PREFERENCE_TYPES[key]
+        }
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Remembered value, or default"""
+        with self._cond:
+            return self._values.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Remember a value; written DELAY seconds after the last change"""
+        with self._cond:
+            if key in self._values and self._values[key] == value:
+                return
+            self._values[key] = value
+            self._version += 1
+            self._changed_at = time.monotonic()
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Write pending changes now and wait until they are on disk"""
+        with self._cond:
+            target = self._version
+            self._changed_at = 0.0
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._saved >= target, timeout)
+
+    def close(self) -> None:
+        """Write anything pending and stop the writer thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def _ensure_thread(self) -> None:
+        """Start the writer thread on first change"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="ShutEye-preferences", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Write once changes have settled for the delay"""
+        while True:
+            with self._cond:
+                while True:
+                    pending = self._version > self._saved
+                    if self._closed:
+                        break
+                    if pending:
+                        wait = self._changed_at + self.delay - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+                values, version, closed = dict(self._values), self._version, self._closed
+            if pending:
+                try:
+                    self._write(values)
+                except OSError as e:
+                    print(f"Could not save preferences: {e}")
+            with self._cond:
+                self._saved = version
+                self._cond.notify_all()
+            if closed:
+                return
+
+    def _write(self, values: Dict[str, Any]) -> None:
+        """Atomically replace the file with values"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(values, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.writes += 1
@@ -0,0 +1,26 @@
+"""
+Timer engine package
+"""
+from src.timer.engine import TimerEngine
+from src.timer.worker import CountdownWorker
+from src.timer.scheduler import TimerScheduler, ScheduledTimer
+from src.timer.clock import ClockWatcher, CLOCK_MODE_AWAKE, CLOCK_MODE_WALL
+from src.timer.journal import TimerJournal
+from src.timer.rules import ScheduleRule, RuleIndex, compile_rule, compile_rules
+from src.timer.controller import TimerController
+
+__all__ = [
+    "TimerEngine",
+    "CountdownWorker",
+    "TimerScheduler",
+    "ScheduledTimer",
+    "ClockWatcher",
+    "CLOCK_MODE_AWAKE",
+    "CLOCK_MODE_WALL",
+    "TimerJournal",
+    "ScheduleRule",
+    "RuleIndex",
+    "compile_rule",
+    "compile_rules",
+    "TimerController",
+]
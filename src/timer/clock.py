@@ -0,0 +1,135 @@
+"""
+Suspend/resume and wall-clock change detection
+"""
+import ctypes
+import errno
+import os
+import select
+import sys
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+# Linux timerfd constants
+CLOCK_REALTIME = 0
+TFD_CLOEXEC = 0o2000000
+TFD_TIMER_ABSTIME = 1
+TFD_TIMER_CANCEL_ON_SET = 2
+
+# Clock modes for timer deadlines
+CLOCK_MODE_AWAKE = "awake"  # counts only time the machine is awake
+CLOCK_MODE_WALL = "wall"    # fires at the wall-clock time shown on screen
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = [("it_interval", _Timespec), ("it_value", _Timespec)]
+
+
+def clock_offsets() -> Tuple[float, float]:
+    """Return (suspended time, wall-clock offset) as clock differences
+
+    The first value grows by the time spent suspended (CLOCK_BOOTTIME keeps
+    running while CLOCK_MONOTONIC stops); the second changes when the wall
+    clock is set.
+    """
+    monotonic = time.monotonic()
+    boottime = getattr(time, "CLOCK_BOOTTIME", None)
+    boot = time.clock_gettime(boottime) if boottime is not None else monotonic
+    return boot - monotonic, time.time() - boot
+
+
+class ClockWatcher:
+    """Reports suspend gaps and wall-clock jumps to a callback
+
+    On Linux a timerfd armed with TFD_TIMER_CANCEL_ON_SET far in the future is
+    cancelled by the kernel whenever the wall clock is set or the system
+    resumes, so the watcher thread blocks without polling. Elsewhere, call
+    check() from an existing periodic wakeup such as the countdown tick.
+    """
+
+    THRESHOLD = 1.0  # seconds; smaller differences are NTP slew or jitter
+
+    def __init__(self, on_change: Callable[[float, float], None]):
+        self.on_change = on_change
+        self.event_driven = False
+        self._lock = threading.Lock()
+        self._suspended, self._wall = clock_offsets()
+        self._fd: Optional[int] = None
+        self._wake_fds: Optional[Tuple[int, int]] = None
+        self._libc = None
+
+    def start(self) -> None:
+        """Start the timerfd watcher thread where supported"""
+        if not sys.platform.startswith("linux"):
+            return  # timerfd is Linux-only; check() runs from the tick instead
+        try:
+            self._libc = ctypes.CDLL(None, use_errno=True)
+            fd = self._libc.timerfd_create(CLOCK_REALTIME, TFD_CLOEXEC)
+            if fd < 0:
+                return
+            self._fd = fd
+            self._arm()
+        except (OSError, AttributeError, TypeError):
+            self._fd = None
+            return
+
+        self._wake_fds = os.pipe()
+        self.event_driven = True
+        threading.Thread(target=self._run, args=(self._wake_fds[0],),
+                         name="ShutEye-clock", daemon=True).start()
+
+    def check(self) -> bool:
+        """Compare clock offsets and report any jump; returns True if reported"""
+        with self._lock:
+            suspended, wall = clock_offsets()
+            suspend_gap = suspended - self._suspended
+            wall_jump = wall - self._wall
+            self._suspended, self._wall = suspended, wall
+        if abs(suspend_gap) < self.THRESHOLD and abs(wall_jump) < self.THRESHOLD:
+            return False
+        self.on_change(max(0.0, suspend_gap), wall_jump)
+        return True
+
+    def close(self) -> None:
+        """Stop the watcher thread"""
+        # The thread closes its read end; the write end is only closed here
+        wake_fds, self._wake_fds = self._wake_fds, None
+        if wake_fds:
+            try:
+                os.write(wake_fds[1], b"x")
+            except OSError:
+                pass  # the thread has already stopped
+            os.close(wake_fds[1])
+
+    def _arm(self) -> None:
+        """Arm the timerfd far in the future so only cancellation wakes it"""
+        spec = _Itimerspec()
+        spec.it_value.tv_sec = int(time.time()) + 10 * 365 * 86400
+        flags = TFD_TIMER_ABSTIME | TFD_TIMER_CANCEL_ON_SET
+        if self._libc.timerfd_settime(self._fd, flags, ctypes.byref(spec), None) < 0:
+            raise OSError(ctypes.get_errno(), "timerfd_settime failed")
+
+    def _run(self, wake_r: int) -> None:
+        """Block on the timerfd until the kernel cancels it or close() wakes it"""
+        try:
+            while True:
+                readable, _, _ = select.select([self._fd, wake_r], [], [])
+                if wake_r in readable:
+                    return
+                try:
+                    os.read(self._fd, 8)
+                except OSError as e:
+                    if e.errno != errno.ECANCELED:
+                        raise
+                self._arm()
+                self.check()
+        except OSError as e:
+            print(f"Clock watcher stopped: {e}")
+            self.event_driven = False
+        finally:
+            for fd in (self._fd, wake_r):
+                os.close(fd)
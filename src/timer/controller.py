@@ -0,0 +1,291 @@
+"""
+Timer state and actions shared by the GUI and the headless daemon
+"""
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set
+
+from src.config import ConfigManager
+from src.timer.engine import TimerEngine
+from src.timer.worker import CountdownWorker
+from src.timer.scheduler import TimerScheduler, ScheduledTimer
+from src.timer.clock import ClockWatcher, CLOCK_MODE_WALL
+from src.timer.journal import TimerJournal
+from src.timer.rules import MISFIRE_GRACE, RuleIndex, compile_rules
+
+
+class TimerController:
+    """Owns the countdown, scheduled actions, clock handling and crash journal
+
+    Background threads never touch the owner directly: their events are handed
+    to post(fn, *args), which must run fn on the owner's thread (Tk's after()
+    in the GUI, the daemon's event loop headless). Ticks and clock changes
+    are states, not commands: they go through publish(key, fn, *args), which
+    may drop a pending call superseded by a newer one for the same key. The
+    owner is told about ticks and expiry through the on_tick/on_expire/
+    on_clock_change hooks.
+    """
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        post: Callable[..., None],
+        journal_path: Path,
+        publish: Optional[Callable[..., None]] = None
+    ):
+        self.config = config
+        self.post = post
+        self.publish = publish or (lambda key, fn, *args: post(fn, *args))
+        self.total_seconds = config.snapshot.timer.default_duration
+        self.selected_action = "Shutdown"
+
+        # Owner hooks, called on the owner's thread
+        self.on_tick: Callable[[], None] = lambda: None
+        self.on_expire: Callable[[], None] = lambda: None
+        self.on_clock_change: Callable[[], None] = lambda: None
+
+        self.engine = TimerEngine(self.total_seconds)
+        self.worker = CountdownWorker(
+            self.engine, on_tick=self._on_worker_tick, on_expire=self._on_worker_expire
+        )
+        # Independent scheduled actions shared with the tray and external callers
+        self.scheduler = TimerScheduler(on_fire=self._on_scheduled_fire)
+        # Suspend/resume and wall-clock change handling
+        self.clock_mode = config.snapshot.timer.clock_mode
+        self.clock_watcher = ClockWatcher(on_change=self._on_clock_change)
+        self.clock_watcher.start()
+        # Crash journal next to config.json
+        self.journal = TimerJournal(journal_path)
+        # Recurring/absolute rules; only the next occurrence holds a scheduler slot
+        self.rules = RuleIndex(compile_rules(config.get_schedules()), time.time())
+        self._rules_timer: Optional[ScheduledTimer] = None
+        self._arm_rules()
+
+    @property
+    def is_running(self) -> bool:
+        """True while the countdown deadline is armed"""
+        return self.engine.is_running
+
+    @property
+    def remaining_seconds(self) -> int:
+        """Remaining time in whole seconds, derived from the deadline"""
+        return self.engine.remaining_seconds()
+
+    @property
+    def min_duration(self) -> int:
+        """Shortest allowed countdown"""
+        return self.config.snapshot.timer.min_duration
+
+    @property
+    def max_duration(self) -> int:
+        """Longest allowed countdown"""
+        return self.config.snapshot.timer.max_duration
+
+    def apply_config(self, changed: Set[str]) -> None:
+        """Pick up reloaded timer limits, clock mode and schedule rules"""
+        if "timer" in changed:
+            self.clock_mode = self.config.snapshot.timer.clock_mode
+            if not self.is_running and self.total_seconds < self.min_duration:
+                self.set_duration(self.min_duration)
+        if "schedules" in changed:
+            self.rules = RuleIndex(compile_rules(self.config.get_schedules()), time.time())
+            self._arm_rules()
+
+    def restore(self) -> Optional[Dict[str, Any]]:
+        """Rebuild pending timers from the journal
+
+        Scheduled actions are re-armed directly. The countdown is loaded but
+        not started; its journal state is returned so the owner can show it
+        and resume it if it was running. Timers that came due more than
+        MISFIRE_GRACE seconds ago (e.g. the machine was off) are dropped.
+        """
+        pending = self.journal.replay()
+        if pending:
+            self.journal.reset()
+        main_state = None
+
+        for timer_id, state in pending.items():
+            if state["remaining"] < -MISFIRE_GRACE:
+                print(f"Dropping {state['action']} timer that came due "
+                      f"{int(-state['remaining'] // 60)} min ago")
+                continue
+            # Timers that came due shortly before the app started get a short
+            # grace period instead of firing the moment the app starts
+            remaining = state["remaining"] if state["remaining"] > 0 else self.min_duration
+            if timer_id == "main":
+                self.selected_action = state["action"]
+                self.total_seconds = max(state.get("total", 0), int(remaining))
+                self.worker.reset(remaining)
+                if not state["running"]:
+                    self.journal_state("pause")
+                main_state = state
+            else:
+                self.schedule(state["action"], remaining, state.get("label", ""))
+        return main_state
+
+    def journal_state(self, event: str) -> None:
+        """Record the countdown's current state in the crash journal"""
+        self.journal.record(
+            event, "main", action=self.selected_action, total=self.total_seconds,
+            remaining=self.engine.remaining(), running=self.is_running
+        )
+
+    def set_duration(self, seconds: int) -> None:
+        """Set the countdown length while it is not running"""
+        self.total_seconds = max(self.min_duration, int(seconds))
+        self.worker.set_remaining(self.total_seconds)
+
+    def start(self) -> None:
+        """Start or resume the countdown"""
+        if not self.is_running:
+            self.worker.start()
+            self.journal_state("arm")
+
+    def pause(self) -> None:
+        """Pause the countdown"""
+        self.worker.pause()
+        self.journal_state("pause")
+
+    def reset(self) -> None:
+        """Reload the full duration, paused"""
+        self.worker.reset(self.total_seconds)
+        self.journal_state("pause")
+
+    def cancel(self) -> None:
+        """Abandon the countdown"""
+        self.worker.reset(self.total_seconds)
+        self.journal.record("cancel", "main")
+
+    def adjust(self, seconds: int) -> None:
+        """Move the deadline by seconds, never below the minimum duration"""
+        self.worker.adjust(seconds, self.min_duration)
+        self.total_seconds = max(self.total_seconds, self.remaining_seconds)
+        self.journal_state("adjust")
+
+    def change_action(self, action: str) -> None:
+        """Change the action the countdown will run"""
+        self.selected_action = action
+        self.journal_state("adjust")
+
+    def set_tick_interval(self, seconds: float) -> None:
+        """How often on_tick runs while counting down (1 s for a visible UI)"""
+        self.worker.set_tick_interval(seconds)
+
+    def fire(self) -> None:
+        """Stop the countdown and run its action"""
+        self.worker.pause()
+        self.journal.record("fire", "main")
+        self.run_action(self.selected_action)
+
+    def run_action(self, action: str) -> None:
+        """Run a system action, reporting failures"""
+        from src.utils.system_actions import SystemActionExecutor
+
+        # The fire record must be on disk before the machine goes down
+        self.journal.flush()
+        try:
+            SystemActionExecutor.execute(action)
+        except Exception as e:
+            print(f"Error executing action: {e}")
+
+    def schedule(self, action: str, seconds: float, label: str = "") -> ScheduledTimer:
+        """Schedule an independent action alongside the countdown"""
+        timer = self.scheduler.schedule(action, seconds, label)
+        self.journal.record(
+            "arm", f"scheduled-{timer.timer_id}", action=action, label=label,
+            remaining=seconds, running=True
+        )
+        return timer
+
+    def cancel_scheduled(self, timer_id: int) -> bool:
+        """Cancel a scheduled action"""
+        if self._rules_timer and self._rules_timer.timer_id == timer_id:
+            # Cancelling a rule's occurrence skips just that occurrence
+            self.rules.skip_next()
+            self._arm_rules()
+            return True
+        self.journal.record("cancel", f"scheduled-{timer_id}")
+        return self.scheduler.cancel(timer_id)
+
+    def close(self, discard: bool = True) -> None:
+        """Stop background threads; a deliberate exit discards pending timers"""
+        self.worker.close()
+        self.scheduler.close()
+        self.clock_watcher.close()
+        if discard:
+            self.journal.reset()
+        self.journal.close()
+
+    def _on_worker_tick(self, generation: int) -> None:
+        """Countdown worker tick (worker thread)"""
+        if not self.clock_watcher.event_driven:
+            # No timerfd on this platform; piggyback clock checks on the tick
+            self.clock_watcher.check()
+        self.publish("tick", self._handle_tick, generation)
+
+    def _on_worker_expire(self, generation: int) -> None:
+        """Countdown worker expiry (worker thread)"""
+        self.post(self._handle_expire, generation)
+
+    def _handle_tick(self, generation: int) -> None:
+        """Forward the tick unless a later command superseded it"""
+        if self.worker.is_current(generation):
+            self.on_tick()
+
+    def _handle_expire(self, generation: int) -> None:
+        """Forward expiry unless the timer was changed after expiring"""
+        if self.worker.is_current(generation) and self.engine.is_expired():
+            self.on_expire()
+
+    def _arm_rules(self) -> None:
+        """Hold one scheduler slot for the earliest rule occurrence"""
+        if self._rules_timer:
+            self.scheduler.cancel(self._rules_timer.timer_id)
+            self._rules_timer = None
+        head = self.rules.peek()
+        if head:
+            fire, rule = head
+            self._rules_timer = self.scheduler.schedule(
+                rule.action, max(0.0, fire - time.time()), rule.describe(),
+                on_fire=self._on_rule_fire
+            )
+
+    def _fire_rules(self, timer: ScheduledTimer) -> None:
+        """Run every rule that is due and wait for the next one"""
+        if timer is not self._rules_timer:
+            return  # superseded by a re-arm while the fire was in flight
+        self._rules_timer = None
+        for rule in self.rules.pop_due(time.time()):
+            self.run_action(rule.action)
+        self._arm_rules()
+
+    def _rebase_rules(self) -> None:
+        """Re-anchor rule occurrences to the wall clock"""
+        self.rules.rebuild(time.time())
+        self._arm_rules()
+
+    def _on_rule_fire(self, timer: ScheduledTimer) -> None:
+        """Next rule occurrence is due (scheduler thread)"""
+        # Rule state is only touched on the owner thread
+        self.post(self._fire_rules, timer)
+
+    def _on_scheduled_fire(self, timer: ScheduledTimer) -> None:
+        """Scheduled action is due (scheduler thread)"""
+        self.journal.record("fire", f"scheduled-{timer.timer_id}")
+        self.post(self.run_action, timer.action)
+
+    def _on_clock_change(self, suspended: float, wall_jump: float) -> None:
+        """Rebase deadlines after a suspend or clock change (watcher thread)"""
+        if self.clock_mode == CLOCK_MODE_WALL:
+            # Wall-clock timers keep their on-screen end time: time spent
+            # suspended or skipped by the clock counts as elapsed
+            self.worker.shift(suspended + wall_jump)
+            self.scheduler.shift(suspended + wall_jump)
+        elif self.is_running:
+            # The journal stores wall-clock deadlines, which just moved
+            self.journal_state("adjust")
+        # Awake-time deadlines are unchanged; only the end-time label moves
+        self.publish("clock", self.on_clock_change)
+        # Rules are anchored to the wall clock in either mode
+        if len(self.rules):
+            self.post(self._rebase_rules)
@@ -0,0 +1,93 @@
+"""
+Deadline-based countdown engine
+"""
+import math
+import time
+from typing import Callable, Optional
+
+
+class TimerEngine:
+    """Countdown state stored as an absolute monotonic deadline
+
+    While running, the remaining time is derived from the deadline instead of
+    being decremented per tick, so sleep overshoot and UI dispatch latency
+    never accumulate into the fire time.
+    """
+
+    def __init__(self, remaining: float, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._deadline: Optional[float] = None
+        self._paused_remaining = float(remaining)
+
+    @property
+    def is_running(self) -> bool:
+        """True while a deadline is armed"""
+        return self._deadline is not None
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """Absolute deadline on the engine clock, or None when paused"""
+        return self._deadline
+
+    def remaining(self) -> float:
+        """Exact remaining time in seconds"""
+        if self._deadline is None:
+            return self._paused_remaining
+        return max(0.0, self._deadline - self._clock())
+
+    def remaining_seconds(self) -> int:
+        """Remaining time rounded up to whole seconds for display"""
+        return math.ceil(self.remaining())
+
+    def is_expired(self) -> bool:
+        """True once a running deadline has been reached"""
+        return self._deadline is not None and self._clock() >= self._deadline
+
+    def seconds_until_tick(self, interval: float = 1.0) -> float:
+        """Time until the remaining time next crosses a multiple of interval
+
+        With the default of one second, that is when the displayed value
+        changes. The last wait always ends exactly at the deadline.
+        """
+        remaining = self.remaining()
+        fraction = remaining % interval
+        return fraction if fraction > 0 else min(interval, remaining)
+
+    def start(self) -> None:
+        """Arm the deadline from the paused remaining time"""
+        if self._deadline is None:
+            self._deadline = self._clock() + self._paused_remaining
+
+    def pause(self) -> None:
+        """Freeze the remaining time and drop the deadline"""
+        if self._deadline is not None:
+            self._paused_remaining = self.remaining()
+            self._deadline = None
+
+    def reset(self, remaining: float) -> None:
+        """Stop and load a new remaining time"""
+        self._deadline = None
+        self._paused_remaining = float(remaining)
+
+    def set_remaining(self, remaining: float) -> None:
+        """Replace the remaining time, keeping the running state"""
+        if self._deadline is None:
+            self._paused_remaining = float(remaining)
+        else:
+            self._deadline = self._clock() + remaining
+
+    def shift(self, seconds: float) -> None:
+        """Move a running deadline earlier by seconds (clock rebase)"""
+        if self._deadline is not None:
+            self._deadline -= seconds
+
+    def adjust(self, seconds: float, minimum: float = 0) -> float:
+        """Move the deadline by seconds, never below minimum; returns new remaining"""
+        remaining = self.remaining() + seconds
+        if remaining < minimum:
+            self.set_remaining(minimum)
+        elif self._deadline is None:
+            self._paused_remaining = remaining
+        else:
+            self._deadline += seconds
+        return self.remaining()
@@ -0,0 +1,174 @@
+"""
+Crash-safe append-only timer journal
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Events that end a timer; any other event carries the timer's full state
+END_EVENTS = ("cancel", "fire")
+
+
+class TimerJournal:
+    """Append-only JSON-lines log of timer events
+
+    Every arm/adjust/pause record carries the timer's complete state with a
+    wall-clock timestamp, so replay is a single last-record-wins pass. A
+    background thread writes queued records and fsyncs at most once per
+    FLUSH_INTERVAL, and rewrites the file as a snapshot once it grows past
+    COMPACT_THRESHOLD.
+    """
+
+    FLUSH_INTERVAL = 0.2  # seconds between fsync batches
+    COMPACT_THRESHOLD = 64 * 1024  # bytes
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._cond = threading.Condition()
+        self._queue: List[str] = []
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._file = None
+        self._compact_requested = False
+        self._queued = 0
+        self._written = 0
+        self._urgent = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def replay(self) -> Dict[str, Dict[str, Any]]:
+        """Rebuild pending timers from the journal
+
+        Returns {timer_id: state} where state holds the last recorded fields
+        and "remaining" is corrected for the time elapsed since the record
+        if the timer was running.
+        """
+        state: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn write from a crash
+                    if record.get("ev") in END_EVENTS:
+                        state.pop(record.get("id"), None)
+                    else:
+                        state[record.get("id")] = record
+        except FileNotFoundError:
+            return {}
+
+        now = time.time()
+        for record in state.values():
+            if record.get("running"):
+                record["remaining"] -= now - record["t"]
+        return state
+
+    def record(self, event: str, timer_id: str = "main", **fields: Any) -> None:
+        """Queue an event; arm/adjust/pause must pass the full timer state"""
+        record = {"ev": event, "id": timer_id, "t": time.time(), **fields}
+        with self._cond:
+            if event in END_EVENTS:
+                self._state.pop(timer_id, None)
+            else:
+                self._state[timer_id] = record
+            self._queue.append(json.dumps(record, separators=(",", ":")))
+            self._queued += 1
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Block until every queued record is on disk, e.g. before a shutdown"""
+        with self._cond:
+            target = self._queued
+            self._urgent.set()
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._written >= target, timeout)
+
+    def reset(self) -> None:
+        """Discard the journal, e.g. after its timers have been restored"""
+        with self._cond:
+            self._state.clear()
+            self._queue.clear()
+            self._compact_requested = True
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Flush pending records and stop the writer thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def _ensure_thread(self) -> None:
+        """Start the writer thread on first use"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="ShutEye-journal", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Write queued records in fsync batches, compacting when large
+
+        File I/O happens outside the lock so recording never waits on disk.
+        """
+        while True:
+            with self._cond:
+                while not (self._queue or self._compact_requested or self._closed):
+                    self._cond.wait()
+                batch, self._queue = self._queue, []
+                target = self._queued
+                snapshot = None
+                if self._compact_requested:
+                    # The snapshot already contains every queued record
+                    snapshot = list(self._state.values())
+                    self._compact_requested = False
+                closed = self._closed
+            try:
+                if snapshot is not None:
+                    self._rewrite(snapshot)
+                elif batch:
+                    self._append(batch)
+                    if self._file.tell() > self.COMPACT_THRESHOLD:
+                        with self._cond:
+                            self._compact_requested = True
+            except OSError as e:
+                print(f"Timer journal write failed: {e}")
+            with self._cond:
+                self._written = target
+                self._cond.notify_all()
+            if closed:
+                if self._file:
+                    self._file.close()
+                return
+            # Let the next batch gather unless someone is waiting in flush()
+            self._urgent.wait(self.FLUSH_INTERVAL)
+            self._urgent.clear()
+
+    def _append(self, lines: List[str]) -> None:
+        """Append lines and fsync once"""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _rewrite(self, records: List[Dict[str, Any]]) -> None:
+        """Atomically replace the journal with one record per pending timer"""
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        if self._file:
+            self._file.close()
+            self._file = None
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,207 @@
+"""
+Recurring and absolute-time schedules
+
+Rules come from the "schedules" list in config.json:
+
+    {"action": "Shutdown", "at": "22:30", "days": "weekdays"}
+    {"action": "Lock", "at": "12:00"}                       (every day)
+    {"action": "Sleep", "at": "2026-12-31 23:00"}           (once)
+
+Each rule is compiled once into a next-fire calculator; a RuleIndex keeps
+their next occurrences in a heap so only the earliest needs a wakeup.
+"""
+import heapq
+import itertools
+from datetime import date, datetime, time as dtime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.constants import ACTION_ICONS
+
+WEEKDAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+DAY_SETS = {
+    "daily": range(7),
+    "weekdays": range(5),
+    "weekends": range(5, 7),
+}
+
+# Occurrences missed by more than this (machine off or asleep) are skipped
+# rather than run late
+MISFIRE_GRACE = 300.0
+
+_ONE_DAY = timedelta(days=1)
+
+
+class ScheduleRule:
+    """A compiled schedule: action plus a next-fire calculator"""
+
+    __slots__ = ("rule_id", "action", "label", "once", "at", "_offsets")
+
+    def __init__(
+        self,
+        rule_id: int,
+        action: str,
+        label: str,
+        at: Optional[dtime] = None,
+        days: Tuple[int, ...] = (),
+        once: Optional[float] = None
+    ):
+        self.rule_id = rule_id
+        self.action = action
+        self.label = label
+        self.once = once
+        self.at = at
+        # Days to add from each weekday to reach the next allowed one
+        self._offsets = tuple(
+            min((d - weekday) % 7 for d in days) if days else None
+            for weekday in range(7)
+        )
+
+    def next_fire(self, after: float) -> Optional[float]:
+        """First occurrence strictly after the given wall-clock timestamp"""
+        if self.once is not None:
+            return self.once if self.once > after else None
+
+        day = date.fromtimestamp(after)
+        day += timedelta(days=self._offsets[day.weekday()])
+        fire = datetime.combine(day, self.at).timestamp()
+        if fire <= after:
+            day += _ONE_DAY
+            day += timedelta(days=self._offsets[day.weekday()])
+            fire = datetime.combine(day, self.at).timestamp()
+        return fire
+
+    def describe(self) -> str:
+        """Short human-readable form for menus and status output"""
+        if self.label:
+            return self.label
+        if self.once is not None:
+            when = datetime.fromtimestamp(self.once).strftime("%Y-%m-%d %H:%M")
+        else:
+            when = self.at.strftime("%H:%M")
+        return f"{self.action} at {when}"
+
+
+def compile_rule(rule_id: int, spec: Dict[str, Any]) -> ScheduleRule:
+    """Validate one "schedules" entry and compile it"""
+    action = spec.get("action")
+    if action not in ACTION_ICONS:
+        raise ValueError(f"Unknown action: {action}")
+    at = str(spec.get("at", "")).strip()
+    label = spec.get("label", "")
+
+    if " " in at or "T" in at:
+        try:
+            once = datetime.fromisoformat(at).timestamp()
+        except ValueError:
+            raise ValueError(f"Invalid date and time: {at!r}")
+        return ScheduleRule(rule_id, action, label, once=once)
+
+    try:
+        hour, minute = (int(part) for part in at.split(":"))
+        at_time = dtime(hour, minute)
+    except ValueError:
+        raise ValueError(f"Invalid time of day: {at!r}")
+
+    days = spec.get("days", "daily")
+    if isinstance(days, str):
+        if days not in DAY_SETS:
+            raise ValueError(f"Invalid days: {days!r}")
+        day_numbers = tuple(DAY_SETS[days])
+    else:
+        try:
+            day_numbers = tuple(sorted({WEEKDAY_NAMES.index(d.lower()[:3]) for d in days}))
+        except (AttributeError, ValueError):
+            raise ValueError(f"Invalid days: {days!r}")
+        if not day_numbers:
+            raise ValueError("Days list is empty")
+    return ScheduleRule(rule_id, action, label, at=at_time, days=day_numbers)
+
+
+def compile_rules(specs: List[Dict[str, Any]]) -> List[ScheduleRule]:
+    """Compile every valid rule, reporting and skipping invalid ones"""
+    rules = []
+    for rule_id, spec in enumerate(specs, 1):
+        try:
+            rules.append(compile_rule(rule_id, spec))
+        except ValueError as e:
+            print(f"Ignoring schedule {rule_id}: {e}")
+    return rules
+
+
+class RuleIndex:
+    """Heap of each rule's next occurrence, earliest first
+
+    Only the head matters for waking up; firing a rule re-inserts its next
+    occurrence in O(log n). Rules whose one-off time has passed drop out.
+    """
+
+    def __init__(self, rules: List[ScheduleRule], now: float):
+        self.rules = rules
+        self._seqs = itertools.count()
+        self._heap: List[tuple] = []
+        self.rebuild(now)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def rebuild(self, now: float) -> None:
+        """Recompute every next occurrence (after a wall-clock change)"""
+        self._heap = []
+        for rule in self.rules:
+            self._push(rule, now)
+        heapq.heapify(self._heap)
+
+    def peek(self) -> Optional[Tuple[float, ScheduleRule]]:
+        """Next occurrence and its rule"""
+        if not self._heap:
+            return None
+        fire, _, rule = self._heap[0]
+        return fire, rule
+
+    def pop_due(self, now: float, grace: float = MISFIRE_GRACE) -> List[ScheduleRule]:
+        """Rules due at now, each advanced to its next occurrence
+
+        Occurrences older than grace are skipped, not returned.
+        """
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            fire, _, rule = heapq.heappop(heap)
+            if now - fire <= grace:
+                due.append(rule)
+            self._push(rule, now, push=True)
+        return due
+
+    def skip_next(self) -> Optional[ScheduleRule]:
+        """Drop the earliest occurrence without running it"""
+        if not self._heap:
+            return None
+        fire, _, rule = heapq.heappop(self._heap)
+        self._push(rule, fire, push=True)
+        return rule
+
+    def expand(self, start: float, end: float) -> Iterator[Tuple[float, ScheduleRule]]:
+        """Every occurrence in [start, end) in time order (does not consume)"""
+        heap = [(fire, seq, rule) for fire, seq, rule in
+                ((rule.next_fire(start - 1e-6), i, rule) for i, rule in enumerate(self.rules))
+                if fire is not None]
+        heapq.heapify(heap)
+        while heap and heap[0][0] < end:
+            fire, seq, rule = heap[0]
+            yield fire, rule
+            following = rule.next_fire(fire)
+            if following is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (following, seq, rule))
+
+    def _push(self, rule: ScheduleRule, after: float, push: bool = False) -> None:
+        """Queue the rule's next occurrence after the given time"""
+        fire = rule.next_fire(after)
+        if fire is None:
+            return
+        entry = (fire, next(self._seqs), rule)
+        if push:
+            heapq.heappush(self._heap, entry)
+        else:
+            self._heap.append(entry)
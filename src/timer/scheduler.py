@@ -0,0 +1,222 @@
+"""
+Multi-timer scheduler for independent scheduled actions
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class ScheduledTimer:
+    """One pending scheduled action"""
+
+    __slots__ = ("timer_id", "action", "label", "deadline", "paused_remaining", "on_fire", "_seq")
+
+    def __init__(
+        self,
+        timer_id: int,
+        action: str,
+        deadline: float,
+        label: str = "",
+        on_fire: Optional[Callable[["ScheduledTimer"], None]] = None
+    ):
+        self.timer_id = timer_id
+        self.action = action
+        self.label = label
+        self.on_fire = on_fire
+        self.deadline: Optional[float] = deadline
+        self.paused_remaining: Optional[float] = None
+        self._seq = -1
+
+    @property
+    def is_paused(self) -> bool:
+        """True while the timer is held without a deadline"""
+        return self.deadline is None
+
+    def remaining(self, now: float) -> float:
+        """Seconds until the timer fires"""
+        if self.deadline is None:
+            return self.paused_remaining
+        return max(0.0, self.deadline - now)
+
+
+class TimerScheduler:
+    """Heap of scheduled actions served by a single wakeup thread
+
+    Insert, adjust and resume push a heap entry in O(log n). Cancel and pause
+    only detach the timer; its stale heap entry is skipped when it surfaces
+    and the heap is rebuilt once stale entries outnumber live ones. The
+    thread sleeps until the earliest deadline and is only woken when that
+    deadline moves earlier.
+    """
+
+    def __init__(
+        self,
+        on_fire: Callable[[ScheduledTimer], None],
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.on_fire = on_fire
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._heap: List[tuple] = []
+        self._timers: Dict[int, ScheduledTimer] = {}
+        self._ids = itertools.count(1)
+        self._seqs = itertools.count()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def schedule(
+        self,
+        action: str,
+        delay: float,
+        label: str = "",
+        on_fire: Optional[Callable[[ScheduledTimer], None]] = None
+    ) -> ScheduledTimer:
+        """Schedule action to fire after delay seconds
+
+        on_fire overrides the scheduler-wide callback for this timer.
+        """
+        with self._cond:
+            timer = ScheduledTimer(next(self._ids), action, self._clock() + delay, label, on_fire)
+            self._timers[timer.timer_id] = timer
+            self._push(timer)
+            return timer
+
+    def cancel(self, timer_id: int) -> bool:
+        """Cancel a pending timer; returns False if it was unknown"""
+        with self._cond:
+            timer = self._timers.pop(timer_id, None)
+            if timer is None:
+                return False
+            timer._seq = -1
+            self._maybe_compact()
+            return True
+
+    def adjust(self, timer_id: int, seconds: float, minimum: float = 0) -> Optional[ScheduledTimer]:
+        """Move a timer's deadline by seconds, never below minimum"""
+        with self._cond:
+            timer = self._timers.get(timer_id)
+            if timer is None:
+                return None
+            remaining = max(minimum, timer.remaining(self._clock()) + seconds)
+            if timer.is_paused:
+                timer.paused_remaining = remaining
+            else:
+                timer.deadline = self._clock() + remaining
+                self._push(timer)
+                self._maybe_compact()
+            return timer
+
+    def pause(self, timer_id: int) -> Optional[ScheduledTimer]:
+        """Hold a timer without a deadline"""
+        with self._cond:
+            timer = self._timers.get(timer_id)
+            if timer is not None and not timer.is_paused:
+                timer.paused_remaining = timer.remaining(self._clock())
+                timer.deadline = None
+                timer._seq = -1
+                self._maybe_compact()
+            return timer
+
+    def resume(self, timer_id: int) -> Optional[ScheduledTimer]:
+        """Re-arm a paused timer"""
+        with self._cond:
+            timer = self._timers.get(timer_id)
+            if timer is not None and timer.is_paused:
+                timer.deadline = self._clock() + timer.paused_remaining
+                timer.paused_remaining = None
+                self._push(timer)
+            return timer
+
+    def shift(self, seconds: float) -> None:
+        """Move every armed deadline earlier by seconds (clock rebase)"""
+        with self._cond:
+            for timer in self._timers.values():
+                if not timer.is_paused:
+                    timer.deadline -= seconds
+            self._heap = [
+                (timer.deadline, timer._seq, timer)
+                for timer in self._timers.values() if not timer.is_paused
+            ]
+            heapq.heapify(self._heap)
+            self._cond.notify()
+
+    def get(self, timer_id: int) -> Optional[ScheduledTimer]:
+        """Look up a pending timer"""
+        return self._timers.get(timer_id)
+
+    def pending(self) -> List[ScheduledTimer]:
+        """Pending timers, earliest first (paused timers last)"""
+        with self._cond:
+            now = self._clock()
+            return sorted(
+                self._timers.values(),
+                key=lambda t: (t.is_paused, t.remaining(now))
+            )
+
+    def next_timer(self) -> Optional[ScheduledTimer]:
+        """The armed timer that fires first"""
+        with self._cond:
+            self._drop_stale()
+            return self._heap[0][2] if self._heap else None
+
+    def close(self) -> None:
+        """Stop the wakeup thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def _push(self, timer: ScheduledTimer) -> None:
+        """Add a heap entry and wake the thread if it is the new earliest"""
+        timer._seq = next(self._seqs)
+        heapq.heappush(self._heap, (timer.deadline, timer._seq, timer))
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="ShutEye-scheduler", daemon=True
+            )
+            self._thread.start()
+        elif self._heap[0][1] == timer._seq:
+            self._cond.notify()
+
+    def _drop_stale(self) -> None:
+        """Pop cancelled or superseded entries off the top of the heap"""
+        heap = self._heap
+        while heap and heap[0][2]._seq != heap[0][1]:
+            heapq.heappop(heap)
+
+    def _maybe_compact(self) -> None:
+        """Rebuild the heap once stale entries dominate it"""
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._timers):
+            self._heap = [entry for entry in self._heap if entry[2]._seq == entry[1]]
+            heapq.heapify(self._heap)
+
+    def _run(self) -> None:
+        """Sleep until the earliest deadline, then fire everything due"""
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                self._drop_stale()
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                delay = self._heap[0][0] - self._clock()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                due = []
+                now = self._clock()
+                while self._heap and self._heap[0][0] <= now:
+                    _, seq, timer = heapq.heappop(self._heap)
+                    if timer._seq == seq:
+                        timer._seq = -1
+                        del self._timers[timer.timer_id]
+                        due.append(timer)
+            for timer in due:
+                (timer.on_fire or self.on_fire)(timer)
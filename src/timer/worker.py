@@ -0,0 +1,128 @@
+"""
+Persistent countdown worker thread
+"""
+import threading
+from typing import Callable, Optional
+
+from src.timer.engine import TimerEngine
+
+
+class CountdownWorker:
+    """Single long-lived thread that drives a TimerEngine
+
+    Commands (start, pause, reset, adjust) edit the engine under one condition
+    variable and bump a generation token. Tick and expiry callbacks carry the
+    generation they were produced for, so the receiver can drop anything that
+    was queued before a later command and a countdown can never tick twice.
+    """
+
+    def __init__(
+        self,
+        engine: TimerEngine,
+        on_tick: Callable[[int], None],
+        on_expire: Callable[[int], None]
+    ):
+        self.engine = engine
+        self.on_tick = on_tick
+        self.on_expire = on_expire
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._fired_generation: Optional[int] = None
+        self._tick_interval = 1.0
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="ShutEye-countdown", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def generation(self) -> int:
+        """Token of the most recent command"""
+        return self._generation
+
+    def is_current(self, generation: int) -> bool:
+        """True if a callback's generation is still the latest"""
+        return generation == self._generation
+
+    def start(self) -> None:
+        """Start or resume the countdown"""
+        with self._cond:
+            self.engine.start()
+            self._bump()
+
+    def pause(self) -> None:
+        """Pause the countdown"""
+        with self._cond:
+            self.engine.pause()
+            self._bump()
+
+    def reset(self, remaining: float) -> None:
+        """Stop and load a new remaining time"""
+        with self._cond:
+            self.engine.reset(remaining)
+            self._bump()
+
+    def set_remaining(self, remaining: float) -> None:
+        """Replace the remaining time, keeping the running state"""
+        with self._cond:
+            self.engine.set_remaining(remaining)
+            self._bump()
+
+    def adjust(self, seconds: float, minimum: float = 0) -> float:
+        """Move the deadline by seconds; returns the new remaining time"""
+        with self._cond:
+            remaining = self.engine.adjust(seconds, minimum)
+            self._bump()
+            return remaining
+
+    def shift(self, seconds: float) -> None:
+        """Move a running deadline earlier, e.g. after a suspend gap"""
+        with self._cond:
+            self.engine.shift(seconds)
+            self._bump()
+
+    def set_tick_interval(self, seconds: float) -> None:
+        """Tick every seconds of remaining time instead of every second
+
+        Expiry is still delivered on time. Changing the interval does not
+        count as a command: in-flight callbacks stay valid.
+        """
+        with self._cond:
+            self._tick_interval = max(1.0, float(seconds))
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Stop the worker thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def _bump(self) -> None:
+        """Invalidate in-flight callbacks and wake the thread"""
+        self._generation += 1
+        self._cond.notify()
+
+    def _run(self) -> None:
+        """Wait for the next tick or command; callbacks run outside the lock"""
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                generation = self._generation
+                if not self.engine.is_running or self._fired_generation == generation:
+                    self._cond.wait()
+                    continue
+                if self.engine.is_expired():
+                    self._fired_generation = generation
+                    callback = self.on_expire
+                else:
+                    interval = self._tick_interval
+                    self._cond.wait(self.engine.seconds_until_tick(interval))
+                    if self._closed or self._generation != generation:
+                        continue
+                    if interval != self._tick_interval:
+                        continue  # woken to re-time the next tick
+                    callback = self.on_tick
+            callback(generation)
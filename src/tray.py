@@ -1,9 +1,12 @@
 """
 System tray integration using pystray
 """
+from typing import Optional
+
 try:
     from pystray import Icon, Menu, MenuItem
-    from PIL import Image
+    from src.ui.images import image_cache
+    from src.ui.badge import BadgeRenderer, badge_text
     PYSTRAY_AVAILABLE = True
 except ImportError:
     PYSTRAY_AVAILABLE = False
@@ -16,6 +19,7 @@ class TrayManager:
         self.app = app
         self.icon_path = icon_path
         self.icon = None
+        self.badge = None
 
     def setup_tray(self) -> None:
         """Setup the system tray icon and menu"""
@@ -24,10 +28,10 @@ class TrayManager:
             return
 
         try:
-            # Load icon image and convert to RGBA
-            image = Image.open(self.icon_path)
-            image = image.convert('RGBA')  # Ensure RGBA mode
-            image = image.resize((64, 64), Image.Resampling.LANCZOS)
+            # Shared RGBA icon from the image cache
+            image = image_cache.get(self.icon_path, 64, "RGBA")
+            # Minutes-left badge drawn over it while a countdown runs
+            self.badge = BadgeRenderer(image, color=self.app.primary_color)
 
             # Create menu - MenuItem requires action parameter, not positional
             menu = Menu(
@@ -36,6 +40,12 @@ class TrayManager:
                 Menu.SEPARATOR,
                 MenuItem("Start Timer", action=self._start_timer),
                 MenuItem("Pause Timer", action=self._stop_timer),
+                MenuItem(self._schedule_text, action=self._schedule_selected),
+                MenuItem(
+                    "Scheduled",
+                    Menu(self._scheduled_items),
+                    enabled=lambda item: len(self.app.timer.scheduler) > 0
+                ),
                 Menu.SEPARATOR,
                 MenuItem("Exit", action=self._quit_app),
             )
@@ -68,24 +78,26 @@ class TrayManager:
 
     def update_tooltip(self, message: str) -> None:
         """Update the tray icon tooltip"""
-        if self.icon:
+        if self.icon and self.icon.title != message:
             self.icon.title = message
 
+    def update_badge(self, remaining_seconds: Optional[int]) -> None:
+        """Show the minutes left on the icon (None removes the badge)"""
+        if not self.icon or not self.badge:
+            return
+        image = self.badge.render(badge_text(remaining_seconds))
+        # The renderer returns the same image until the displayed text changes
+        if image is not self.icon.icon:
+            self.icon.icon = image
+
     def _show_window(self, icon=None, item=None) -> None:
         """Show the application window"""
-        def show():
-            self.app.deiconify()
-            self.app.lift()
-            self.app.focus_force()
-        # Schedule in main thread
-        self.app.after(0, show)
+        # Show/hide is a state: only the latest click matters
+        self.app.bus.publish("tray-window", self.app.show_window)
 
     def _hide_window(self, icon=None, item=None) -> None:
         """Hide the application window to tray"""
-        def hide():
-            self.app.withdraw()
-        # Schedule in main thread
-        self.app.after(0, hide)
+        self.app.bus.publish("tray-window", self.app.hide_window)
 
     def _start_timer(self, icon=None, item=None) -> None:
         """Start the timer from tray"""
@@ -93,25 +105,45 @@ class TrayManager:
             if not self.app.is_running:
                 self.app.show_active_screen()
                 self.app.start_timer()
-            self.app.deiconify()
-            self.app.lift()
-            self.app.focus_force()
-        # Schedule in main thread
-        self.app.after(0, start)
+            self.app.show_window()
+        self.app.bus.publish("tray-timer", start)
 
     def _stop_timer(self, icon=None, item=None) -> None:
         """Stop the timer from tray"""
         def stop():
             if self.app.is_running:
                 self.app.pause_timer()
-        # Schedule in main thread
-        self.app.after(0, stop)
+        self.app.bus.publish("tray-timer", stop)
+
+    def refresh_menu(self) -> None:
+        """Rebuild the menu after the scheduled actions changed"""
+        if self.icon:
+            self.icon.update_menu()
+
+    def _schedule_text(self, item) -> str:
+        """Label of the schedule entry: the setup's action and duration"""
+        minutes = -(-self.app.total_seconds // 60)
+        return f"Schedule {self.app.selected_action} in {minutes} min"
+
+    def _schedule_selected(self, icon=None, item=None) -> None:
+        """Schedule the selected action from tray, leaving the countdown alone"""
+        def schedule():
+            self.app.schedule_action(self.app.selected_action, self.app.total_seconds)
+        self.app.bus.post(schedule)
+
+    def _scheduled_items(self):
+        """Build the scheduled-actions submenu; clicking an entry cancels it"""
+        for timer in self.app.timer.scheduler.pending():
+            text = f"Cancel {timer.label or timer.action} ({timer.action})"
+            yield MenuItem(text, action=self._cancel_scheduled(timer.timer_id))
+
+    def _cancel_scheduled(self, timer_id: int):
+        """Menu action that cancels a scheduled action from tray"""
+        return lambda: self.app.bus.post(self.app.cancel_scheduled, timer_id)
 
     def _quit_app(self, icon=None, item=None) -> None:
         """Quit the application"""
         def quit_app():
-            self.app.is_running = False
             self.stop_tray()
-            self.app.quit()
-        # Schedule in main thread
-        self.app.after(0, quit_app)
+            self.app.quit_app()
+        self.app.bus.post(quit_app)
@@ -1,24 +1,30 @@
 """
 UI components package
 """
-from src.ui.components import (
-    CTkHeader,
-    CTkCard,
-    CTkActionCard,
-    CTkQuickButton,
-    CTkTimerDisplay,
-    CTkIconButton,
-    CTkScrollableSection,
-    CTkLabel,
-)
 
-__all__ = [
-    "CTkHeader",
-    "CTkCard",
-    "CTkActionCard",
-    "CTkQuickButton",
-    "CTkTimerDisplay",
-    "CTkIconButton",
-    "CTkScrollableSection",
-    "CTkLabel",
-]
+# Widgets need customtkinter; resolve them on first use so GUI-free modules
+# in this package (images, atlas) can be imported on their own
+_LAZY = {
+    "CTkHeader": "src.ui.components",
+    "CTkCard": "src.ui.components",
+    "CTkActionCard": "src.ui.components",
+    "CTkQuickButton": "src.ui.components",
+    "CTkTimerDisplay": "src.ui.components",
+    "CTkIconButton": "src.ui.components",
+    "CTkScrollableSection": "src.ui.components",
+    "CTkLabel": "src.ui.components",
+    "ImageCache": "src.ui.images",
+    "image_cache": "src.ui.images",
+    "ActiveViewModel": "src.ui.view_models",
+    "UpdateBus": "src.ui.bus",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        return getattr(importlib.import_module(_LAZY[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_LAZY)
@@ -0,0 +1,131 @@
+"""
+Prerendered icon atlas
+
+build_atlas() resamples every icon once at each size the UI uses and
+writes the raw RGBA pixels back to back into one file, with a JSON index
+of offsets. At runtime IconAtlas memory-maps that file and wraps slices in
+PIL images without decoding or resampling anything.
+
+    python -m src.ui.atlas        (also run by build.py)
+"""
+import json
+import mmap
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.constants import (
+    BASE_DIR, ICONS_DIR, APP_LOGO, ATLAS_FILE, ATLAS_INDEX, ATLAS_SIZES
+)
+
+ATLAS_VERSION = 1
+
+
+def atlas_sources() -> List[Path]:
+    """Every image the UI and tray load"""
+    return sorted(ICONS_DIR.glob("*.png")) + [Path(APP_LOGO)]
+
+
+def _key(path) -> str:
+    """Index key for a source image, relative to the app directory"""
+    return os.path.relpath(os.path.abspath(path), BASE_DIR).replace(os.sep, "/")
+
+
+def _fingerprint(path) -> List[int]:
+    """Source mtime and size, to detect a stale atlas"""
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def build_atlas(
+    sources: Optional[Iterable[Path]] = None,
+    sizes: Iterable[int] = ATLAS_SIZES,
+    data_path: Path = ATLAS_FILE,
+    index_path: Path = ATLAS_INDEX
+) -> Dict[str, int]:
+    """Render sources at every size into the atlas; returns a summary"""
+    from PIL import Image
+
+    sources = list(sources or atlas_sources())
+    entries = {}
+    offset = 0
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_data = data_path.with_suffix(data_path.suffix + ".tmp")
+
+    with open(tmp_data, "wb") as out:
+        for source in sources:
+            with Image.open(source) as img:
+                original = img.convert("RGBA")
+            for size in sizes:
+                pixels = original.resize((size, size), Image.Resampling.LANCZOS).tobytes()
+                out.write(pixels)
+                entries[f"{_key(source)}@{size}"] = [offset, size, size]
+                offset += len(pixels)
+
+    index = {
+        "version": ATLAS_VERSION,
+        "sources": {_key(source): _fingerprint(source) for source in sources},
+        "entries": entries,
+    }
+    tmp_index = index_path.with_suffix(index_path.suffix + ".tmp")
+    with open(tmp_index, "w") as f:
+        json.dump(index, f, separators=(",", ":"))
+    os.replace(tmp_data, data_path)
+    os.replace(tmp_index, index_path)
+    return {"images": len(entries), "bytes": offset}
+
+
+class IconAtlas:
+    """Read-only view of a built atlas"""
+
+    def __init__(self, data_path: Path = ATLAS_FILE, index_path: Path = ATLAS_INDEX):
+        with open(index_path) as f:
+            index = json.load(f)
+        if index.get("version") != ATLAS_VERSION:
+            raise ValueError("Atlas was built by a different version")
+        self.entries: Dict[str, list] = index["entries"]
+        self.sources: Dict[str, list] = index["sources"]
+
+        with open(data_path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+    def is_current(self) -> bool:
+        """True if no source image changed since the atlas was built"""
+        try:
+            return all(
+                _fingerprint(BASE_DIR / key) == fingerprint
+                for key, fingerprint in self.sources.items()
+            )
+        except OSError:
+            return False
+
+    def get(self, path, size: int):
+        """RGBA PIL image backed by the mapped file, or None if not in the atlas"""
+        entry = self.entries.get(f"{_key(path)}@{size}")
+        if entry is None:
+            return None
+        from PIL import Image
+
+        offset, width, height = entry
+        pixels = self._view[offset:offset + width * height * 4]
+        return Image.frombuffer("RGBA", (width, height), pixels, "raw", "RGBA", 0, 1)
+
+
+def open_atlas() -> Optional[IconAtlas]:
+    """The bundled atlas if it exists and matches the icons on disk"""
+    try:
+        atlas = IconAtlas()
+    except (OSError, ValueError, KeyError):
+        return None
+    # A frozen build's files are immutable but get fresh mtimes when unpacked
+    if not getattr(sys, "frozen", False) and not atlas.is_current():
+        print("Icon atlas is out of date; loading icons from PNG")
+        return None
+    return atlas
+
+
+if __name__ == "__main__":
+    summary = build_atlas()
+    print(f"Icon atlas: {summary['images']} images, {summary['bytes'] // 1024} KB -> {ATLAS_FILE}")
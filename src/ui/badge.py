@@ -0,0 +1,121 @@
+"""
+Tray icon badge showing the minutes left, composed from cached glyphs
+"""
+from typing import Dict, Optional
+
+from PIL import Image, ImageDraw, ImageFont
+
+BADGE_CHARS = "0123456789h"
+
+# Bold sans fonts tried in order; Pillow's built-in font is the fallback
+BADGE_FONTS = ("DejaVuSans-Bold.ttf", "arialbd.ttf", "Arial Bold.ttf", "LiberationSans-Bold.ttf")
+
+
+def badge_text(remaining_seconds: Optional[int]) -> str:
+    """Minutes left, rounded up, as the badge shows them ("" for no badge)
+
+    Up to 99 minutes the badge shows minutes; beyond that, whole hours.
+    """
+    if remaining_seconds is None:
+        return ""
+    minutes = -(-remaining_seconds // 60)
+    if minutes < 100:
+        return str(minutes)
+    return f"{-(-minutes // 60)}h"
+
+
+def _load_font(size: int) -> ImageFont.ImageFont:
+    """First available bold font at size"""
+    for name in BADGE_FONTS:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        return ImageFont.load_default()  # Pillow < 10.1 has no sized default
+
+
+class BadgeRenderer:
+    """Draws a text badge over the bottom-right corner of a tray icon
+
+    Every character is rendered once, into a fixed-width cell, when the
+    renderer is created, and so is the badge background for each text
+    length. A redraw copies the base icon and alpha-composites the
+    background and one cell per character; no text layout runs after
+    start-up. The last result is memoized, so asking for the same text
+    again costs nothing.
+    """
+
+    def __init__(
+        self,
+        base: Image.Image,
+        color: str = "#1973f0",
+        text_color: str = "#ffffff",
+        height_ratio: float = 0.5,
+        max_chars: int = 3
+    ):
+        self.base = base.convert("RGBA")
+        width, height = self.base.size
+        self.badge_height = max(8, int(height * height_ratio))
+        self.padding = self.badge_height // 5
+        font = _load_font(int(self.badge_height * 0.85))
+
+        boxes = {char: font.getbbox(char) for char in BADGE_CHARS}
+        self.cell_width = max(box[2] - box[0] for box in boxes.values())
+        ink_height = max(box[3] - box[1] for box in boxes.values())
+        top = (self.badge_height - ink_height) // 2
+
+        self.glyphs: Dict[str, Image.Image] = {}
+        for char, box in boxes.items():
+            glyph = Image.new("RGBA", (self.cell_width, self.badge_height), (0, 0, 0, 0))
+            left = (self.cell_width - (box[2] - box[0])) // 2
+            ImageDraw.Draw(glyph).text(
+                (left - box[0], top - box[1]), char, font=font, fill=text_color
+            )
+            self.glyphs[char] = glyph
+
+        # Background pill per text length, clipped to the icon width
+        self.backgrounds: Dict[int, Image.Image] = {}
+        for length in range(1, max_chars + 1):
+            pill_width = min(width, length * self.cell_width + 2 * self.padding)
+            pill = Image.new("RGBA", (pill_width, self.badge_height), (0, 0, 0, 0))
+            ImageDraw.Draw(pill).rounded_rectangle(
+                (0, 0, pill_width - 1, self.badge_height - 1),
+                radius=self.badge_height // 2, fill=color
+            )
+            self.backgrounds[length] = pill
+
+        self.renders = 0
+        self._last_text: Optional[str] = None
+        self._last_image: Optional[Image.Image] = None
+
+    def render(self, text: str) -> Image.Image:
+        """Base icon with text in the badge (the base itself for no text)"""
+        if text == self._last_text:
+            return self._last_image
+        if not text:
+            image = self.base
+        else:
+            image = self._compose(text)
+            self.renders += 1
+        self._last_text, self._last_image = text, image
+        return image
+
+    def _compose(self, text: str) -> Image.Image:
+        """Blit the background and glyph cells onto a copy of the base"""
+        width, height = self.base.size
+        background = self.backgrounds.get(len(text)) or self.backgrounds[max(self.backgrounds)]
+        x = width - background.width
+        y = height - self.badge_height
+
+        image = self.base.copy()
+        image.alpha_composite(background, (x, y))
+        x += (background.width - len(text) * self.cell_width) // 2
+        for char in text:
+            glyph = self.glyphs.get(char)
+            if glyph is not None and 0 <= x <= width - self.cell_width:
+                image.alpha_composite(glyph, (x, y))
+            x += self.cell_width
+        return image
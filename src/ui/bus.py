@@ -0,0 +1,145 @@
+"""
+Coalescing update channel from background threads to the Tk main loop
+"""
+import itertools
+import threading
+import time
+import traceback
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Hashable
+
+
+class UpdateBus:
+    """Thread-safe queue of UI work drained by one pump on the Tk thread
+
+    Producers publish(key, fn, *args) state changes and post(fn, *args)
+    commands. A state change replaces any pending one with the same key, so
+    only the latest value per key is delivered; commands all run, in order.
+    A single pump is scheduled through schedule(delay_ms, fn) (Tk's after())
+    at most once per frame, and each pump stops after budget_ms, leaving the
+    rest for the next frame instead of stalling the event loop.
+    """
+
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], None]], Any],
+        frame_ms: int = 16,
+        budget_ms: int = 8,
+        clock: Callable[[], float] = time.perf_counter,
+        history: int = 1024
+    ):
+        self._schedule = schedule
+        self.frame = frame_ms / 1000
+        self.budget = budget_ms / 1000
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._commands = itertools.count()
+        self._scheduled = False
+        self._closed = False
+        self._last_pump = float("-inf")
+
+        # Stats; latencies are the most recent post-to-run delays
+        self.posted = 0
+        self.coalesced = 0
+        self.delivered = 0
+        self.pumps = 0
+        self.overruns = 0
+        self.max_depth = 0
+        self._latencies: deque = deque(maxlen=history)
+
+    def publish(self, key: Hashable, fn: Callable[..., None], *args) -> None:
+        """Deliver fn(*args) unless a later publish for key supersedes it"""
+        self._enqueue(("state", key), fn, args)
+
+    def post(self, fn: Callable[..., None], *args) -> None:
+        """Run fn(*args) on the Tk thread; never coalesced"""
+        self._enqueue(("command", next(self._commands)), fn, args)
+
+    def submit(self, fn: Callable[[], None]) -> None:
+        """Dispatcher interface used by the control server"""
+        self.post(fn)
+
+    def close(self) -> None:
+        """Drop pending and future work (the window is going away)"""
+        with self._lock:
+            self._closed = True
+            self._pending.clear()
+
+    @property
+    def depth(self) -> int:
+        """Entries waiting for the pump"""
+        return len(self._pending)
+
+    def stats(self) -> Dict[str, float]:
+        """Queue depth, throughput counters and latency percentiles in ms"""
+        latencies = sorted(self._latencies)
+
+        def percentile(q: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "posted": self.posted,
+            "coalesced": self.coalesced,
+            "delivered": self.delivered,
+            "pumps": self.pumps,
+            "overruns": self.overruns,
+            "latency_p50_ms": percentile(0.5),
+            "latency_p99_ms": percentile(0.99),
+            "latency_max_ms": percentile(1.0),
+        }
+
+    def _enqueue(self, key: tuple, fn: Callable[..., None], args: tuple) -> None:
+        """Queue an entry and make sure a pump is coming (any thread)"""
+        with self._lock:
+            if self._closed:
+                return
+            self.posted += 1
+            if key in self._pending:
+                # Keeps its place in the queue, takes the newer value
+                self.coalesced += 1
+            self._pending[key] = (fn, args, self._clock())
+            self.max_depth = max(self.max_depth, len(self._pending))
+            delay = self._claim_pump()
+        if delay is not None:
+            self._schedule(delay, self._pump)
+
+    def _claim_pump(self):
+        """Delay in ms for a new pump, or None if one is scheduled (lock held)"""
+        if self._scheduled:
+            return None
+        self._scheduled = True
+        wait = self._last_pump + self.frame - self._clock()
+        return int(max(0.0, wait) * 1000)
+
+    def _pump(self) -> None:
+        """Run queued entries until the queue is empty or the budget is spent"""
+        started = self._clock()
+        with self._lock:
+            self._scheduled = False
+            self._last_pump = started
+        self.pumps += 1
+        stop_at = started + self.budget
+
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return
+                if self._clock() >= stop_at:
+                    self.overruns += 1
+                    delay = self._claim_pump()
+                    break
+                _, (fn, args, posted_at) = self._pending.popitem(last=False)
+            self._latencies.append(self._clock() - posted_at)
+            self.delivered += 1
+            try:
+                fn(*args)
+            except Exception:
+                traceback.print_exc()
+
+        if delay is not None:
+            self._schedule(delay, self._pump)
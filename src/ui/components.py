@@ -3,7 +3,8 @@ Reusable UI components for CustomTkinter
 """
 import customtkinter as ctk
 from typing import Callable, Optional
-from PIL import Image
+
+from src.ui.images import image_cache
 
 
 class CTkHeader(ctk.CTkFrame):
@@ -27,9 +28,7 @@ class CTkHeader(ctk.CTkFrame):
                 # Use back icon
                 try:
                     from src.constants import ICON_BACK
-                    back_img = Image.open(ICON_BACK)
-                    back_img = back_img.resize((20, 20), Image.Resampling.LANCZOS)
-                    back_icon = ctk.CTkImage(light_image=back_img, dark_image=back_img, size=(20, 20))
+                    back_icon = image_cache.get_ctk(ICON_BACK, 20)
                     self.left_btn = ctk.CTkButton(
                         self, text="", image=back_icon, width=40, height=40,
                         fg_color="transparent", hover_color=kwargs.get("hover_color", "#2d3748"),
@@ -65,9 +64,7 @@ class CTkHeader(ctk.CTkFrame):
                 # Use settings icon
                 try:
                     from src.constants import ICON_SETTINGS
-                    settings_img = Image.open(ICON_SETTINGS)
-                    settings_img = settings_img.resize((20, 20), Image.Resampling.LANCZOS)
-                    settings_icon = ctk.CTkImage(light_image=settings_img, dark_image=settings_img, size=(20, 20))
+                    settings_icon = image_cache.get_ctk(ICON_SETTINGS, 20)
                     self.right_btn = ctk.CTkButton(
                         self, text="", image=settings_icon, width=40, height=40,
                         fg_color="transparent", hover_color=kwargs.get("hover_color", "#2d3748"),
@@ -176,9 +173,7 @@ class CTkActionCard(ctk.CTkFrame):
         
         # Icon
         try:
-            img = Image.open(icon_path)
-            img = img.resize((40, 40), Image.Resampling.LANCZOS)
-            icon_image = ctk.CTkImage(light_image=img, size=(40, 40))
+            icon_image = image_cache.get_ctk(icon_path, 40)
             self.icon_label = ctk.CTkLabel(
                 inner_frame, image=icon_image, text="",
                 fg_color=primary_color if is_selected else "#2d3748",
@@ -203,21 +198,20 @@ class CTkActionCard(ctk.CTkFrame):
         title_label.pack(fill="x")
         title_label.bind("<Button-1>", lambda e: on_click() if on_click else None)
         
-        # Description
-        desc_label = ctk.CTkLabel(
+        # Description, replaced by the reason while the action is unavailable
+        self.description = description
+        self.desc_label = ctk.CTkLabel(
             text_frame, text=description,
             font=ctk.CTkFont(size=11), text_color="#9ca8ba", anchor="w"
         )
-        desc_label.pack(fill="x")
-        desc_label.bind("<Button-1>", lambda e: on_click() if on_click else None)
+        self.desc_label.pack(fill="x")
+        self.desc_label.bind("<Button-1>", lambda e: on_click() if on_click else None)
         
         # Checkmark icon
         if is_selected:
             try:
                 from src.constants import ICON_CHECK
-                check_img = Image.open(ICON_CHECK)
-                check_img = check_img.resize((20, 20), Image.Resampling.LANCZOS)
-                check_icon = ctk.CTkImage(light_image=check_img, dark_image=check_img, size=(20, 20))
+                check_icon = image_cache.get_ctk(ICON_CHECK, 20)
                 self.check_label = ctk.CTkLabel(
                     inner_frame, text="", image=check_icon
                 )
@@ -233,6 +227,13 @@ class CTkActionCard(ctk.CTkFrame):
                 self.check_label.pack(side="right")
                 self.check_label.bind("<Button-1>", lambda e: on_click() if on_click else None)
 
+    def set_unavailable(self, reason: Optional[str]) -> None:
+        """Show why the action cannot run here, or the description again"""
+        if reason:
+            self.desc_label.configure(text=f"Unavailable: {reason}", text_color="#e5a00d")
+        else:
+            self.desc_label.configure(text=self.description, text_color="#9ca8ba")
+
     def set_selected(self, selected: bool) -> None:
         """Update selection state"""
         if self.is_selected == selected:
@@ -254,9 +255,7 @@ class CTkActionCard(ctk.CTkFrame):
                     inner_frame = self.icon_label.master
                     try:
                         from src.constants import ICON_CHECK
-                        check_img = Image.open(ICON_CHECK)
-                        check_img = check_img.resize((20, 20), Image.Resampling.LANCZOS)
-                        check_icon = ctk.CTkImage(light_image=check_img, dark_image=check_img, size=(20, 20))
+                        check_icon = image_cache.get_ctk(ICON_CHECK, 20)
                         self.check_label = ctk.CTkLabel(
                             inner_frame, text="", image=check_icon
                         )
@@ -411,9 +410,7 @@ class CTkIconButton(ctk.CTkButton):
         
         if icon_path:
             try:
-                img = Image.open(icon_path)
-                img = img.resize((24, 24), Image.Resampling.LANCZOS)
-                icon_image = ctk.CTkImage(light_image=img, size=(24, 24))
+                icon_image = image_cache.get_ctk(icon_path, 24)
                 self.configure(image=icon_image)
                 self.image = icon_image
             except Exception:
@@ -0,0 +1,127 @@
+"""
+Shared image cache for icons used by components, screens and the tray
+
+Pillow is imported on the first cache miss, not with this module.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple, Union
+
+Size = Union[int, Tuple[int, int]]
+
+
+class ImageCache:
+    """LRU cache of decoded and resized images keyed on (path, size, mode)
+
+    Sizes found in the prerendered icon atlas are sliced from it; anything
+    else is decoded once and resampled once. CTkImage wrappers are cached
+    the same way, so rebuilding a widget never touches the disk. Safe to use
+    from the tray thread as well as Tk's.
+    """
+
+    def __init__(self, max_entries: int = 128, use_atlas: bool = True):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._atlas = None
+        self._atlas_checked = not use_atlas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.atlas_hits = 0
+
+    def get(self, path: str, size: Size = None, mode: str = "RGBA") -> "Image.Image":
+        """PIL image of path converted to mode, resized to size if given"""
+        from PIL import Image
+
+        size = _normalize(size)
+        key = (str(path), size, mode)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        image = self._from_atlas(path, size)
+        if image is not None:
+            if mode != "RGBA":
+                image = image.convert(mode)
+        elif size is None:
+            with Image.open(path) as img:
+                image = img.convert(mode)
+        else:
+            image = self.get(path, None, mode).resize(size, Image.Resampling.LANCZOS)
+        return self._store(key, image)
+
+    def get_ctk(self, path: str, size: Size) -> "ctk.CTkImage":
+        """Shared CTkImage for path at size (same image for light and dark)"""
+        import customtkinter as ctk
+
+        size = _normalize(size)
+        key = (str(path), size, "ctk")
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        image = self.get(path, size)
+        return self._store(key, ctk.CTkImage(light_image=image, dark_image=image, size=size))
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and current size"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "atlas_hits": self.atlas_hits,
+            "entries": len(self._entries),
+        }
+
+    def clear(self) -> None:
+        """Drop every cached image"""
+        with self._lock:
+            self._entries.clear()
+
+    def _from_atlas(self, path: str, size):
+        """Prerendered square icon from the atlas, if there is one"""
+        if not self._atlas_checked:
+            with self._lock:
+                if not self._atlas_checked:
+                    from src.ui.atlas import open_atlas
+                    self._atlas = open_atlas()
+                    self._atlas_checked = True
+        if self._atlas is None or size is None or size[0] != size[1]:
+            return None
+        image = self._atlas.get(path, size[0])
+        if image is not None:
+            self.atlas_hits += 1
+        return image
+
+    def _lookup(self, key: tuple):
+        """Return a cached entry and mark it recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _store(self, key: tuple, value):
+        """Insert an entry, evicting the least recently used ones"""
+        with self._lock:
+            # Another thread may have loaded it meanwhile; keep the first copy
+            value = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return value
+
+
+def _normalize(size: Size):
+    """Square sizes may be given as a single int"""
+    if size is None or isinstance(size, tuple):
+        return size
+    return (size, size)
+
+
+# Application-wide cache
+image_cache = ImageCache()
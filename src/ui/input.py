@@ -0,0 +1,113 @@
+"""
+Input helpers: accumulated, accelerated mouse-wheel adjustment
+"""
+import sys
+import time
+from typing import Any, Callable
+
+# (notches into a scroll gesture, seconds per notch from there on)
+WHEEL_ACCELERATION = ((0, 60), (6, 300), (16, 900))
+
+
+def wheel_notches(event) -> float:
+    """Signed wheel notches in a Tk scroll event (positive = up)"""
+    if event.num == 4:
+        return 1.0
+    if event.num == 5:
+        return -1.0
+    delta = getattr(event, "delta", 0)
+    if sys.platform == "darwin":
+        return float(delta)  # macOS reports small per-notch units
+    return delta / 120  # Windows: 120 per notch, less on precision touchpads
+
+
+class WheelAccumulator:
+    """Turns a burst of wheel events into one time adjustment
+
+    Events only add to a pending total. At most once per frame on_change()
+    runs so the screen can preview it; once no event has arrived for
+    idle_ms the total is handed to on_commit(seconds) in a single call.
+    Within one gesture the step per notch grows (1, 5, then 15 minutes);
+    reversing direction starts a new gesture.
+    """
+
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], None]], Any],
+        on_change: Callable[[], None],
+        on_commit: Callable[[int], None],
+        frame_ms: int = 16,
+        idle_ms: int = 250,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._schedule = schedule
+        self.on_change = on_change
+        self.on_commit = on_commit
+        self.frame_ms = frame_ms
+        self.idle_ms = idle_ms
+        self._clock = clock
+        self.pending = 0
+        self._shown = 0
+        self._direction = 0
+        self._gesture = 0
+        self._fraction = 0.0
+        self._last_event = 0.0
+        self._frame_scheduled = False
+        self._idle_scheduled = False
+
+    def feed(self, event) -> None:
+        """Tk wheel event handler"""
+        self.add_notches(wheel_notches(event))
+
+    def add_notches(self, notches: float) -> None:
+        """Accumulate signed notches; partial touchpad notches carry over"""
+        if not notches:
+            return
+        direction = 1 if notches > 0 else -1
+        if direction != self._direction:
+            self._direction = direction
+            self._gesture = 0
+            self._fraction = 0.0
+        self._fraction += abs(notches)
+        while self._fraction >= 1:
+            self._fraction -= 1
+            self.pending += direction * self._step()
+            self._gesture += 1
+
+        self._last_event = self._clock()
+        if not self._frame_scheduled:
+            self._frame_scheduled = True
+            self._schedule(self.frame_ms, self._frame)
+        if not self._idle_scheduled:
+            self._idle_scheduled = True
+            self._schedule(self.idle_ms, self._check_idle)
+
+    def _step(self) -> int:
+        """Seconds per notch at the current point of the gesture"""
+        for notches, seconds in reversed(WHEEL_ACCELERATION):
+            if self._gesture >= notches:
+                return seconds
+        return WHEEL_ACCELERATION[0][1]
+
+    def _frame(self) -> None:
+        """Preview the pending total once per frame"""
+        self._frame_scheduled = False
+        if self.pending != self._shown:
+            self._shown = self.pending
+            self.on_change()
+
+    def _check_idle(self) -> None:
+        """Commit once scrolling has stopped for idle_ms"""
+        quiet = (self._clock() - self._last_event) * 1000
+        if quiet < self.idle_ms:
+            self._schedule(max(1, int(self.idle_ms - quiet)), self._check_idle)
+            return
+        self._idle_scheduled = False
+        total, shown = self.pending, self._shown
+        self.pending = self._shown = 0
+        self._direction = self._gesture = 0
+        self._fraction = 0.0
+        if total:
+            self.on_commit(total)
+        elif shown:
+            self.on_change()  # scrolled back to where it started
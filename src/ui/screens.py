@@ -2,41 +2,98 @@
 Screen/Page components for the application
 """
 import customtkinter as ctk
-from typing import Callable, TYPE_CHECKING
-from PIL import Image
+from typing import Callable, List, Set, TYPE_CHECKING
 
 from src.ui.components import (
     CTkHeader, CTkQuickButton, CTkActionCard,
     CTkTimerDisplay, CTkScrollableSection, CTkLabel
 )
+from src.ui.images import image_cache
+from src.ui.input import WheelAccumulator
+from src.ui.view_models import ActiveViewModel, ACTION_TEXTS
 from src.utils.time_utils import (
-    format_time_display, format_time_simple, seconds_to_hms_strings, get_end_time
+    format_time_display, format_time_simple, get_end_time
 )
 from src.constants import ICON_SETTINGS, ICON_PLAY, ICON_CHECK, APP_LOGO
 from src.config import ConfigManager
 
 if TYPE_CHECKING:
-    from main import TimerApp
+    from src.app import TimerApp
 
 
-class SettingsScreen:
-    """Settings/About screen"""
+class Screen:
+    """Base for screens that are built once and swapped in and out
+
+    The widget tree is built on first show and kept; navigating away only
+    pack_forget()s it, and showing it again re-packs it and refreshes the
+    data it displays.
+    """
+
+    # Config sections whose reload rebuilds the screen
+    CONFIG_SECTIONS = frozenset({"theme"})
 
     def __init__(self, app: "TimerApp"):
         self.app = app
         self.config = app.config
+        self.frame = None
+        self.visible = False
 
     def show(self) -> None:
-        """Display the settings screen"""
-        # Clear window
-        for widget in self.app.winfo_children():
-            widget.destroy()
+        """Display the screen, building it the first time"""
+        if self.frame is None:
+            self.frame = self.build()
+        if not self.visible:
+            self.frame.pack(fill="both", expand=True, padx=0, pady=0)
+            self.visible = True
+        self.refresh()
+
+    def hide(self) -> None:
+        """Take the screen out of the window, keeping its widgets"""
+        if self.frame is not None and self.visible:
+            self.frame.pack_forget()
+            self.visible = False
+
+    def build(self):
+        """Create the screen's widgets and return its (unpacked) container"""
+        raise NotImplementedError
+
+    def refresh(self) -> None:
+        """Bring displayed data up to date"""
+
+    def rebuild(self) -> None:
+        """Replace the whole widget tree, keeping the screen where it was"""
+        if self.frame is None:
+            return
+        was_visible = self.visible
+        self.frame.destroy()
+        self.frame = None
+        self.visible = False
+        if was_visible:
+            self.show()
+
+    def apply_config(self, changed: Set[str]) -> List[str]:
+        """Follow a config reload; returns the parts that were rebuilt
+
+        A screen that was never built has nothing to update. Theme colours
+        are baked into every widget, so a theme change rebuilds the screen.
+        """
+        if self.frame is None or not changed & self.CONFIG_SECTIONS:
+            return []
+        self.rebuild()
+        return [type(self).__name__]
+
+
+class SettingsScreen(Screen):
+    """Settings/About screen"""
+
+    CONFIG_SECTIONS = frozenset({"theme", "app", "developer"})
 
+    def build(self):
+        """Create the settings screen"""
         # Main container with scrollable frame
         main_container = CTkScrollableSection(
             self.app, fg_color=self.app.bg_dark
         )
-        main_container.pack(fill="both", expand=True, padx=0, pady=0)
 
         # Header
         header = CTkHeader(
@@ -69,9 +126,7 @@ class SettingsScreen:
 
         # Logo
         try:
-            logo_img = Image.open(APP_LOGO)
-            logo_img = logo_img.resize((80, 80), Image.Resampling.LANCZOS)
-            logo_image = ctk.CTkImage(light_image=logo_img, size=(80, 80))
+            logo_image = image_cache.get_ctk(APP_LOGO, 80)
             logo_label = ctk.CTkLabel(card_inner, image=logo_image, text="")
             logo_label.image = logo_image
             logo_label.pack(pady=(0, 15))
@@ -158,6 +213,8 @@ class SettingsScreen:
         # Spacing
         ctk.CTkFrame(main_container, fg_color="transparent", height=30).pack()
 
+        return main_container
+
     def _open_website(self, url: str) -> None:
         """Open website in browser"""
         import webbrowser
@@ -167,24 +224,18 @@ class SettingsScreen:
             print(f"Error opening website: {e}")
 
 
-class SetupScreen:
+class SetupScreen(Screen):
     """Initial timer setup screen"""
 
     def __init__(self, app: "TimerApp"):
-        self.app = app
-        self.config = app.config
+        super().__init__(app)
         self.start_btn_setup = None
         self.action_cards = {}  # Store references to action cards
 
-    def show(self) -> None:
-        """Display the timer setup screen"""
-        # Clear window
-        for widget in self.app.winfo_children():
-            widget.destroy()
-
+    def build(self):
+        """Create the timer setup screen"""
         # Main container
         main_container = ctk.CTkFrame(self.app, fg_color=self.app.bg_dark)
-        main_container.pack(fill="both", expand=True, padx=0, pady=0)
 
         # Header
         header = CTkHeader(
@@ -253,10 +304,7 @@ class SetupScreen:
         # Use stopwatch icon for start button
         try:
             from src.constants import ICON_STOPWATCH
-            from PIL import Image
-            stopwatch_img = Image.open(ICON_STOPWATCH)
-            stopwatch_img = stopwatch_img.resize((24, 24), Image.Resampling.LANCZOS)
-            stopwatch_icon = ctk.CTkImage(light_image=stopwatch_img, dark_image=stopwatch_img, size=(24, 24))
+            stopwatch_icon = image_cache.get_ctk(ICON_STOPWATCH, 24)
             self.start_btn_setup = ctk.CTkButton(
                 start_container,
                 text=f"  Start Timer ({format_time_simple(self.app.total_seconds)})",
@@ -283,7 +331,7 @@ class SetupScreen:
             left_panel,
             text="Keep screen on",
             variable=self.keep_screen_on_var,
-            command=lambda: setattr(self.app, 'keep_screen_on', self.keep_screen_on_var.get()),
+            command=lambda: self.app.set_keep_screen_on(self.keep_screen_on_var.get()),
             font=ctk.CTkFont(size=14),
             fg_color=self.app.primary_color,
             hover_color="#1557b0"
@@ -298,21 +346,12 @@ class SetupScreen:
         quick_add_label.pack(fill="x", pady=(10, 10))
 
         # Quick add buttons grid (2 columns for desktop)
-        quick_frame = ctk.CTkFrame(left_panel, fg_color=self.app.bg_dark)
-        quick_frame.pack(fill="x", pady=5)
-
-        quick_times = self.config.get_quick_times()
-
-        for i, item in enumerate(quick_times):
-            btn = CTkQuickButton(
-                quick_frame, text=item["label"],
-                command=lambda s=item["seconds"]: self.app.add_time(s),
-                card_bg=self.app.card_bg
-            )
-            btn.grid(row=i//2, column=i%2, padx=5, pady=5, sticky="ew")
+        self.quick_frame = ctk.CTkFrame(left_panel, fg_color=self.app.bg_dark)
+        self.quick_frame.pack(fill="x", pady=5)
+        self._build_quick_times()
 
-        quick_frame.grid_columnconfigure(0, weight=1)
-        quick_frame.grid_columnconfigure(1, weight=1)
+        self.quick_frame.grid_columnconfigure(0, weight=1)
+        self.quick_frame.grid_columnconfigure(1, weight=1)
 
         # Right side - System Actions
         right_panel = CTkScrollableSection(content_container, fg_color=self.app.bg_dark)
@@ -325,17 +364,57 @@ class SetupScreen:
         )
         action_label.pack(fill="x", pady=(10, 10))
 
-        # Action cards
-        actions = self.config.get_actions()
+        # Action cards, in their own frame so a reload can replace just them
+        self.actions_frame = ctk.CTkFrame(right_panel, fg_color="transparent")
+        self.actions_frame.pack(fill="x")
+        self._build_action_cards()
+
+        return main_container
+
+    def _build_quick_times(self) -> None:
+        """(Re)create the quick add buttons from the config"""
+        for child in self.quick_frame.winfo_children():
+            child.destroy()
+        for i, item in enumerate(self.config.snapshot.quick_times):
+            btn = CTkQuickButton(
+                self.quick_frame, text=item.label,
+                command=lambda s=item.seconds: self.app.add_time(s),
+                card_bg=self.app.card_bg
+            )
+            btn.grid(row=i//2, column=i%2, padx=5, pady=5, sticky="ew")
 
-        for action in actions:
+    def _build_action_cards(self) -> None:
+        """(Re)create the action cards from the config"""
+        for child in self.actions_frame.winfo_children():
+            child.destroy()
+        self.action_cards = {}
+        for action in self.config.snapshot.actions:
             self._create_action_card(
-                right_panel,
-                action["name"],
-                action.get("icon", ""),
-                action["description"]
+                self.actions_frame,
+                action.name,
+                action.icon,
+                action.description
             )
 
+    def apply_config(self, changed: Set[str]) -> List[str]:
+        """Rebuild only the quick add grid or action cards when those change"""
+        if self.frame is None or "theme" in changed:
+            return super().apply_config(changed)
+        rebuilt = []
+        if "quick_times" in changed:
+            self._build_quick_times()
+            rebuilt.append("SetupScreen.quick_times")
+        if "actions" in changed:
+            self._build_action_cards()
+            rebuilt.append("SetupScreen.actions")
+        return rebuilt
+
+    def refresh(self) -> None:
+        """Show the current duration, action and keep-screen-on state"""
+        self.update_display()
+        self.update_action_selection(self.app.selected_action)
+        self.keep_screen_on_var.set(self.app.keep_screen_on)
+
     def _create_action_card(
         self,
         parent,
@@ -361,11 +440,14 @@ class SetupScreen:
             bg_dark=self.app.bg_dark
         )
         card.pack(fill="x", padx=5, pady=5)
+        card.set_unavailable(self.app.unsupported_actions.get(action))
         # Store reference to the card
         self.action_cards[action] = card
 
     def update_display(self) -> None:
         """Update setup display with current time"""
+        if self.frame is None:
+            return
         self.setup_time_display.configure(
             text=format_time_display(self.app.total_seconds)
         )
@@ -373,6 +455,11 @@ class SetupScreen:
             text=f"Start Timer ({format_time_simple(self.app.total_seconds)})"
         )
 
+    def update_unsupported(self) -> None:
+        """Mark the cards of actions the capability probe found cannot run"""
+        for action_name, card in self.action_cards.items():
+            card.set_unavailable(self.app.unsupported_actions.get(action_name))
+
     def update_action_selection(self, selected_action: str) -> None:
         """Update action card selection without reloading"""
         for action_name, card in self.action_cards.items():
@@ -380,26 +467,30 @@ class SetupScreen:
                 card.set_selected(action_name == selected_action)
 
 
-class ActiveScreen:
+class ActiveScreen(Screen):
     """Active timer countdown screen"""
 
     def __init__(self, app: "TimerApp"):
-        self.app = app
-        self.config = app.config
+        super().__init__(app)
         self.timer_display = None
         self.play_pause_btn = None
         self.status_label = None
         self.duration_label = None
+        self.action_display_label = None
+        self.view_model = ActiveViewModel()
+        self._field_labels = {}
+        self.wheel = WheelAccumulator(
+            app.after, on_change=self.update_display, on_commit=app.add_time_active
+        )
 
-    def show(self) -> None:
-        """Display the active timer screen"""
-        # Clear window
-        for widget in self.app.winfo_children():
-            widget.destroy()
+        # Label configure() calls made by update_display, for profiling
+        self.display_updates = 0
+        self.configure_calls = 0
 
+    def build(self):
+        """Create the active timer screen"""
         # Main container
         main_container = ctk.CTkFrame(self.app, fg_color=self.app.bg_dark)
-        main_container.pack(fill="both", expand=True)
 
         # Header
         header = CTkHeader(
@@ -436,13 +527,10 @@ class ActiveScreen:
         control_frame.pack(pady=(20, 20))
 
         from src.constants import ICON_REDO, ICON_PLAY, ICON_STOP
-        from PIL import Image
 
         # Reset button with icon
         try:
-            redo_img = Image.open(ICON_REDO)
-            redo_img = redo_img.resize((24, 24), Image.Resampling.LANCZOS)
-            redo_icon = ctk.CTkImage(light_image=redo_img, dark_image=redo_img, size=(24, 24))
+            redo_icon = image_cache.get_ctk(ICON_REDO, 24)
             reset_btn = ctk.CTkButton(
                 control_frame, text="", image=redo_icon, width=56, height=56,
                 fg_color=self.app.card_bg, hover_color="#3a4556",
@@ -460,9 +548,7 @@ class ActiveScreen:
 
         # Play/Pause button with icon
         try:
-            play_img = Image.open(ICON_PLAY)
-            play_img = play_img.resize((32, 32), Image.Resampling.LANCZOS)
-            play_icon = ctk.CTkImage(light_image=play_img, dark_image=play_img, size=(32, 32))
+            play_icon = image_cache.get_ctk(ICON_PLAY, 32)
             self.play_pause_btn = ctk.CTkButton(
                 control_frame, text="", image=play_icon, width=80, height=80,
                 fg_color=self.app.primary_color, hover_color="#1557b0",
@@ -481,9 +567,7 @@ class ActiveScreen:
 
         # Stop button with icon
         try:
-            stop_img = Image.open(ICON_STOP)
-            stop_img = stop_img.resize((24, 24), Image.Resampling.LANCZOS)
-            stop_icon = ctk.CTkImage(light_image=stop_img, dark_image=stop_img, size=(24, 24))
+            stop_icon = image_cache.get_ctk(ICON_STOP, 24)
             stop_btn = ctk.CTkButton(
                 control_frame, text="", image=stop_icon, width=56, height=56,
                 fg_color=self.app.card_bg, hover_color="#3a4556",
@@ -511,14 +595,7 @@ class ActiveScreen:
         action_inner.pack(fill="x", padx=20, pady=20)
 
         # Get action display text
-        action_texts = {
-            "Shutdown": "SHUTTING DOWN",
-            "Restart": "RESTARTING",
-            "Sleep": "SLEEPING",
-            "Lock": "LOCKING",
-            "Log Out": "LOGGING OUT"
-        }
-        action_display_text = action_texts.get(self.app.selected_action, self.app.selected_action)
+        action_display_text = ACTION_TEXTS.get(self.app.selected_action, self.app.selected_action)
 
         self.action_display_label = CTkLabel(
             action_inner,
@@ -591,14 +668,10 @@ class ActiveScreen:
         )
         plus_btn.pack(side="left", padx=5)
 
-        # Bind mouse wheel scroll events for time adjustment
-        def on_scroll(event):
-            """Handle scroll wheel events"""
-            if event.num == 4 or event.delta > 0:  # Scroll up
-                self.app.add_time_active(60)
-            elif event.num == 5 or event.delta < 0:  # Scroll down
-                self.app.add_time_active(-60)
-        
+        # Bind mouse wheel scroll events for time adjustment; a burst of
+        # events is previewed once per frame and applied once it stops
+        on_scroll = self.wheel.feed
+
         # Bind scroll events to the adjustment frame and its children
         adjust_frame.bind("<Button-4>", on_scroll)
         adjust_frame.bind("<Button-5>", on_scroll)
@@ -631,34 +704,45 @@ class ActiveScreen:
             )
             btn.pack(side="left", expand=True, padx=3)
 
-        # Update display
+        # Widgets behind each view model field; the first update sets them all
+        self._field_labels = {
+            "hours": self.timer_display.hours_label,
+            "minutes": self.timer_display.minutes_label,
+            "seconds": self.timer_display.seconds_label,
+            "duration": self.duration_label,
+            "end_time": self.status_label,
+            "action": self.action_display_label,
+        }
+        self.view_model.invalidate()
+
+        return main_container
+
+    def refresh(self) -> None:
+        """Show the current countdown and play/pause state"""
         self.update_display()
+        self.update_play_pause_btn(self.app.is_running)
 
     def update_display(self) -> None:
-        """Update all timer display elements"""
-        try:
-            h, m, s = seconds_to_hms_strings(self.app.remaining_seconds)
-            if self.timer_display and hasattr(self.timer_display, 'winfo_exists'):
-                self.timer_display.update_time(h, m, s)
-            if self.duration_label and self.duration_label.winfo_exists():
-                self.duration_label.configure(text=format_time_simple(self.app.remaining_seconds))
-            if self.status_label and self.status_label.winfo_exists():
-                self.status_label.configure(
-                    text=get_end_time(self.app.remaining_seconds)
-                )
-            # Update action display label if it exists
-            if hasattr(self, 'action_display_label') and self.action_display_label.winfo_exists():
-                action_texts = {
-                    "Shutdown": "SHUTTING DOWN",
-                    "Restart": "RESTARTING",
-                    "Sleep": "SLEEPING",
-                    "Lock": "LOCKING",
-                    "Log Out": "LOGGING OUT"
-                }
-                action_display_text = action_texts.get(self.app.selected_action, self.app.selected_action)
-                self.action_display_label.configure(text=action_display_text)
-        except:
-            pass  # Widgets don't exist anymore
+        """Update the timer display elements whose text changed"""
+        if self.frame is None:
+            return
+        remaining = self.app.remaining_seconds
+        if self.wheel.pending:
+            # Preview of a scroll that has not been applied yet
+            remaining = max(self.app.timer.min_duration, remaining + self.wheel.pending)
+        changed = self.view_model.update(remaining, self.app.selected_action)
+        for field, text in changed.items():
+            self._field_labels[field].configure(text=text)
+        self.display_updates += 1
+        self.configure_calls += len(changed)
+
+    def display_stats(self) -> dict:
+        """update_display calls, label configures and configures per call"""
+        return {
+            "updates": self.display_updates,
+            "configures": self.configure_calls,
+            "per_update": self.configure_calls / self.display_updates if self.display_updates else 0.0,
+        }
 
     def update_play_pause_btn(self, is_running: bool) -> None:
         """Update play/pause button state"""
@@ -0,0 +1,77 @@
+"""
+View models: display text for a screen, recomputed only when it changes
+"""
+import time
+from typing import Callable, Dict, Optional
+
+from src.utils.time_utils import format_end_time, format_time_simple, seconds_to_hms_strings
+
+ACTION_TEXTS = {
+    "Shutdown": "SHUTTING DOWN",
+    "Restart": "RESTARTING",
+    "Sleep": "SLEEPING",
+    "Lock": "LOCKING",
+    "Log Out": "LOGGING OUT"
+}
+
+# While counting down, now + remaining only jitters by the sub-second part
+# of the tick; the end time is recomputed when it moves further than this
+# (deadline adjusted, or time passing while paused)
+END_TIME_TOLERANCE = 1.5
+
+
+class ActiveViewModel:
+    """Text of every value on the active screen, with change detection
+
+    update() returns only the fields whose text differs from the last call.
+    Each input is memoized: the clock digits and duration are derived once
+    per distinct remaining second, the end time is formatted only when its
+    minute changes and the action text only when the action does.
+    """
+
+    FIELDS = ("hours", "minutes", "seconds", "duration", "end_time", "action")
+
+    def __init__(self, wall_clock: Callable[[], float] = time.time):
+        self._wall_clock = wall_clock
+        self.values: Dict[str, Optional[str]] = dict.fromkeys(self.FIELDS)
+        self._remaining: Optional[int] = None
+        self._action: Optional[str] = None
+        self._end: Optional[float] = None
+        self._end_minute: Optional[int] = None
+
+    def invalidate(self) -> None:
+        """Forget what is displayed so the next update returns every field"""
+        self.values = dict.fromkeys(self.FIELDS)
+        self._remaining = self._action = self._end = self._end_minute = None
+
+    def update(self, remaining: int, action: str) -> Dict[str, str]:
+        """Fields whose text changed, mapped to their new text"""
+        changed = {}
+
+        if remaining != self._remaining:
+            self._remaining = remaining
+            hours, minutes, seconds = seconds_to_hms_strings(remaining)
+            self._set(changed, "hours", hours)
+            self._set(changed, "minutes", minutes)
+            self._set(changed, "seconds", seconds)
+            self._set(changed, "duration", format_time_simple(remaining))
+
+        end = self._wall_clock() + remaining
+        if self._end is None or abs(end - self._end) > END_TIME_TOLERANCE:
+            self._end = end
+            minute = int(end // 60)
+            if minute != self._end_minute:
+                self._end_minute = minute
+                self._set(changed, "end_time", format_end_time(end))
+
+        if action != self._action:
+            self._action = action
+            self._set(changed, "action", ACTION_TEXTS.get(action, action))
+
+        return changed
+
+    def _set(self, changed: Dict[str, str], field: str, text: str) -> None:
+        """Record text for field if it differs from the displayed text"""
+        if self.values[field] != text:
+            self.values[field] = text
+            changed[field] = text
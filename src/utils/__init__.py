@@ -7,9 +7,27 @@ from src.utils.time_utils import (
     get_time_components,
     seconds_to_hms_strings,
     get_end_time,
+    format_end_time,
     is_valid_duration,
+    parse_duration,
 )
-from src.utils.system_actions import SystemActionExecutor, ScreenInhibitor
+
+# system_actions pulls in subprocess and platform; load it on first use so the
+# launcher's fast path (which only needs time_utils) stays cheap
+_LAZY = {
+    "SystemActionExecutor": "src.utils.system_actions",
+    "ScreenInhibitor": "src.utils.system_actions",
+    "Capabilities": "src.utils.capabilities",
+    "load_capabilities": "src.utils.capabilities",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        return getattr(importlib.import_module(_LAZY[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "format_time_display",
@@ -17,7 +35,11 @@ __all__ = [
     "get_time_components",
     "seconds_to_hms_strings",
     "get_end_time",
+    "format_end_time",
     "is_valid_duration",
+    "parse_duration",
     "SystemActionExecutor",
     "ScreenInhibitor",
+    "Capabilities",
+    "load_capabilities",
 ]
@@ -0,0 +1,149 @@
+"""
+Which system actions and screen inhibitors work on this machine
+
+Probed once per boot and login session, then read from a small JSON cache,
+so the app can tell the user before arming that an action will not run
+and the executor can go straight to the backend that works.
+"""
+import json
+import os
+import platform
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.utils.system_actions import ACTIONS, ActionError, ScreenInhibitor, default_backends
+
+CACHE_VERSION = 1
+BOOT_ID_FILE = Path("/proc/sys/kernel/random/boot_id")
+
+
+def boot_key() -> str:
+    """Identifies this boot and login session; the cache is kept while it matches"""
+    try:
+        boot = BOOT_ID_FILE.read_text().strip()
+    except OSError:
+        # No boot ID outside Linux: the boot time, to the nearest 10 s
+        boot = f"{round(time.time() - time.monotonic(), -1):.0f}"
+    session = os.environ.get("XDG_SESSION_ID", "")
+    return f"{platform.system()}:{boot}:{session}"
+
+
+class Capabilities:
+    """Outcome of a probe
+
+    backends maps each working action to the backend chosen for it,
+    commands holds the resolved argv of every command found, unsupported
+    maps each action that cannot work to the reasons, and inhibitors maps
+    the keep-screen-on programs found to their paths, preferred first.
+    """
+
+    def __init__(
+        self,
+        key: str = "",
+        backends: Optional[Dict[str, str]] = None,
+        commands: Optional[Dict[str, List[str]]] = None,
+        unsupported: Optional[Dict[str, str]] = None,
+        inhibitors: Optional[Dict[str, str]] = None
+    ):
+        self.key = key
+        self.backends = backends or {}
+        self.commands = commands or {}
+        self.unsupported = unsupported or {}
+        self.inhibitors = inhibitors or {}
+        self.cached = False  # True when read back instead of probed
+
+    @property
+    def inhibitor(self) -> Optional[str]:
+        """Keep-screen-on program that will be used, if any"""
+        return next(iter(self.inhibitors), None)
+
+    def supports(self, action: str) -> bool:
+        """False only for actions the probe found cannot work"""
+        return action not in self.unsupported
+
+    def to_state(self) -> dict:
+        """JSON-serialisable form for the cache"""
+        return {
+            "version": CACHE_VERSION, "key": self.key, "backends": self.backends,
+            "commands": self.commands, "unsupported": self.unsupported,
+            "inhibitors": self.inhibitors,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "Capabilities":
+        """Rebuild from to_state()"""
+        return cls(state["key"], state["backends"], state["commands"],
+                   state["unsupported"], state["inhibitors"])
+
+
+def probe(system: Optional[str] = None, backends: Optional[list] = None) -> Capabilities:
+    """Check every action against the backends, fastest first
+
+    Nothing is run: commands are resolved on PATH and logind is asked
+    whether each method would be allowed. An action gets the first backend
+    that passes; only when none does are the reasons kept in unsupported.
+    A power action logind refuses outright is also refused to commands
+    such as systemctl that ask logind themselves.
+    """
+    system = system or platform.system()
+    backends = default_backends(system) if backends is None else backends
+    capabilities = Capabilities()
+    for action in ACTIONS:
+        reasons = []
+        refusal = None  # logind's verdict, shared by commands that ask it
+        for backend in backends:
+            if not backend.supports(action):
+                continue
+            if refusal and getattr(backend, "uses_logind", lambda a: False)(action):
+                continue
+            try:
+                reason = backend.probe(action)
+            except ActionError as e:
+                refusal = reason = str(e)
+            if reason is None:
+                capabilities.backends[action] = backend.name
+                break
+            reasons.append(f"{backend.name}: {reason}")
+        if action not in capabilities.backends:
+            capabilities.unsupported[action] = refusal or "; ".join(reasons) or "no backend"
+        for backend in backends:
+            commands = getattr(backend, "commands", {})
+            if action in commands and os.path.isabs(commands[action][0]):
+                capabilities.commands[action] = list(commands[action])
+    for backend in backends:
+        if hasattr(backend, "close"):
+            backend.close()
+
+    for program in ScreenInhibitor.PROGRAMS.get(system, ()):
+        path = shutil.which(program)
+        if path:
+            capabilities.inhibitors[program] = path
+    return capabilities
+
+
+def load_capabilities(path: Path, key: Optional[str] = None, **probe_options) -> Capabilities:
+    """Cached capabilities for this boot, probing and saving them if needed"""
+    key = key or boot_key()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") == CACHE_VERSION and state.get("key") == key:
+            capabilities = Capabilities.from_state(state)
+            capabilities.cached = True
+            return capabilities
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass  # missing, stale or unreadable: probe again
+
+    capabilities = probe(**probe_options)
+    capabilities.key = key
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(capabilities.to_state(), f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not cache capabilities: {e}")
+    return capabilities
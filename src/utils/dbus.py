@@ -0,0 +1,303 @@
+"""
+Minimal D-Bus client for method calls on the system bus
+
+Speaks the wire protocol directly over the bus's Unix socket (EXTERNAL
+authentication, Hello, then method calls) so power actions need neither a
+helper process nor a D-Bus binding. Only basic argument types are handled:
+y, b, i, u, s, o and g.
+"""
+import os
+import socket
+import struct
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+SYSTEM_BUS_ADDRESS = "unix:path=/var/run/dbus/system_bus_socket"
+
+# Message types
+METHOD_CALL = 1
+METHOD_RETURN = 2
+ERROR = 3
+SIGNAL = 4
+
+# Header fields: code -> signature of the value
+PATH, INTERFACE, MEMBER, ERROR_NAME, REPLY_SERIAL, DESTINATION, SENDER, SIGNATURE = range(1, 9)
+FIELD_TYPES = {
+    PATH: "o", INTERFACE: "s", MEMBER: "s", ERROR_NAME: "s",
+    REPLY_SERIAL: "u", DESTINATION: "s", SENDER: "s", SIGNATURE: "g",
+}
+
+_ALIGN = {"y": 1, "b": 4, "i": 4, "u": 4, "s": 4, "o": 4, "g": 1}
+
+
+class DBusError(Exception):
+    """Error reply to a method call, or a broken connection"""
+
+    def __init__(self, name: str, message: str = ""):
+        super().__init__(f"{name}: {message}" if message else name)
+        self.name = name
+
+
+def system_bus_address() -> str:
+    """Address of the system bus, honouring DBUS_SYSTEM_BUS_ADDRESS"""
+    return os.environ.get("DBUS_SYSTEM_BUS_ADDRESS") or SYSTEM_BUS_ADDRESS
+
+
+def parse_address(address: str) -> str:
+    """Socket path for the first unix: entry of a bus address
+
+    Abstract sockets come back with a leading NUL, as socket.connect wants.
+    """
+    for entry in address.split(";"):
+        transport, _, params = entry.partition(":")
+        if transport != "unix":
+            continue
+        options = dict(p.split("=", 1) for p in params.split(",") if "=" in p)
+        if "path" in options:
+            return _unescape(options["path"])
+        if "abstract" in options:
+            return "\0" + _unescape(options["abstract"])
+    raise DBusError("org.freedesktop.DBus.Error.BadAddress", address)
+
+
+def _unescape(value: str) -> str:
+    """Undo %xx escaping in an address value"""
+    parts = value.split("%")
+    out = [parts[0]]
+    for part in parts[1:]:
+        out.append(bytes.fromhex(part[:2]).decode() + part[2:])
+    return "".join(out)
+
+
+class _Writer:
+    """Little-endian marshalling into a growing buffer"""
+
+    def __init__(self, buf: Optional[bytearray] = None):
+        self.buf = buf if buf is not None else bytearray()
+
+    def align(self, n: int) -> None:
+        self.buf.extend(b"\0" * (-len(self.buf) % n))
+
+    def put(self, code: str, value: Any) -> None:
+        self.align(_ALIGN[code])
+        if code == "y":
+            self.buf.append(value)
+        elif code in "bu":
+            self.buf += struct.pack("<I", int(value))
+        elif code == "i":
+            self.buf += struct.pack("<i", value)
+        elif code in "so":
+            data = value.encode()
+            self.buf += struct.pack("<I", len(data)) + data + b"\0"
+        elif code == "g":
+            data = value.encode()
+            self.buf.append(len(data))
+            self.buf += data + b"\0"
+        else:
+            raise ValueError(f"Unsupported D-Bus type {code!r}")
+
+
+class _Reader:
+    """Unmarshalling from a complete message"""
+
+    def __init__(self, data: bytes, endian: str, pos: int = 0):
+        self.data = data
+        self.endian = endian
+        self.pos = pos
+
+    def align(self, n: int) -> None:
+        self.pos += -self.pos % n
+
+    def get(self, code: str) -> Any:
+        if code == "v":
+            return self.get(self.get("g"))
+        if code not in _ALIGN:
+            raise ValueError(f"Unsupported D-Bus type {code!r}")
+        self.align(_ALIGN[code])
+        if code == "y":
+            value = self.data[self.pos]
+            self.pos += 1
+        elif code in "bui":
+            (value,) = struct.unpack_from(self.endian + ("i" if code == "i" else "I"),
+                                          self.data, self.pos)
+            self.pos += 4
+            if code == "b":
+                value = bool(value)
+        elif code in "so":
+            (length,) = struct.unpack_from(self.endian + "I", self.data, self.pos)
+            self.pos += 4
+            value = self.data[self.pos:self.pos + length].decode()
+            self.pos += length + 1
+        else:  # g
+            length = self.data[self.pos]
+            self.pos += 1
+            value = self.data[self.pos:self.pos + length].decode()
+            self.pos += length + 1
+        return value
+
+
+def encode_message(
+    msg_type: int,
+    serial: int,
+    fields: Dict[int, Any],
+    signature: str = "",
+    args: Sequence[Any] = (),
+    flags: int = 0
+) -> bytes:
+    """One complete message"""
+    body = _Writer()
+    for code, value in zip(signature, args):
+        body.put(code, value)
+    if signature:
+        fields = {**fields, SIGNATURE: signature}
+
+    header = _Writer(bytearray(struct.pack(
+        "<cBBBII", b"l", msg_type, flags, 1, len(body.buf), serial
+    )))
+    length_at = len(header.buf)
+    header.buf += b"\0\0\0\0"
+    header.align(8)
+    start = len(header.buf)
+    for code, value in sorted(fields.items()):
+        header.align(8)
+        header.put("y", code)
+        header.put("g", FIELD_TYPES[code])
+        header.put(FIELD_TYPES[code], value)
+    struct.pack_into("<I", header.buf, length_at, len(header.buf) - start)
+    header.align(8)
+    return bytes(header.buf + body.buf)
+
+
+def recv_message(sock: socket.socket, buffer: bytearray) -> Tuple[int, int, Dict[int, Any], List[Any]]:
+    """Read one message: (type, serial, header fields, body values)
+
+    buffer holds bytes received past the previous message and is updated.
+    Bodies with types this module does not handle come back empty.
+    """
+    def need(n: int) -> None:
+        while len(buffer) < n:
+            chunk = sock.recv(65536)
+            if not chunk:
+                raise DBusError("org.freedesktop.DBus.Error.Disconnected", "connection closed")
+            buffer.extend(chunk)
+
+    need(16)
+    endian = "<" if buffer[0:1] == b"l" else ">"
+    msg_type = buffer[1]
+    body_length, serial, fields_length = struct.unpack_from(endian + "III", buffer, 4)
+    header_length = 16 + fields_length + (-(16 + fields_length) % 8)
+    total = header_length + body_length
+    need(total)
+    data = bytes(buffer[:total])
+    del buffer[:total]
+
+    reader = _Reader(data, endian, 16)
+    fields: Dict[int, Any] = {}
+    while reader.pos < 16 + fields_length:
+        reader.align(8)
+        code = reader.get("y")
+        fields[code] = reader.get("v")
+
+    values: List[Any] = []
+    reader.pos = header_length
+    try:
+        for code in fields.get(SIGNATURE, ""):
+            values.append(reader.get(code))
+    except ValueError:
+        values = []
+    return msg_type, serial, fields, values
+
+
+class DBusConnection:
+    """Authenticated connection to a bus; blocking method calls"""
+
+    def __init__(self, address: Optional[str] = None, timeout: float = 5.0):
+        self.address = address or system_bus_address()
+        self.timeout = timeout
+        self.unique_name: Optional[str] = None
+        self._sock: Optional[socket.socket] = None
+        self._buffer = bytearray()
+        self._serial = 0
+
+    @property
+    def connected(self) -> bool:
+        """True while the socket is open"""
+        return self._sock is not None
+
+    def connect(self) -> "DBusConnection":
+        """Open the socket, authenticate and register with the bus"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(parse_address(self.address))
+            uid = str(os.getuid()).encode().hex().encode()
+            sock.sendall(b"\0AUTH EXTERNAL " + uid + b"\r\n")
+            reply = self._readline(sock)
+            if not reply.startswith(b"OK "):
+                raise DBusError("org.freedesktop.DBus.Error.AuthFailed", reply.decode(errors="replace"))
+            sock.sendall(b"BEGIN\r\n")
+        except BaseException:
+            sock.close()
+            raise
+        self._sock = sock
+        reply = self.call(
+            "org.freedesktop.DBus", "/org/freedesktop/DBus", "org.freedesktop.DBus", "Hello"
+        )
+        self.unique_name = reply[0] if reply else None
+        return self
+
+    def _readline(self, sock: socket.socket) -> bytes:
+        """One CRLF-terminated line of the authentication exchange"""
+        while b"\r\n" not in self._buffer:
+            chunk = sock.recv(4096)
+            if not chunk:
+                raise DBusError("org.freedesktop.DBus.Error.AuthFailed", "connection closed")
+            self._buffer.extend(chunk)
+        line, _, rest = bytes(self._buffer).partition(b"\r\n")
+        self._buffer[:] = rest
+        return line
+
+    def call(
+        self,
+        destination: str,
+        path: str,
+        interface: str,
+        member: str,
+        signature: str = "",
+        args: Sequence[Any] = ()
+    ) -> List[Any]:
+        """Call a method and wait for its reply; raises DBusError on error"""
+        if self._sock is None:
+            raise DBusError("org.freedesktop.DBus.Error.Disconnected", "not connected")
+        self._serial += 1
+        serial = self._serial
+        fields = {PATH: path, INTERFACE: interface, MEMBER: member, DESTINATION: destination}
+        try:
+            self._sock.sendall(encode_message(METHOD_CALL, serial, fields, signature, args))
+            while True:
+                msg_type, _, reply_fields, values = recv_message(self._sock, self._buffer)
+                if reply_fields.get(REPLY_SERIAL) == serial:
+                    break  # anything else is a signal such as NameAcquired
+        except OSError as e:
+            self.close()
+            raise DBusError("org.freedesktop.DBus.Error.Disconnected", str(e)) from e
+        except BaseException:
+            # The peer hung up or the stream is out of step; reconnect next time
+            self.close()
+            raise
+        if msg_type == ERROR:
+            raise DBusError(reply_fields.get(ERROR_NAME, "org.freedesktop.DBus.Error.Failed"),
+                            values[0] if values else "")
+        return values
+
+    def close(self) -> None:
+        """Drop the connection"""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        self._buffer.clear()
+
+    def __enter__(self) -> "DBusConnection":
+        return self if self.connected else self.connect()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,109 +1,363 @@
 """
 System action execution module for cross-platform support
+
+Each action is tried on a list of backends in order until one succeeds:
+on Linux an in-process D-Bus call to systemd-logind, then the equivalent
+command run directly (no shell) with its exit status checked.
 """
 import os
 import platform
+import shutil
 import subprocess
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Sequence
+
+from src.utils.dbus import DBusConnection, DBusError
+
+ACTIONS = ("Shutdown", "Restart", "Sleep", "Lock", "Log Out")
+
+
+class ActionError(RuntimeError):
+    """A backend could not carry out an action"""
+
+
+def platform_commands(system: Optional[str] = None) -> Dict[str, List[str]]:
+    """argv for every action on this platform"""
+    system = system or platform.system()
+    if system == "Windows":
+        return {
+            "Shutdown": ["shutdown", "/s", "/t", "0"],
+            "Restart": ["shutdown", "/r", "/t", "0"],
+            "Sleep": ["rundll32.exe", "powrprof.dll,SetSuspendState", "0,1,0"],
+            "Lock": ["rundll32.exe", "user32.dll,LockWorkStation"],
+            "Log Out": ["shutdown", "/l"],
+        }
+    if system == "Darwin":
+        return {
+            "Shutdown": ["osascript", "-e", 'tell app "System Events" to shut down'],
+            "Restart": ["osascript", "-e", 'tell app "System Events" to restart'],
+            "Sleep": ["pmset", "sleepnow"],
+            "Lock": ["/System/Library/CoreServices/Menu Extras/User.menu/Contents/Resources/CGSession",
+                     "-suspend"],
+            "Log Out": ["osascript", "-e", 'tell app "System Events" to log out'],
+        }
+    # Same targets as LogindBackend: this session (the caller's if unset)
+    # and every session of this user
+    session = os.environ.get("XDG_SESSION_ID")
+    return {
+        "Shutdown": ["systemctl", "poweroff"],
+        "Restart": ["systemctl", "reboot"],
+        "Sleep": ["systemctl", "suspend"],
+        "Lock": ["loginctl", "lock-session"] + ([session] if session else []),
+        "Log Out": ["loginctl", "terminate-user", str(os.getuid())],
+    }
+
+
+class CommandBackend:
+    """Runs an action's argv with subprocess and checks the exit status"""
+
+    name = "subprocess"
+    # Commands that ask logind themselves, so its refusal holds for them too
+    LOGIND_COMMANDS = ("systemctl", "loginctl")
+
+    def __init__(self, commands: Dict[str, Sequence[str]], timeout: float = 30.0):
+        self.commands = commands
+        self.timeout = timeout
+
+    def supports(self, action: str) -> bool:
+        """True if there is a command for action"""
+        return action in self.commands
+
+    def uses_logind(self, action: str) -> bool:
+        """True if action's command is carried out by systemd-logind"""
+        return os.path.basename(self.commands[action][0]) in self.LOGIND_COMMANDS
+
+    def probe(self, action: str) -> Optional[str]:
+        """Resolve the command's executable; None if it can run, else why not
+
+        The resolved absolute path replaces the bare name, so later runs
+        skip the PATH search.
+        """
+        argv = list(self.commands[action])
+        path = shutil.which(argv[0])
+        if path is None:
+            return f"{argv[0]} not found"
+        self.commands = {**self.commands, action: [path] + argv[1:]}
+        return None
+
+    def run(self, action: str) -> None:
+        """Run the command; raises ActionError unless it exits with 0"""
+        argv = list(self.commands[action])
+        try:
+            result = subprocess.run(
+                argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE, timeout=self.timeout
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise ActionError(f"{argv[0]}: {e}") from e
+        if result.returncode != 0:
+            detail = result.stderr.decode(errors="replace").strip()
+            raise ActionError(f"{argv[0]} exited with {result.returncode}"
+                              + (f": {detail}" if detail else ""))
+
+
+class SpawnBackend(CommandBackend):
+    """Runs an action's argv with os.posix_spawnp and waits for its status
+
+    No pipes and no fork of the interpreter; the child's output goes to
+    /dev/null, so failures are reported by exit status only.
+    """
+
+    name = "posix_spawn"
+
+    def run(self, action: str) -> None:
+        """Spawn the command and wait; raises ActionError on failure"""
+        argv = list(self.commands[action])
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ]
+        try:
+            pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=file_actions)
+            _, status = os.waitpid(pid, 0)
+        except OSError as e:
+            raise ActionError(f"{argv[0]}: {e}") from e
+        if os.WIFSIGNALED(status):
+            raise ActionError(f"{argv[0]} killed by signal {os.WTERMSIG(status)}")
+        if os.WEXITSTATUS(status) != 0:
+            raise ActionError(f"{argv[0]} exited with {os.WEXITSTATUS(status)}")
+
+
+class LogindBackend:
+    """Power and session actions as D-Bus calls to systemd-logind
+
+    The bus connection is opened on first use and kept, so a firing timer
+    costs one method call. Pass a bus address to talk to another bus, for
+    example a stand-in in tests.
+    """
+
+    name = "logind"
+    DESTINATION = "org.freedesktop.login1"
+    PATH = "/org/freedesktop/login1"
+    INTERFACE = "org.freedesktop.login1.Manager"
+    # Manager methods that say whether a power method would be allowed
+    CAN_METHODS = {"Shutdown": "CanPowerOff", "Restart": "CanReboot", "Sleep": "CanSuspend"}
+    # Lookups, with the same arguments, that fail if there is nothing to act on
+    CHECK_METHODS = {"Lock": "GetSession", "Log Out": "GetUser"}
+
+    def __init__(self, address: Optional[str] = None, session_id: Optional[str] = None,
+                 timeout: float = 5.0):
+        self.bus = DBusConnection(address, timeout)
+        # "auto" lets logind pick the caller's session
+        session = session_id or os.environ.get("XDG_SESSION_ID") or "auto"
+        interactive = False  # fail instead of waiting on a polkit prompt
+        self.methods = {
+            "Shutdown": ("PowerOff", "b", (interactive,)),
+            "Restart": ("Reboot", "b", (interactive,)),
+            "Sleep": ("Suspend", "b", (interactive,)),
+            "Lock": ("LockSession", "s", (session,)),
+            # Like `loginctl terminate-user`, which the command fallback runs
+            "Log Out": ("TerminateUser", "u", (os.getuid(),)),
+        }
+
+    def supports(self, action: str) -> bool:
+        """True for the actions logind implements"""
+        return action in self.methods
+
+    def probe(self, action: str) -> Optional[str]:
+        """Ask logind whether action would work; None if it would, else why not
+
+        Raises ActionError when logind refuses a power action outright (the
+        machine cannot do it or the user may not), which also rules out
+        commands that go through logind. "challenge" (a polkit password
+        prompt) is only a reason to skip logind, since the non-interactive
+        call cannot answer it but a command run from the desktop may.
+        """
+        try:
+            self.connect()
+        except ActionError as e:
+            return str(e)
+        try:
+            if action not in self.CAN_METHODS:
+                _, signature, args = self.methods[action]
+                self.bus.call(self.DESTINATION, self.PATH, self.INTERFACE,
+                              self.CHECK_METHODS[action], signature, args)
+                return None
+            reply = self.bus.call(self.DESTINATION, self.PATH, self.INTERFACE,
+                                  self.CAN_METHODS[action])
+        except DBusError as e:
+            return str(e)
+        answer = reply[0] if reply else ""
+        if answer == "yes":
+            return None
+        if answer == "challenge":
+            return "needs authentication"
+        if answer == "na":
+            raise ActionError("not supported by this machine")
+        raise ActionError("not permitted for this user")
+
+    def connect(self) -> None:
+        """Open the bus connection ahead of the first action"""
+        if not self.bus.connected:
+            try:
+                self.bus.connect()
+            except (OSError, DBusError) as e:
+                raise ActionError(f"system bus unavailable: {e}") from e
+
+    def run(self, action: str) -> None:
+        """Call the logind method; raises ActionError if it fails"""
+        method, signature, args = self.methods[action]
+        self.connect()
+        try:
+            self.bus.call(self.DESTINATION, self.PATH, self.INTERFACE, method, signature, args)
+        except DBusError as e:
+            raise ActionError(str(e)) from e
+
+    def close(self) -> None:
+        """Drop the bus connection"""
+        self.bus.close()
+
+
+def default_backends(
+    system: Optional[str] = None,
+    commands: Optional[Dict[str, Sequence[str]]] = None
+) -> list:
+    """Backends for this platform, fastest first (see bench_dispatch)"""
+    system = system or platform.system()
+    commands = platform_commands(system) if commands is None else commands
+    if system == "Linux":
+        return [LogindBackend(), SpawnBackend(commands)]
+    if hasattr(os, "posix_spawnp"):
+        return [SpawnBackend(commands)]
+    return [CommandBackend(commands)]
 
 
 class SystemActionExecutor:
     """Execute system actions (shutdown, restart, sleep, etc.)"""
 
+    _default: Optional["SystemActionExecutor"] = None
+
+    def __init__(self, backends: Optional[list] = None,
+                 preferred: Optional[Dict[str, str]] = None):
+        self.backends = default_backends() if backends is None else backends
+        # Backend name to try first for each action, from a capability probe
+        self.preferred = preferred or {}
+
+    @classmethod
+    def default(cls) -> "SystemActionExecutor":
+        """Shared executor with the platform's backends"""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @classmethod
+    def from_capabilities(cls, capabilities, system: Optional[str] = None) -> "SystemActionExecutor":
+        """Executor that starts with the probed backend and resolved commands"""
+        commands = {**platform_commands(system), **capabilities.commands}
+        return cls(default_backends(system, commands), capabilities.backends)
+
+    @classmethod
+    def configure(cls, executor: "SystemActionExecutor") -> None:
+        """Make executor the shared one, closing the previous one's connections"""
+        previous, cls._default = cls._default, executor
+        if previous is not None and previous is not executor:
+            previous.close()
+
+    def prepare(self) -> None:
+        """Connect the preferred backends now, so a firing costs one call"""
+        names = set(self.preferred.values())
+        for backend in self.backends:
+            if backend.name in names and hasattr(backend, "connect"):
+                try:
+                    backend.connect()
+                except ActionError as e:
+                    print(f"Could not prepare {backend.name}: {e}")
+
+    def close(self) -> None:
+        """Close backend connections"""
+        for backend in self.backends:
+            if hasattr(backend, "close"):
+                backend.close()
+
+    def run(self, action: str) -> str:
+        """Run action on the first backend that succeeds; returns its name
+
+        Raises ValueError for an unknown action and ActionError, listing
+        every backend's failure, if none succeeded.
+        """
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+        errors = []
+        preferred = self.preferred.get(action)
+        backends = sorted(self.backends, key=lambda b: b.name != preferred)
+        for backend in backends:
+            if not backend.supports(action):
+                continue
+            try:
+                backend.run(action)
+                return backend.name
+            except ActionError as e:
+                errors.append(f"{backend.name}: {e}")
+        raise ActionError(f"{action} failed: " + ("; ".join(errors) or "no backend"))
+
+    @staticmethod
+    def execute(action: str) -> None:
+        """Execute action by name"""
+        SystemActionExecutor.default().run(action)
+
+    @staticmethod
+    def _execute_reporting(action: str) -> None:
+        """Execute action, printing instead of raising on failure"""
+        try:
+            SystemActionExecutor.execute(action)
+        except ActionError as e:
+            print(f"Error executing {action.lower()}: {e}")
+
     @staticmethod
     def shutdown() -> None:
         """Shutdown the system"""
-        system = platform.system()
-        try:
-            if system == "Windows":
-                os.system("shutdown /s /t 0")
-            elif system == "Darwin":  # macOS
-                os.system("osascript -e 'tell app \"System Events\" to shut down'")
-            else:  # Linux
-                os.system("systemctl poweroff")
-        except Exception as e:
-            print(f"Error executing shutdown: {e}")
+        SystemActionExecutor._execute_reporting("Shutdown")
 
     @staticmethod
     def restart() -> None:
         """Restart the system"""
-        system = platform.system()
-        try:
-            if system == "Windows":
-                os.system("shutdown /r /t 0")
-            elif system == "Darwin":
-                os.system("osascript -e 'tell app \"System Events\" to restart'")
-            else:
-                os.system("systemctl reboot")
-        except Exception as e:
-            print(f"Error executing restart: {e}")
+        SystemActionExecutor._execute_reporting("Restart")
 
     @staticmethod
     def sleep() -> None:
         """Put system to sleep"""
-        system = platform.system()
-        try:
-            if system == "Windows":
-                os.system("rundll32.exe powrprof.dll,SetSuspendState 0,1,0")
-            elif system == "Darwin":
-                os.system("pmset sleepnow")
-            else:
-                os.system("systemctl suspend")
-        except Exception as e:
-            print(f"Error executing sleep: {e}")
+        SystemActionExecutor._execute_reporting("Sleep")
 
     @staticmethod
     def lock() -> None:
         """Lock the screen"""
-        system = platform.system()
-        try:
-            if system == "Windows":
-                os.system("rundll32.exe user32.dll,LockWorkStation")
-            elif system == "Darwin":
-                os.system("/System/Library/CoreServices/Menu\\ Extras/User.menu/Contents/Resources/CGSession -suspend")
-            else:
-                os.system("loginctl lock-session")
-        except Exception as e:
-            print(f"Error executing lock: {e}")
+        SystemActionExecutor._execute_reporting("Lock")
 
     @staticmethod
     def logout() -> None:
         """Log out current user"""
-        system = platform.system()
-        try:
-            if system == "Windows":
-                os.system("shutdown /l")
-            elif system == "Darwin":
-                os.system("osascript -e 'tell app \"System Events\" to log out'")
-            else:
-                os.system("loginctl terminate-user $USER")
-        except Exception as e:
-            print(f"Error executing logout: {e}")
-
-    @staticmethod
-    def execute(action: str) -> None:
-        """Execute action by name"""
-        actions = {
-            "Shutdown": SystemActionExecutor.shutdown,
-            "Restart": SystemActionExecutor.restart,
-            "Sleep": SystemActionExecutor.sleep,
-            "Lock": SystemActionExecutor.lock,
-            "Log Out": SystemActionExecutor.logout,
-        }
-        
-        if action in actions:
-            actions[action]()
-        else:
-            raise ValueError(f"Unknown action: {action}")
+        SystemActionExecutor._execute_reporting("Log Out")
 
 
 class ScreenInhibitor:
     """Prevent screen from turning off or locking"""
     
-    def __init__(self):
+    # Helper programs per platform, preferred first; Windows calls the API
+    PROGRAMS = {"Linux": ("systemd-inhibit", "xdg-screensaver"), "Darwin": ("caffeinate",)}
+
+    def __init__(self, paths: Optional[Dict[str, str]] = None):
         self.system = platform.system()
         self.process = None
         self.is_inhibited = False
+        # Inhibitor programs found by the capability probe; until one has
+        # run they are looked up on PATH in-process
+        self.paths = paths
+
+    def find(self, program: str) -> Optional[str]:
+        """Absolute path of an inhibitor program, or None if it is missing"""
+        if self.paths is not None:
+            return self.paths.get(program)
+        return shutil.which(program)
     
     def inhibit(self) -> bool:
         """Prevent screen from turning off"""
@@ -144,18 +398,12 @@ class ScreenInhibitor:
         """Linux-specific screen inhibit using systemd-inhibit or xdg-screensaver"""
         # Try systemd-inhibit first (modern approach)
         try:
-            # Check if systemd-inhibit is available
-            result = subprocess.run(
-                ["which", "systemd-inhibit"],
-                capture_output=True,
-                timeout=2
-            )
-            
-            if result.returncode == 0:
+            systemd_inhibit = self.find("systemd-inhibit")
+            if systemd_inhibit:
                 # Use systemd-inhibit to prevent idle/sleep
                 self.process = subprocess.Popen(
                     [
-                        "systemd-inhibit",
+                        systemd_inhibit,
                         "--what=idle:sleep",
                         "--who=ShutEye",
                         "--why=Timer is active",
@@ -171,9 +419,12 @@ class ScreenInhibitor:
             pass
         
         # Fallback to xdg-screensaver
+        xdg_screensaver = self.find("xdg-screensaver")
+        if not xdg_screensaver:
+            return False
         try:
             subprocess.run(
-                ["xdg-screensaver", "suspend", str(os.getpid())],
+                [xdg_screensaver, "suspend", str(os.getpid())],
                 check=True,
                 timeout=2
             )
@@ -198,9 +449,12 @@ class ScreenInhibitor:
             self.process = None
         
         # Also try to resume xdg-screensaver
+        xdg_screensaver = self.find("xdg-screensaver")
+        if not xdg_screensaver:
+            return
         try:
             subprocess.run(
-                ["xdg-screensaver", "resume", str(os.getpid())],
+                [xdg_screensaver, "resume", str(os.getpid())],
                 timeout=2
             )
         except Exception:
@@ -210,7 +464,7 @@ class ScreenInhibitor:
         """macOS-specific screen inhibit using caffeinate"""
         try:
             self.process = subprocess.Popen(
-                ["caffeinate", "-d"],  # -d prevents display from sleeping
+                [self.find("caffeinate") or "caffeinate", "-d"],  # -d prevents display from sleeping
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
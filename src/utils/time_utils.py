@@ -1,8 +1,12 @@
 """
 Utility functions for time formatting and manipulation
 """
+import re
 from datetime import datetime, timedelta
 
+_DURATION_PART = re.compile(r"(\d+)\s*([hms])", re.IGNORECASE)
+_DURATION_UNITS = {"h": 3600, "m": 60, "s": 1}
+
 
 def format_time_display(seconds: int) -> str:
     """Format time for large display (HH:MM:SS)"""
@@ -44,6 +48,22 @@ def get_end_time(remaining_seconds: int) -> str:
     return end_time.strftime("%I:%M %p")
 
 
+def format_end_time(timestamp: float) -> str:
+    """Format a wall-clock timestamp the way get_end_time does"""
+    return datetime.fromtimestamp(timestamp).strftime("%I:%M %p")
+
+
+def parse_duration(text: str) -> int:
+    """Parse "90s", "30m", "1h30m" or a bare number of minutes into seconds"""
+    text = text.strip()
+    if text.isdigit():
+        return int(text) * 60
+    parts = _DURATION_PART.findall(text)
+    if not parts or _DURATION_PART.sub("", text).strip():
+        raise ValueError(f"Invalid duration: {text!r}")
+    return sum(int(value) * _DURATION_UNITS[unit.lower()] for value, unit in parts)
+
+
 def is_valid_duration(seconds: int, min_val: int = 60, max_val: int = 86400) -> bool:
     """Check if duration is within valid range"""
     return min_val <= seconds <= max_val